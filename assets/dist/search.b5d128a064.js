@@ -0,0 +1,24 @@
+(function(){const input=document.getElementById('search-input');const results=document.getElementById('results-container');if(!input||!results)return;const base=results.dataset.indexUrl||'/assets/search/';const siteBase=results.dataset.baseUrl||'';const limit=parseInt(results.dataset.limit||'20',10);const shardCache=new Map();let manifestPromise=null;function loadManifest(){if(!manifestPromise){manifestPromise=fetch(base + 'manifest.json').then((r)=>r.json()).then((m)=>{m.stopwordSet=new Set(m.stopwords);m.shardSet=new Set(m.shards);return m;});}
+return manifestPromise;}
+function loadShard(m,key){if(!m.shardSet.has(key))return Promise.resolve({});if(!shardCache.has(key)){shardCache.set(key,fetch(base + 'shards/' + key + '.json').then((r)=>r.json()));}
+return shardCache.get(key);}
+function stem(m,token){for(const[suffix,replacement]of m.suffixes){if(token.endsWith(suffix)){const stemmed=token.slice(0,token.length - suffix.length);return stemmed.length + replacement.length>=m.min_stem?stemmed + replacement:token;}}
+return token;}
+function queryTerms(m,text){const folded=text.toLowerCase().normalize('NFKD').replace(/[\u0300-\u036f]/g,'');return(folded.match(/[a-z0-9]+/g)||[])
+.filter((tok)=>!m.stopwordSet.has(tok))
+.map((tok)=>({raw:tok,stem:stem(m,tok)}))
+.filter((t)=>t.stem.length>=m.shard_prefix);}
+async function search(text){const m=await loadManifest();const terms=queryTerms(m,text);if(!terms.length)return[];const scores=new Map();const matched=new Map();for(const term of terms){const shard=await loadShard(m,term.stem.slice(0,m.shard_prefix));const hits=new Set();for(const[key,postings]of Object.entries(shard)){if(!key.startsWith(term.stem)&&!key.startsWith(term.raw))continue;const idf=Math.log(1 + m.doc_count /(postings.length / 2));const weight=key===term.stem?1:0.5;for(let i=0;i<postings.length;i +=2){const doc=postings[i];scores.set(doc,(scores.get(doc)||0)+ postings[i + 1]*idf*weight);hits.add(doc);}}
+hits.forEach((doc)=>matched.set(doc,(matched.get(doc)||0)+ 1));}
+return[...scores.entries()]
+.filter(([doc])=>matched.get(doc)===terms.length)
+.sort((a,b)=>b[1]- a[1])
+.slice(0,limit)
+.map(([doc])=>m.docs[doc]);}
+function escapeHtml(value){const el=document.createElement('span');el.textContent=value;return el.innerHTML;}
+function render(docs){if(!docs.length){results.innerHTML='<li>No results</li>';return;}
+results.innerHTML=docs
+.map(([title,url,date])=>`<li><a href="${escapeHtml(siteBase + url)}">${escapeHtml(title)}</a><span> — ${date}</span></li>`)
+.join('');}
+let timer=null;let latest=0;input.addEventListener('input',()=>{clearTimeout(timer);timer=setTimeout(()=>{const value=input.value.trim();const ticket=++latest;if(!value){results.innerHTML='';return;}
+search(value).then((docs)=>{if(ticket===latest)render(docs);});},120);});})();
@@ -0,0 +1 @@
+(function(){document.querySelectorAll('.video-facade[data-embed-url]').forEach((facade)=>{facade.addEventListener('click',(event)=>{event.preventDefault();const iframe=document.createElement('iframe');iframe.src=facade.dataset.embedUrl;iframe.title=facade.getAttribute('aria-label')||'YouTube video';iframe.allow='accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share';iframe.allowFullscreen=true;facade.replaceWith(iframe);iframe.focus();});});document.querySelectorAll('[data-video-more]').forEach((button)=>{const section=button.closest('.video-section');button.addEventListener('click',()=>{const hidden=section.querySelectorAll('[data-video-page][hidden]');if(hidden.length)hidden[0].hidden=false;if(hidden.length<=1)button.closest('.video-more').hidden=true;});});})();
@@ -0,0 +1,238 @@
+"""Time the blog scripts' hot paths against synthetic archives of growing size.
+
+Micro-benchmarks cover the pure helpers. Per-archive benchmarks cover the
+title lookup with a cold and a warm front-matter index, parsing every post's
+front matter, and the end-to-end ``main()`` of generate_post.py and
+post_to_social.py (dry run with placeholder credentials) run inside the
+synthetic site. Corpora are kept under ``.cache/bench-corpus`` between runs.
+
+Results are JSON; save one run as a baseline and compare later runs with it:
+
+    python benchmarks/bench_archive.py --sizes 1000 10000 --save-baseline baseline.json
+    python benchmarks/bench_archive.py --sizes 1000 10000 --baseline baseline.json
+"""
+from __future__ import annotations
+
+import argparse
+from contextlib import chdir, contextmanager, redirect_stdout
+from datetime import datetime, timezone
+import io
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, Iterator
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.corpus import ensure_corpus  # noqa: E402
+from scripts import generate_post, post_to_social  # noqa: E402
+from scripts.generate_post import (  # noqa: E402
+    build_post,
+    build_structured_body,
+    load_topic_catalog,
+    post_already_contains_title,
+    slugify,
+)
+from scripts.post_index import INDEX_PATH, POSTS_DIR, PostIndex  # noqa: E402
+from scripts.post_to_social import excerpt_from_body, parse_front_matter  # noqa: E402
+
+SIZES = [1_000, 10_000, 100_000]
+CORPUS_ROOT = REPO_ROOT / ".cache" / "bench-corpus"
+THRESHOLD = 0.2
+# Far enough in the future that the generated post never clashes with the corpus.
+GENERATE_DATE = "2099-01-05"
+PLACEHOLDER_CREDENTIALS = {
+    "LINKEDIN_ACCESS_TOKEN": "bench",
+    "LINKEDIN_PERSON_URN": "urn:li:person:bench",
+    "INSTAGRAM_ACCESS_TOKEN": "bench",
+    "INSTAGRAM_ACCOUNT_ID": "bench",
+    "MEDIUM_TOKEN": "bench",
+    "MEDIUM_USER_ID": "bench",
+}
+
+
+def measure(fn: Callable[[], object], repeat: int, number: int = 1, setup: Callable[[], object] | None = None) -> dict:
+    """Time ``number`` calls of ``fn`` ``repeat`` times; report per-call seconds."""
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return {"best_s": min(samples), "median_s": statistics.median(samples), "repeat": repeat, "number": number}
+
+
+@contextmanager
+def script_context(argv: list[str], env: dict[str, str] | None = None) -> Iterator[None]:
+    """Run a script's ``main()`` with ``argv``, extra environment and silenced stdout."""
+    saved_argv, saved_env = sys.argv, dict(os.environ)
+    sys.argv = argv
+    os.environ.update(env or {})
+    try:
+        with redirect_stdout(io.StringIO()):
+            yield
+    finally:
+        sys.argv = saved_argv
+        os.environ.clear()
+        os.environ.update(saved_env)
+
+
+def sample_post_args() -> dict:
+    return {
+        "title": "Childhood Cancer Awareness: Early Signs Every Parent Should Know",
+        "excerpt": "Learn the early warning signs of childhood cancer.",
+        "category": "Awareness",
+        "tags": ["childhood cancer", "awareness", "ghana"],
+        "image_url": "https://example.com/image.jpg",
+        "image_alt": "A parent holding a child's hand",
+        "permalink_slug": "childhood-cancer-early-signs",
+        "seo_title": "Childhood Cancer Early Signs",
+        "seo_description": "Early warning signs of childhood cancer every parent should know.",
+        "body": build_structured_body(**load_topic_catalog()["bodies"]["awareness"]),
+        "publish_date": "2026-02-16",
+    }
+
+
+def run_micro(repeat: int) -> dict[str, dict]:
+    post_args = sample_post_args()
+    spec = load_topic_catalog()["bodies"]["awareness"]
+    text = build_post(**post_args)
+    body = post_args["body"]
+    return {
+        "slugify": measure(lambda: slugify(post_args["title"]), repeat, 10_000),
+        "build_post": measure(lambda: build_post(**post_args), repeat, 5_000),
+        "build_structured_body": measure(lambda: build_structured_body(**spec), repeat, 5_000),
+        "parse_front_matter": measure(lambda: parse_front_matter(text), repeat, 1_000),
+        "excerpt_from_body": measure(lambda: excerpt_from_body(body), repeat, 1_000),
+    }
+
+
+def run_archive(site_root: Path, repeat: int) -> dict[str, dict]:
+    """Benchmarks that scale with the archive; must run with ``site_root`` as the cwd."""
+    results = {}
+    with chdir(site_root):
+        post_paths = sorted(POSTS_DIR.glob("*.md"))
+
+        def drop_index() -> None:
+            INDEX_PATH.unlink(missing_ok=True)
+
+        def parse_archive() -> None:
+            for path in post_paths:
+                parse_front_matter(path.read_text(encoding="utf-8"))
+
+        results["post_already_contains_title.cold"] = measure(
+            lambda: post_already_contains_title("No Such Title"), repeat, setup=drop_index
+        )
+        PostIndex.load(POSTS_DIR).save()
+        results["post_already_contains_title.warm"] = measure(lambda: post_already_contains_title("No Such Title"), repeat)
+        results["parse_front_matter.archive"] = measure(parse_archive, repeat)
+
+        def drop_generated() -> None:
+            for path in POSTS_DIR.glob(f"{GENERATE_DATE}-*.md"):
+                path.unlink()
+
+        def generate() -> None:
+            with script_context(["generate_post.py", "--date", GENERATE_DATE, "--week-index", "1"]):
+                generate_post.main()
+
+        results["generate_post.main"] = measure(generate, repeat, setup=drop_generated)
+        drop_generated()
+
+        ledger = Path(".cache/bench-ledger.jsonl")
+        argv = ["post_to_social.py", "--post", post_paths[0].as_posix(), "--dry-run", "--ledger", ledger.as_posix()]
+
+        def publish() -> None:
+            with script_context(argv, PLACEHOLDER_CREDENTIALS):
+                post_to_social.main()
+
+        results["post_to_social.main"] = measure(publish, repeat)
+        ledger.unlink(missing_ok=True)
+    return results
+
+
+def run_suite(sizes: list[int], repeat: int, corpus_root: Path = CORPUS_ROOT) -> dict:
+    results = run_micro(repeat)
+    for size in sizes:
+        site_root = ensure_corpus(corpus_root, size)
+        for name, result in run_archive(site_root, repeat).items():
+            results[f"{size}/{name}"] = result
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sizes": sizes,
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD) -> list[dict]:
+    """Compare best-of-N timings with a baseline; a ratio above ``1 + threshold`` is a regression."""
+    rows = []
+    for name, result in current["results"].items():
+        old = baseline.get("results", {}).get(name)
+        if not old or not old["best_s"]:
+            continue
+        ratio = result["best_s"] / old["best_s"]
+        rows.append(
+            {
+                "name": name,
+                "baseline_s": old["best_s"],
+                "current_s": result["best_s"],
+                "ratio": round(ratio, 3),
+                "regressed": ratio > 1 + threshold,
+            }
+        )
+    return rows
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the blog scripts against synthetic archives.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="Archive sizes in posts (default: 1k 10k 100k).")
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per benchmark; the best is compared.")
+    parser.add_argument("--corpus-dir", type=Path, default=CORPUS_ROOT, help="Where synthetic archives are kept between runs.")
+    parser.add_argument("--save-baseline", type=Path, help="Write this run's results as JSON.")
+    parser.add_argument("--baseline", type=Path, help="Compare with a saved run; exit 1 on regressions.")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Allowed slowdown before a regression (0.2 = 20%%).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    current = run_suite(args.sizes, max(1, args.repeat), args.corpus_dir)
+
+    print(f"{'benchmark':<48} {'best':>10} {'median':>10}")
+    for name, result in current["results"].items():
+        print(f"{name:<48} {format_seconds(result['best_s']):>10} {format_seconds(result['median_s']):>10}")
+    if args.save_baseline:
+        args.save_baseline.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved baseline: {args.save_baseline}")
+
+    if not args.baseline:
+        return 0
+    rows = compare(current, json.loads(args.baseline.read_text(encoding="utf-8")), args.threshold)
+    regressions = [row for row in rows if row["regressed"]]
+    print(f"\nCompared with {args.baseline}: {len(rows)} benchmarks, {len(regressions)} regressed")
+    for row in regressions:
+        print(
+            f"  {row['name']}: {format_seconds(row['baseline_s'])} -> {format_seconds(row['current_s'])} "
+            f"({row['ratio']:.2f}x)"
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
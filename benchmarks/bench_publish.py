@@ -0,0 +1,161 @@
+"""Load-test batch publishing against local API stand-ins.
+
+Starts one scripts/social_stand_in.py server per channel (each channel has its
+own host in production), points post_to_social.py at them and pushes a
+synthetic batch through ``publish_pipeline``. Reports posts/second, latency
+percentiles per channel and how often 429/5xx responses forced retries.
+
+    python benchmarks/bench_publish.py --posts 200 --latency 0.05 --throttle-rate 0.05
+    python benchmarks/bench_publish.py --posts 50 --rate linkedin=10/s --json publish.json
+"""
+from __future__ import annotations
+
+import argparse
+from contextlib import redirect_stdout
+import io
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import write_synthetic_posts  # noqa: E402
+from scripts import post_to_social  # noqa: E402
+from scripts.post_index import PostIndex  # noqa: E402
+from scripts.post_to_social import CHANNELS, TokenBucket, parse_rate, prepare_post, publish_pipeline  # noqa: E402
+from scripts.publish_ledger import PublishLedger  # noqa: E402
+from scripts.social_stand_in import start_stand_in  # noqa: E402
+
+CREDENTIALS = {
+    "LINKEDIN_ACCESS_TOKEN": "load-test",
+    "LINKEDIN_PERSON_URN": "urn:li:person:load-test",
+    "INSTAGRAM_ACCESS_TOKEN": "load-test",
+    "INSTAGRAM_ACCOUNT_ID": "load-test",
+    "MEDIUM_TOKEN": "load-test",
+    "MEDIUM_USER_ID": "load-test",
+}
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))]
+
+
+def run(args: argparse.Namespace) -> dict:
+    config = {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "retry_after": args.retry_after,
+        "seed": args.seed,
+    }
+    servers = {channel: start_stand_in(config) for channel in CHANNELS}
+    env = dict(CREDENTIALS)
+    for channel, server in servers.items():
+        env[f"{channel.upper()}_API_BASE"] = server.api_bases()[f"{channel.upper()}_API_BASE"]
+    saved_env = dict(os.environ)
+    os.environ.update(env)
+
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            posts_dir = root / "_posts"
+            posts_dir.mkdir()
+            write_synthetic_posts(posts_dir, args.posts)
+            index = PostIndex.load(posts_dir, root / "index.json")
+            ledger = PublishLedger.load(root / "ledger.jsonl")
+            options = argparse.Namespace(site_url="https://example.org", dry_run=False, timeout=args.timeout, force=False)
+            rates = dict(parse_rate(spec) for spec in args.rate)
+            limiters = {channel: TokenBucket(rates[channel], args.burst) for channel in rates}
+
+            started = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                results = publish_pipeline(
+                    sorted(posts_dir.glob("*.md")),
+                    lambda path: prepare_post(path, options, index, ledger),
+                    limiters,
+                    args.timeout,
+                    args.concurrency,
+                )
+            elapsed = time.perf_counter() - started
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_env)
+        post_to_social.HTTP_CLIENT.close()
+        for server in servers.values():
+            server.shutdown()
+            server.server_close()
+
+    channels = {}
+    for channel, server in servers.items():
+        channel_results = [r for r in results if r["channel"] == channel]
+        latencies = [r["latency"] for r in channel_results if r["status"] == "published"]
+        stats = server.snapshot()
+        channels[channel] = {
+            "published": len(latencies),
+            "failed": sum(r["status"] in ("failed", "timeout") for r in channel_results),
+            "p50_s": percentile(latencies, 50),
+            "p95_s": percentile(latencies, 95),
+            "p99_s": percentile(latencies, 99),
+            "max_s": max(latencies, default=0.0),
+            "requests": sum(count for key, count in stats.items() if key.endswith(" requests")),
+            "throttled": sum(count for key, count in stats.items() if key.endswith(" 429")),
+            "server_errors": sum(count for key, count in stats.items() if key.endswith(" 500")),
+        }
+    return {
+        "posts": args.posts,
+        "elapsed_s": elapsed,
+        "posts_per_s": args.posts / elapsed if elapsed else 0.0,
+        "config": config,
+        "concurrency": args.concurrency,
+        "channels": channels,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test batch publishing against local API stand-ins.")
+    parser.add_argument("--posts", type=int, default=100, help="Synthetic posts to publish.")
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean stand-in response latency in seconds.")
+    parser.add_argument("--jitter", type=float, default=0.5, help="Latency jitter as a fraction of --latency.")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests failing with 500 (not retried).")
+    parser.add_argument("--throttle-rate", type=float, default=0.05, help="Share of requests answered with 429 (retried).")
+    parser.add_argument("--retry-after", type=float, default=0.05, help="Retry-After seconds sent with 429s.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, default=2, help="Publish workers per channel.")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-channel publish timeout in seconds.")
+    parser.add_argument("--rate", action="append", default=[], help="Client rate limit as CHANNEL=N[/s|/min|/h]; unlimited by default.")
+    parser.add_argument("--burst", type=int, default=1, help="Token bucket burst size for --rate limits.")
+    parser.add_argument("--json", type=Path, help="Also write the results to this JSON file.")
+    args = parser.parse_args()
+    try:
+        dict(parse_rate(spec) for spec in args.rate)
+    except ValueError as exc:
+        parser.error(str(exc))
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    result = run(args)
+
+    print(f"Processed {args.posts} posts in {result['elapsed_s']:.2f}s ({result['posts_per_s']:.1f} posts/s)")
+    print(f"{'channel':<10} {'ok':>5} {'failed':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'requests':>9} {'429s':>5} {'500s':>5}")
+    for channel, stats in result["channels"].items():
+        print(
+            f"{channel:<10} {stats['published']:>5} {stats['failed']:>6} {stats['p50_s'] * 1000:>8.1f} "
+            f"{stats['p95_s'] * 1000:>8.1f} {stats['p99_s'] * 1000:>8.1f} {stats['requests']:>9} "
+            f"{stats['throttled']:>5} {stats['server_errors']:>5}"
+        )
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
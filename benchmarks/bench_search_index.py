@@ -0,0 +1,156 @@
+"""Compare the legacy full-content search.json with the sharded search index.
+
+Reports payload bytes (raw and gzip) a visitor downloads to run a query, and the
+time to parse that payload and answer the query. The legacy query is a plain
+substring scan over every post, a lower bound on SimpleJekyllSearch's fuzzy
+matching.
+
+    python benchmarks/bench_search_index.py                 # real _posts/
+    python benchmarks/bench_search_index.py --synthetic 5000
+"""
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+import gzip
+import json
+import math
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import write_synthetic_posts  # noqa: E402
+from scripts.build_search_index import build_index, shard_key, write_index  # noqa: E402
+from scripts.post_index import PostIndex, jekyll_url, read_post_body  # noqa: E402
+from scripts.text_analysis import plain_text, stem, tokenize  # noqa: E402
+
+QUERIES = ["childhood cancer", "early signs", "counselling parents", "transport support", "volunteer", "hospital welfare"]
+
+
+def legacy_payload(posts: list[tuple[Path, dict]]) -> bytes:
+    docs = [
+        {
+            "title": entry.get("title"),
+            "url": jekyll_url(entry),
+            "date": (entry.get("date") or "")[:10],
+            "content": " ".join(plain_text(read_post_body(path)).split()),
+        }
+        for path, entry in posts
+    ]
+    return json.dumps(docs).encode("utf-8")
+
+
+def legacy_query(payload: bytes, query: str) -> list[str]:
+    words = query.lower().split()
+    docs = json.loads(payload)
+    return [d["url"] for d in docs if all(w in (d["title"] + " " + d["content"]).lower() for w in words)]
+
+
+def sharded_query(index_dir: Path, query: str) -> tuple[list[int], int]:
+    """Python port of assets/js/search.js; returns matching doc ids and bytes fetched."""
+    manifest_bytes = (index_dir / "manifest.json").read_bytes()
+    manifest = json.loads(manifest_bytes)
+    fetched = len(manifest_bytes)
+    shards: dict[str, dict] = {}
+    scores: dict[int, float] = defaultdict(float)
+    matched: dict[int, int] = defaultdict(int)
+
+    query_terms = [(tok, stem(tok)) for tok in tokenize(query)]
+    for raw, term in query_terms:
+        key = shard_key(term)
+        if key not in shards:
+            path = index_dir / "shards" / f"{key}.json"
+            data = path.read_bytes() if key in manifest["shards"] else b"{}"
+            fetched += len(data)
+            shards[key] = json.loads(data)
+        hits = set()
+        for candidate, postings in shards[key].items():
+            if not (candidate.startswith(term) or candidate.startswith(raw)):
+                continue
+            idf = math.log(1 + manifest["doc_count"] / (len(postings) / 2))
+            for i in range(0, len(postings), 2):
+                scores[postings[i]] += postings[i + 1] * idf
+                hits.add(postings[i])
+        for doc in hits:
+            matched[doc] += 1
+
+    ranked = sorted((doc for doc in scores if matched[doc] == len(query_terms)), key=lambda d: -scores[d])
+    return ranked[:20], fetched
+
+
+def time_call(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def run(posts_dir: Path, repeat: int) -> dict:
+    posts = PostIndex.load(posts_dir, posts_dir.parent / ".post-index.json").posts()
+    legacy = legacy_payload(posts)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index_dir = Path(tmp)
+        manifest, shards = build_index(posts)
+        write_index(manifest, shards, index_dir)
+        index_bytes = sum(p.stat().st_size for p in index_dir.rglob("*.json"))
+
+        per_query = []
+        for query in QUERIES:
+            _, fetched = sharded_query(index_dir, query)
+            per_query.append(
+                {
+                    "query": query,
+                    "legacy_ms": time_call(lambda: legacy_query(legacy, query), repeat) * 1000,
+                    "sharded_ms": time_call(lambda: sharded_query(index_dir, query), repeat) * 1000,
+                    "sharded_bytes": fetched,
+                }
+            )
+
+    return {
+        "posts": len(posts),
+        "legacy_bytes": len(legacy),
+        "legacy_gzip_bytes": len(gzip.compress(legacy)),
+        "index_total_bytes": index_bytes,
+        "shards": len(shards),
+        "queries": per_query,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts-dir", type=Path, default=Path("_posts"))
+    parser.add_argument("--synthetic", type=int, help="Benchmark a generated corpus of N posts instead of --posts-dir.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", type=Path, help="Also write results as JSON to this path.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        posts_dir = args.posts_dir
+        if args.synthetic:
+            posts_dir = Path(tmp) / "_posts"
+            posts_dir.mkdir()
+            write_synthetic_posts(posts_dir, args.synthetic)
+        result = run(posts_dir, args.repeat)
+
+    print(f"Posts: {result['posts']}  shards: {result['shards']}")
+    print(f"search.json: {result['legacy_bytes']:,} bytes ({result['legacy_gzip_bytes']:,} gzip)")
+    print(f"{'query':<22} {'legacy ms':>10} {'sharded ms':>11} {'sharded bytes':>14}")
+    for q in result["queries"]:
+        print(f"{q['query']:<22} {q['legacy_ms']:>10.2f} {q['sharded_ms']:>11.2f} {q['sharded_bytes']:>14,}")
+    if args.json:
+        args.json.write_text(json.dumps(result, indent=2), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+"""Synthetic ``_posts`` corpora shared by the benchmarks.
+
+Posts are rendered through ``build_post`` so they match what the weekly
+generator writes. Corpora are deterministic for a given count and seed, which
+lets ``ensure_corpus`` reuse one across runs instead of rewriting 100k files.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import random
+import shutil
+
+from scripts.generate_post import build_post
+
+VOCABULARY = (
+    "child children childhood cancer awareness support welfare family families parents hospital treatment "
+    "counselling volunteer donation transparent community partnership survivor follow-up dignity hope care "
+    "signs symptoms fever bruising swelling referral outreach school church mosque ghana accra kumasi "
+    "emotional financial transport supplies emergency relief guidance recovery reintegration project"
+).split()
+
+CORPUS_VERSION = 1
+MARKER_NAME = "corpus.json"
+
+
+def synthetic_day(n: int) -> str:
+    return f"20{10 + n // 3650 % 90:02d}-{1 + n // 28 % 12:02d}-{1 + n % 28:02d}"
+
+
+def write_synthetic_posts(posts_dir: Path, count: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    for n in range(count):
+        title = " ".join(rng.choice(VOCABULARY) for _ in range(6)).title() + f" {n}"
+        paragraphs = [" ".join(rng.choice(VOCABULARY) for _ in range(60)) + "." for _ in range(8)]
+        day = synthetic_day(n)
+        (posts_dir / f"{day}-synthetic-{n}.md").write_text(
+            build_post(
+                title=title,
+                excerpt=paragraphs[0][:120],
+                category="Awareness",
+                tags=rng.sample(VOCABULARY, 3),
+                image_url="https://example.com/image.jpg",
+                image_alt="alt",
+                permalink_slug=f"synthetic-{n}",
+                seo_title=title,
+                seo_description=paragraphs[0][:150],
+                body="\n\n".join(paragraphs),
+                publish_date=day,
+            ),
+            encoding="utf-8",
+        )
+
+
+def ensure_corpus(root: Path, count: int, seed: int = 7) -> Path:
+    """Return a site root under ``root`` whose ``_posts`` holds ``count`` synthetic posts.
+
+    The corpus is rebuilt only if its marker file is missing or describes a
+    different count, seed or corpus version.
+    """
+    site_root = root / f"posts-{count}"
+    marker_path = site_root / MARKER_NAME
+    marker = {"version": CORPUS_VERSION, "count": count, "seed": seed}
+    try:
+        if json.loads(marker_path.read_text(encoding="utf-8")) == marker:
+            return site_root
+    except (OSError, ValueError):
+        pass
+
+    shutil.rmtree(site_root, ignore_errors=True)
+    posts_dir = site_root / "_posts"
+    posts_dir.mkdir(parents=True)
+    write_synthetic_posts(posts_dir, count, seed)
+    marker_path.write_text(json.dumps(marker), encoding="utf-8")
+    return site_root
@@ -0,0 +1,248 @@
+"""Minify the site's CSS/JS and publish them under content-hashed names.
+
+Each source in ASSETS is minified into ``assets/dist/<name>.<hash>.<ext>``,
+where the hash is of the minified bytes, so a fingerprinted URL never
+changes content and can be cached as immutable. ``_data/assets.yml`` maps
+each source URL to its fingerprinted URL for the layouts; it also records
+the source hash, so unchanged sources are not minified again.
+
+The minifiers are deliberately conservative: they drop comments and
+redundant whitespace but keep JavaScript line breaks, so automatic
+semicolon insertion behaves exactly as in the source.
+
+    python scripts/build_assets.py
+    python scripts/build_assets.py --check   # fail if the manifest is out of date
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+from pathlib import Path
+import re
+
+try:
+    from scripts.front_matter import FrontMatterError, parse_yaml
+    from scripts.fsutil import write_if_changed, yaml_str
+except ImportError:  # executed as `python scripts/build_assets.py`
+    from front_matter import FrontMatterError, parse_yaml
+    from fsutil import write_if_changed, yaml_str
+
+OUTPUT_DIR = Path("assets/dist")
+MANIFEST_PATH = Path("_data/assets.yml")
+HASH_LENGTH = 10
+# Served sources only: assets/css/main.scss has no front matter, so Jekyll
+# copies it verbatim and no page links it.
+ASSETS = (
+    Path("assets/css/main.css"),
+    Path("assets/js/search.js"),
+    Path("assets/js/tabs.js"),
+    Path("assets/js/theme-toggle.js"),
+    Path("assets/js/video-facade.js"),
+)
+
+_CSS_TOKEN = re.compile(r"""/\*.*?\*/|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|\s+|[^"'/\s]+|/""", re.DOTALL)
+# Whitespace next to these is never significant.
+CSS_TIGHT = set("{};,>")
+JS_TIGHT = set("{}()[];,=:<>!&|?*%")
+# A "/" after one of these characters or keywords starts a regex literal rather than a division.
+_REGEX_PREFIX = set("(,=:[!&|?{};+-*%<>~^")
+_REGEX_KEYWORD = re.compile(r"(?:^|[^\w$])(?:return|typeof|case|do|else|in|of|void|yield|await)$")
+
+
+def minify_css(source: str) -> str:
+    """Strip comments, collapse whitespace and drop it where no token needs it."""
+    out: list[str] = []
+    pending_space = False
+    for token in _CSS_TOKEN.findall(source):
+        if token.startswith("/*") or token.isspace():
+            pending_space = bool(out)
+            continue
+        code = token[0] not in "\"'"
+        previous = out[-1] if out else ""
+        if pending_space and not (code and token[0] in CSS_TIGHT) and previous[-1:] not in CSS_TIGHT | {":"}:
+            out.append(" ")
+        pending_space = False
+        if code and token[0] == "}" and previous.endswith(";") and previous[0] not in "\"'":
+            out[-1] = previous[:-1]
+        out.append(token.replace(";}", "}") if code else token)
+    return "".join(out) + "\n"
+
+
+def _skip_quoted(source: str, start: int) -> int:
+    quote = source[start]
+    i = start + 1
+    while i < len(source) and source[i] != quote:
+        i += 2 if source[i] == "\\" else 1
+    return i + 1
+
+
+def _skip_regex(source: str, start: int) -> int:
+    i, in_class = start + 1, False
+    while i < len(source) and (in_class or source[i] != "/"):
+        if source[i] == "\\":
+            i += 1
+        elif source[i] == "[":
+            in_class = True
+        elif source[i] == "]":
+            in_class = False
+        i += 1
+    i += 1
+    while i < len(source) and source[i].isalpha():
+        i += 1
+    return i
+
+
+def minify_js(source: str) -> str:
+    """Strip comments and redundant whitespace, keeping the line breaks that can end a statement."""
+    out: list[str] = []
+    i, n = 0, len(source)
+    while i < n:
+        c = source[i]
+        if c.isspace() or source.startswith(("//", "/*"), i):
+            newline = False
+            while i < n:
+                if source[i].isspace():
+                    newline = newline or source[i] == "\n"
+                    i += 1
+                elif source.startswith("//", i):
+                    end = source.find("\n", i)
+                    i = n if end < 0 else end
+                elif source.startswith("/*", i):
+                    end = source.find("*/", i + 2)
+                    newline = newline or "\n" in source[i:end]
+                    i = n if end < 0 else end + 2
+                else:
+                    break
+            before = out[-1][-1] if out else ""
+            after = source[i] if i < n else ""
+            if not before or not after:
+                continue
+            if newline and before not in "{;," and after != "}":
+                out.append("\n")
+            elif before not in JS_TIGHT and after not in JS_TIGHT:
+                out.append(" ")
+        elif c in "'\"`":
+            end = _skip_quoted(source, i)
+            out.append(source[i:end])
+            i = end
+        elif c == "/":
+            code = "".join(out[-8:]).rstrip()
+            if not code or code[-1] in _REGEX_PREFIX or _REGEX_KEYWORD.search(code):
+                end = _skip_regex(source, i)
+                out.append(source[i:end])
+                i = end
+            else:
+                out.append(c)
+                i += 1
+        else:
+            out.append(c)
+            i += 1
+    return "".join(out) + "\n"
+
+
+MINIFIERS = {".css": minify_css, ".js": minify_js}
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def fingerprinted_name(source: Path, digest: str) -> str:
+    return f"{source.stem}.{digest[:HASH_LENGTH]}{source.suffix}"
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict]:
+    try:
+        data = parse_yaml(path.read_text(encoding="utf-8").splitlines())
+    except (OSError, FrontMatterError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def build_assets(sources: tuple[Path, ...], previous: dict[str, dict], output_dir: Path = OUTPUT_DIR) -> tuple[dict[str, dict], list[str]]:
+    """Return manifest entries keyed by source URL and the sources that were (re)minified."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    entries: dict[str, dict] = {}
+    rebuilt = []
+    for source in sources:
+        raw = source.read_bytes()
+        url = "/" + source.as_posix()
+        source_hash = content_hash(raw)
+        cached = previous.get(url)
+        if cached and cached.get("source_hash") == source_hash and Path(cached["path"].lstrip("/")).is_file():
+            entries[url] = cached
+            continue
+        minified = MINIFIERS[source.suffix](raw.decode("utf-8")).encode("utf-8")
+        target = output_dir / fingerprinted_name(source, content_hash(minified))
+        if not target.is_file():
+            tmp_path = target.with_name(target.name + ".tmp")
+            tmp_path.write_bytes(minified)
+            os.replace(tmp_path, target)
+        entries[url] = {
+            "path": "/" + target.as_posix(),
+            "source_hash": source_hash,
+            "bytes": str(len(raw)),
+            "minified_bytes": str(len(minified)),
+        }
+        rebuilt.append(url)
+    return entries, rebuilt
+
+
+def remove_stale(entries: dict[str, dict], output_dir: Path = OUTPUT_DIR) -> int:
+    keep = {Path(entry["path"].lstrip("/")) for entry in entries.values()}
+    removed = 0
+    for path in output_dir.glob("*"):
+        if path.is_file() and path not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def render_manifest(entries: dict[str, dict]) -> str:
+    lines = ["# Generated by scripts/build_assets.py; do not edit by hand."]
+    for url, entry in entries.items():
+        lines.append(f"{yaml_str(url)}:")
+        lines.append(f"  path: {yaml_str(entry['path'])}")
+        lines.append(f"  source_hash: {entry['source_hash']}")
+        lines.append(f"  bytes: {entry['bytes']}")
+        lines.append(f"  minified_bytes: {entry['minified_bytes']}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Minify CSS/JS into content-hashed files and write _data/assets.yml.")
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH)
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any source changed since the manifest was written.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    previous = load_manifest(args.manifest)
+    if args.check:
+        stale = [
+            source.as_posix()
+            for source in ASSETS
+            if (previous.get("/" + source.as_posix()) or {}).get("source_hash") != content_hash(source.read_bytes())
+        ]
+        for path in stale:
+            print(f"{path} changed since {args.manifest} was written; run python scripts/build_assets.py")
+        return 1 if stale else 0
+
+    entries, rebuilt = build_assets(ASSETS, previous, args.output_dir)
+    removed = remove_stale(entries, args.output_dir)
+    written = write_if_changed(args.manifest, render_manifest(entries))
+    for url in rebuilt:
+        entry = entries[url]
+        print(f"{url} -> {entry['path']} ({entry['bytes']} -> {entry['minified_bytes']} bytes)")
+    print(
+        f"Assets: {len(entries)} sources, {len(rebuilt)} minified, {removed} stale removed, "
+        f"{args.manifest} {'updated' if written else 'unchanged'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,316 @@
+"""Write sitemap.xml and the Atom feed (feed.xml) from the post index.
+
+Both files are streamed to disk entry by entry. The XML fragment for each
+post is cached in .cache/feeds.json against a hash of the post's bytes, so
+only new or edited posts are rendered and a cache restored into a fresh
+checkout (as the weekly workflows do) stays valid. When the only change is posts
+newer than everything already listed, the new ``<url>`` elements are
+written in place before the closing ``</urlset>``; any other change
+re-streams the sitemap from the cached fragments. The feed lists the newest
+FEED_LIMIT posts and is rewritten only when that list changes.
+
+jekyll-sitemap and jekyll-feed skip generating a file that already exists
+in the source tree, so the committed files take their place and must be
+kept current; CI runs ``--check`` so a post added without rerunning this
+script fails the build instead of silently dropping out of both files.
+
+    python scripts/build_feeds.py
+    python scripts/build_feeds.py --full
+    python scripts/build_feeds.py --check   # exit 1 if either file differs from a full rebuild
+"""
+from __future__ import annotations
+
+import argparse
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+from xml.sax.saxutils import escape, quoteattr
+
+try:
+    from scripts.front_matter import FrontMatterError, PostFile
+    from scripts.fsutil import write_if_changed
+    from scripts.post_index import INDEX_PATH, POSTS_DIR, PostIndex, jekyll_url, normalize_permalink
+except ImportError:  # executed as `python scripts/build_feeds.py`
+    from front_matter import FrontMatterError, PostFile
+    from fsutil import write_if_changed
+    from post_index import INDEX_PATH, POSTS_DIR, PostIndex, jekyll_url, normalize_permalink
+
+# Mirrors url, title, description and author.name in _config.yml.
+SITE_URL = "https://blog.wesoamochildcancer.app"
+SITE_TITLE = "Wesoamo Child Cancer Foundation"
+SITE_DESCRIPTION = "A charity blog focused on hope, dignity, and support for children fighting cancer"
+AUTHOR = "Wesoamo Child Cancer Foundation"
+SITEMAP_PATH = Path("sitemap.xml")
+FEED_PATH = Path("feed.xml")
+CACHE_PATH = Path(".cache/feeds.json")
+CACHE_VERSION = 2
+FEED_LIMIT = 10
+# Top-level directories that hold no site pages.
+EXCLUDED_DIRS = {"assets", "benchmarks", "node_modules", "photos", "scripts", "tests", "vendor", "workflows"}
+
+SITEMAP_HEAD = '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+SITEMAP_TAIL = "</urlset>\n"
+FEED_TAIL = "</feed>\n"
+
+
+def iso_datetime(raw: str) -> str:
+    """Front-matter dates (``2026-02-17`` or ``2026-02-17 09:00:00 +0000``) as RFC 3339, UTC if unzoned."""
+    try:
+        value = datetime.fromisoformat(raw.strip())
+    except ValueError:
+        value = datetime.fromisoformat(raw.strip()[:10])
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
+def absolute_url(site_url: str, url: str) -> str:
+    return url if "://" in url else f"{site_url.rstrip('/')}/{url.lstrip('/')}"
+
+
+def page_url(path: Path, front_matter: dict) -> str:
+    """URL Jekyll gives a page: its ``permalink``, else its path with ``.html`` (``index`` maps to the directory)."""
+    permalink = normalize_permalink(front_matter.get("permalink"))
+    if permalink:
+        return permalink
+    if path.name in ("index.md", "index.html"):
+        return "/" if path.parent == Path(".") else f"/{path.parent.as_posix()}/"
+    return "/" + path.with_suffix(".html").as_posix()
+
+
+def page_files(root: Path = Path(".")) -> list[tuple[Path, dict]]:
+    """The site's pages: Markdown/HTML files with front matter outside ``_*`` directories, with that front matter."""
+    candidates = sorted(root.glob("*.md")) + sorted(root.glob("*.html"))
+    for directory in sorted(p for p in root.iterdir() if p.is_dir()):
+        if not directory.name.startswith(("_", ".")) and directory.name not in EXCLUDED_DIRS:
+            candidates += sorted(directory.glob("*.md")) + sorted(directory.glob("*.html"))
+    pages = []
+    for path in candidates:
+        try:
+            front_matter = PostFile(path).front_matter
+        except (OSError, FrontMatterError):
+            continue
+        if front_matter:
+            pages.append((path.relative_to(root), front_matter))
+    return pages
+
+
+def collect_pages(root: Path = Path(".")) -> list[str]:
+    """Sitemap URLs of the site's pages."""
+    urls = [
+        page_url(path, front_matter)
+        for path, front_matter in page_files(root)
+        if str(front_matter.get("sitemap", "")).lower() != "false"
+    ]
+    return sorted(set(urls))
+
+
+def render_url(loc: str, lastmod: str | None = None) -> str:
+    lastmod_xml = f"<lastmod>{lastmod}</lastmod>" if lastmod else ""
+    return f"<url><loc>{escape(loc)}</loc>{lastmod_xml}</url>\n"
+
+
+def render_entry(entry: dict, url: str, site_url: str) -> str:
+    title = entry.get("title") or entry["slug"]
+    updated = iso_datetime(entry.get("date") or "")
+    lines = [
+        "<entry>",
+        f'<title type="html">{escape(title)}</title>',
+        f'<link href={quoteattr(url)} rel="alternate" type="text/html" title={quoteattr(title)}/>',
+        f"<published>{updated}</published>",
+        f"<updated>{updated}</updated>",
+        f"<id>{escape(url)}</id>",
+        f"<author><name>{escape(AUTHOR)}</name></author>",
+    ]
+    lines += [f"<category term={quoteattr(label)}/>" for label in (entry.get("categories") or []) + (entry.get("tags") or [])]
+    if entry.get("excerpt"):
+        lines.append(f'<summary type="html">{escape(entry["excerpt"])}</summary>')
+    if entry.get("image"):
+        image = absolute_url(site_url, entry["image"])
+        lines.append(f'<media:thumbnail xmlns:media="http://search.yahoo.com/mrss/" url={quoteattr(image)}/>')
+    lines.append("</entry>")
+    return "\n".join(lines) + "\n"
+
+
+def render_post(entry: dict, site_url: str) -> dict:
+    url = absolute_url(site_url, jekyll_url(entry))
+    updated = iso_datetime(entry.get("date") or "")
+    return {"key": [updated, url], "url": render_url(url, updated), "entry": render_entry(entry, url, site_url)}
+
+
+def feed_head(site_url: str, updated: str) -> str:
+    feed_url = absolute_url(site_url, FEED_PATH.as_posix())
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom">\n'
+        f'<link href={quoteattr(feed_url)} rel="self" type="application/atom+xml"/>\n'
+        f'<link href={quoteattr(absolute_url(site_url, "/"))} rel="alternate" type="text/html"/>\n'
+        f"<updated>{updated}</updated>\n"
+        f"<id>{escape(feed_url)}</id>\n"
+        f'<title type="html">{escape(SITE_TITLE)}</title>\n'
+        f"<subtitle>{escape(SITE_DESCRIPTION)}</subtitle>\n"
+        f"<author><name>{escape(AUTHOR)}</name></author>\n"
+    )
+
+
+def stream_to(path: Path, chunks) -> int:
+    """Write ``chunks`` to ``path`` one at a time through a temporary file; returns the bytes written."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    written = 0
+    with tmp_path.open("wb") as handle:
+        for chunk in chunks:
+            written += handle.write(chunk.encode("utf-8"))
+    os.replace(tmp_path, path)
+    return written
+
+
+def file_stamp(path: Path) -> str | None:
+    """SHA-256 of ``path``'s bytes, or None if it is missing; unlike an mtime it survives a fresh checkout."""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def load_cache(path: Path = CACHE_PATH) -> dict:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cache if cache.get("version") == CACHE_VERSION else {}
+
+
+def update_sitemap(path: Path, pages: list[str], posts: dict[str, dict], cache: dict, added: set[str], rebuild: bool) -> str:
+    """Bring ``path`` up to date; returns ``unchanged``, ``appended`` or ``rewritten``."""
+    ordered = sorted(posts, key=lambda key: posts[key]["key"])
+    intact = cache.get("sitemap_stamp") is not None and cache["sitemap_stamp"] == file_stamp(path)
+    if intact and not rebuild and not added:
+        return "unchanged"
+
+    old = [key for key in ordered if key not in added]
+    appendable = old == ordered[: len(old)]
+    if intact and not rebuild and appendable:
+        with path.open("r+b") as handle:
+            handle.seek(cache["sitemap_tail"])
+            for key in ordered[len(old) :]:
+                handle.write(posts[key]["url"].encode("utf-8"))
+            cache["sitemap_tail"] = handle.tell()
+            handle.write(SITEMAP_TAIL.encode("utf-8"))
+            handle.truncate()
+        cache["sitemap_stamp"] = file_stamp(path)
+        return "appended"
+
+    body = [SITEMAP_HEAD, *(render_url(absolute_url(cache["site_url"], url)) for url in pages)]
+    body += [posts[key]["url"] for key in ordered]
+    cache["sitemap_tail"] = stream_to(path, body + [SITEMAP_TAIL]) - len(SITEMAP_TAIL.encode("utf-8"))
+    cache["sitemap_stamp"] = file_stamp(path)
+    return "rewritten"
+
+
+def update_feed(path: Path, posts: dict[str, dict], cache: dict, limit: int, rebuild: bool) -> str:
+    newest = sorted(posts, key=lambda key: posts[key]["key"], reverse=True)[:limit]
+    digest = hashlib.sha256("".join(posts[key]["entry"] for key in newest).encode("utf-8")).hexdigest()
+    if not rebuild and cache.get("feed_digest") == digest and cache.get("feed_stamp") == file_stamp(path):
+        return "unchanged"
+    updated = posts[newest[0]]["key"][0] if newest else iso_datetime("1970-01-01")
+    stream_to(path, [feed_head(cache["site_url"], updated), *(posts[key]["entry"] for key in newest), FEED_TAIL])
+    cache["feed_digest"] = digest
+    cache["feed_stamp"] = file_stamp(path)
+    return "rewritten"
+
+
+def update_feeds(
+    index: PostIndex,
+    pages: list[str],
+    cache: dict,
+    site_url: str = SITE_URL,
+    sitemap_path: Path = SITEMAP_PATH,
+    feed_path: Path = FEED_PATH,
+    limit: int = FEED_LIMIT,
+    full: bool = False,
+) -> tuple[dict, dict]:
+    """Render fragments for new or edited posts and update both files; returns the new cache and a summary."""
+    rerender = full or cache.get("site_url") != site_url
+    old_posts = {} if rerender else cache.get("posts", {})
+    posts: dict[str, dict] = {}
+    rendered: set[str] = set()
+    for path, entry in index.posts():
+        key = path.as_posix()
+        stamp = file_stamp(path)
+        cached = old_posts.get(key)
+        if cached and cached["stamp"] == stamp:
+            posts[key] = cached
+        else:
+            posts[key] = {"stamp": stamp, **render_post(entry, site_url)}
+            rendered.add(key)
+
+    # Edits and removals invalidate the sitemap's existing lines; only pure additions can be appended.
+    rebuild_sitemap = rerender or cache.get("pages") != pages
+    rebuild_sitemap = rebuild_sitemap or bool(set(old_posts) - set(posts)) or any(key in old_posts for key in rendered)
+    new_cache = {**cache, "version": CACHE_VERSION, "site_url": site_url, "pages": pages, "posts": posts}
+    summary = {
+        "posts": len(posts),
+        "rendered": len(rendered),
+        "sitemap": update_sitemap(sitemap_path, pages, posts, new_cache, rendered, rebuild_sitemap),
+        "feed": update_feed(feed_path, posts, new_cache, limit, rerender),
+    }
+    return new_cache, summary
+
+
+def check_feeds(
+    index: PostIndex,
+    pages: list[str],
+    site_url: str = SITE_URL,
+    sitemap_path: Path = SITEMAP_PATH,
+    feed_path: Path = FEED_PATH,
+    limit: int = FEED_LIMIT,
+) -> list[Path]:
+    """The files among ``sitemap_path`` and ``feed_path`` that differ from a full rebuild."""
+    with tempfile.TemporaryDirectory() as tmp:
+        fresh = (Path(tmp) / sitemap_path.name, Path(tmp) / feed_path.name)
+        update_feeds(index, pages, {}, site_url, *fresh, limit, full=True)
+        return [path for path, built in zip((sitemap_path, feed_path), fresh) if file_stamp(path) != file_stamp(built)]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Stream sitemap.xml and the Atom feed from _posts/, updating them incrementally.")
+    parser.add_argument("--posts-dir", type=Path, default=POSTS_DIR)
+    parser.add_argument("--site-url", default=SITE_URL)
+    parser.add_argument("--sitemap", type=Path, default=SITEMAP_PATH)
+    parser.add_argument("--feed", type=Path, default=FEED_PATH)
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH)
+    parser.add_argument("--limit", type=int, default=FEED_LIMIT, help="Posts listed in the feed.")
+    parser.add_argument("--full", action="store_true", help="Re-render every post instead of reusing cached fragments.")
+    parser.add_argument("--check", action="store_true", help="Write nothing; exit 1 if either file is out of date.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = PostIndex.load(args.posts_dir, INDEX_PATH)
+    index.save()
+
+    if args.check:
+        stale = check_feeds(index, collect_pages(), args.site_url, args.sitemap, args.feed, args.limit)
+        for path in stale:
+            print(f"{path} is out of date; run python scripts/build_feeds.py")
+        if not stale:
+            print(f"Feeds: {args.sitemap} and {args.feed} up to date")
+        return 1 if stale else 0
+
+    cache, summary = update_feeds(
+        index, collect_pages(), load_cache(args.cache), args.site_url, args.sitemap, args.feed, args.limit, args.full
+    )
+    write_if_changed(args.cache, json.dumps(cache, sort_keys=True))
+    print(
+        f"Feeds: {summary['posts']} posts, {summary['rendered']} rendered, "
+        f"{args.sitemap} {summary['sitemap']}, {args.feed} {summary['feed']}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import os
+from pathlib import Path
+from urllib import parse
+
+try:  # Pillow is only needed when an image actually has to be resized.
+    from PIL import Image, ImageOps
+except ImportError:
+    Image = ImageOps = None
+
+try:
+    from scripts.front_matter import FrontMatterError, parse_yaml
+    from scripts.fsutil import write_if_changed, yaml_str
+    from scripts.post_index import INDEX_PATH, POSTS_DIR, PostIndex
+    from scripts.slugs import slugify
+except ImportError:  # executed as `python scripts/build_image_variants.py`
+    from front_matter import FrontMatterError, parse_yaml
+    from fsutil import write_if_changed, yaml_str
+    from post_index import INDEX_PATH, POSTS_DIR, PostIndex
+    from slugs import slugify
+
+PHOTOS_DIR = Path("photos")
+OUTPUT_DIR = Path("assets/img/responsive")
+MANIFEST_PATH = Path("_data/images.yml")
+WIDTHS = (480, 800, 1200)
+FORMATS = {"webp": ("WEBP", {"quality": 80, "method": 6}), "jpg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True})}
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp"}
+HASH_LENGTH = 12
+# URL prefixes under which this repository's files are served.
+LOCAL_PREFIXES = (
+    "https://raw.githubusercontent.com/learngermanghana/weso-blog/main/",
+    "https://blog.wesoamochildcancer.app/",
+    "/",
+)
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def local_image_path(reference: str, root: Path = Path(".")) -> Path | None:
+    """Map an ``image:`` value to the image file in this repository, if it is one."""
+    relative = reference.strip()
+    if relative.startswith("//"):
+        return None
+    for prefix in LOCAL_PREFIXES:
+        if relative.startswith(prefix):
+            relative = relative[len(prefix) :]
+            break
+    else:
+        if "://" in relative:
+            return None
+    path = root / parse.unquote(relative.split("?", 1)[0])
+    if path.suffix.lower() not in IMAGE_SUFFIXES or not path.is_file():
+        return None
+    return path
+
+
+def collect_references(index: PostIndex, photos_dir: Path = PHOTOS_DIR) -> dict[str, Path]:
+    """Every local image keyed by how pages refer to it: post ``image:`` values and ``/photos/...`` paths."""
+    references: dict[str, Path] = {}
+    for path in sorted(photos_dir.glob("*")):
+        if path.suffix.lower() in IMAGE_SUFFIXES and path.is_file():
+            references["/" + path.as_posix()] = path
+    for _, entry in index.posts():
+        image = entry.get("image")
+        if image and image not in references:
+            local = local_image_path(image)
+            if local is not None:
+                references[image] = local
+            elif "://" not in image:
+                print(f"Warning: image not found: {image}")
+    return references
+
+
+def target_widths(source_width: int) -> list[int]:
+    """Standard widths narrower than the source, plus the source width capped at the largest."""
+    return sorted({w for w in WIDTHS if w < source_width} | {min(source_width, WIDTHS[-1])})
+
+
+def variant_name(source: Path, digest: str, width: int, ext: str) -> str:
+    return f"{slugify(source.stem)}-{digest[:HASH_LENGTH]}-{width}.{ext}"
+
+
+def render_variants(source: str, digest: str, output_dir: str) -> dict:
+    """Resize one image into every width and format; runs in a worker process."""
+    source_path, out = Path(source), Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    with Image.open(source_path) as opened:
+        image = ImageOps.exif_transpose(opened)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+    flat = image
+    if image.mode == "RGBA":
+        flat = Image.new("RGB", image.size, "white")
+        flat.paste(image, mask=image.getchannel("A"))
+
+    srcsets: dict[str, list[str]] = {ext: [] for ext in FORMATS}
+    for width in target_widths(image.width):
+        height = max(1, round(image.height * width / image.width))
+        for ext, (fmt, options) in FORMATS.items():
+            base = image if ext == "webp" else flat
+            resized = base if width == base.width else base.resize((width, height), Image.LANCZOS)
+            path = out / variant_name(source_path, digest, width, ext)
+            tmp_path = path.with_name(path.name + ".tmp")
+            resized.save(tmp_path, fmt, **options)
+            os.replace(tmp_path, path)
+            srcsets[ext].append(f"/{path.as_posix()} {width}w")
+
+    largest = target_widths(image.width)[-1]
+    return {
+        "hash": digest,
+        "width": largest,
+        "height": max(1, round(image.height * largest / image.width)),
+        "src": srcsets["jpg"][-1].split()[0],
+        "srcset_webp": ", ".join(srcsets["webp"]),
+        "srcset_jpg": ", ".join(srcsets["jpg"]),
+    }
+
+
+def variant_paths(entry: dict) -> list[Path]:
+    urls = [item.split()[0] for key in ("srcset_webp", "srcset_jpg") for item in entry[key].split(", ")]
+    return [Path(url.lstrip("/")) for url in urls]
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict]:
+    """Previous manifest entries keyed by source content hash."""
+    try:
+        data = parse_yaml(path.read_text(encoding="utf-8").splitlines())
+    except (OSError, FrontMatterError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    entries = {}
+    for entry in data.values():
+        if isinstance(entry, dict) and entry.get("hash"):
+            entry.update(width=int(entry["width"]), height=int(entry["height"]))
+            entries[entry["hash"]] = entry
+    return entries
+
+
+def build_variants(
+    references: dict[str, Path], previous: dict[str, dict], output_dir: Path = OUTPUT_DIR, workers: int | None = None
+) -> tuple[dict[str, dict], int]:
+    """Return manifest entries per reference and how many sources were (re)processed.
+
+    Sources are identified by content hash; one whose hash is in ``previous``
+    and whose variants are all on disk is reused without decoding it.
+    """
+    hashes = {path: file_hash(path) for path in set(references.values())}
+    by_hash: dict[str, dict] = {}
+    pending: dict[str, Path] = {}
+    for path, digest in hashes.items():
+        cached = previous.get(digest)
+        if cached and all(p.is_file() for p in variant_paths(cached)):
+            by_hash[digest] = cached
+        else:
+            pending.setdefault(digest, path)
+
+    if pending:
+        if Image is None:
+            raise RuntimeError("Pillow is required to resize images; install it with `pip install Pillow`.")
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [(str(path), digest, str(output_dir)) for digest, path in sorted(pending.items())]
+            for entry in pool.map(render_variants, *zip(*jobs)):
+                by_hash[entry["hash"]] = entry
+
+    return {reference: by_hash[hashes[path]] for reference, path in sorted(references.items())}, len(pending)
+
+
+def remove_stale_variants(entries: dict[str, dict], output_dir: Path = OUTPUT_DIR) -> int:
+    keep = {path for entry in entries.values() for path in variant_paths(entry)}
+    removed = 0
+    for path in output_dir.glob("*"):
+        if path.is_file() and path not in keep:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def render_manifest(entries: dict[str, dict]) -> str:
+    lines = ["# Generated by scripts/build_image_variants.py; do not edit by hand."]
+    for reference, entry in entries.items():
+        lines.append(f"{yaml_str(reference)}:")
+        lines.append(f"  hash: {entry['hash']}")
+        lines.append(f"  width: {entry['width']}")
+        lines.append(f"  height: {entry['height']}")
+        for key in ("src", "srcset_webp", "srcset_jpg"):
+            lines.append(f"  {key}: {yaml_str(entry[key])}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build resized WebP/JPEG variants of local post images and a srcset manifest.")
+    parser.add_argument("--posts-dir", type=Path, default=POSTS_DIR)
+    parser.add_argument("--photos-dir", type=Path, default=PHOTOS_DIR)
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes used to resize images.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = PostIndex.load(args.posts_dir, INDEX_PATH)
+    index.save()
+
+    references = collect_references(index, args.photos_dir)
+    try:
+        entries, processed = build_variants(references, load_manifest(args.manifest), args.output_dir, args.workers)
+    except RuntimeError as exc:
+        print(f"Error: {exc}")
+        return 1
+    removed = remove_stale_variants(entries, args.output_dir)
+    written = write_if_changed(args.manifest, render_manifest(entries))
+    print(
+        f"Images: {len(set(references.values()))} sources, {processed} processed, {removed} stale variants removed, "
+        f"{args.manifest} {'updated' if written else 'unchanged'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,348 @@
+"""Work out which pages a change affects, so CI can build incrementally.
+
+Compares the tree with a manifest of content hashes stored after the last
+build (.cache/build-manifest.json) and maps every changed post, page, layout,
+include and data file to the output pages that depend on it:
+
+- a page depends on its own file, its layout chain and every include they
+  pull in, transitively;
+- ``site.data.X[page.url]``, ``site.data.X['literal']`` and
+  ``site.data.X[include.src]`` where the page passes ``src=page.image`` depend
+  only on that key of _data/X.yml, so adding a post touches just the rows of
+  _data/related.yml and _data/images.yml that changed; any other
+  ``site.data.X`` use depends on the whole file;
+- ``site.posts`` depends on every post, ``site.tags``/``site.categories`` on
+  posts sharing a tag or category, and ``page.previous``/``page.next`` on the
+  neighbouring posts.
+
+A change to _config.yml or the Gemfile, a missing manifest, or more than
+FULL_RATIO of the pages affected calls for a full build. Otherwise ``--apply``
+prepares ``jekyll build --incremental``. It restores the stored mtimes of
+files whose content is unchanged, because a fresh checkout gives every file a
+new mtime. It then touches the affected pages, so Jekyll's regenerator
+rebuilds exactly those.
+
+    python scripts/build_impact.py                      # report
+    python scripts/build_impact.py --apply --github-output "$GITHUB_OUTPUT"
+    python scripts/build_impact.py --update             # after a successful build
+"""
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+import re
+
+try:
+    from scripts.build_feeds import page_files, page_url
+    from scripts.front_matter import FrontMatterError, parse_yaml, read_front_matter
+    from scripts.fsutil import write_if_changed
+    from scripts.post_index import POSTS_DIR, jekyll_url, read_front_matter_fields
+except ImportError:  # executed as `python scripts/build_impact.py`
+    from build_feeds import page_files, page_url
+    from front_matter import FrontMatterError, parse_yaml, read_front_matter
+    from fsutil import write_if_changed
+    from post_index import POSTS_DIR, jekyll_url, read_front_matter_fields
+
+MANIFEST_PATH = Path(".cache/build-manifest.json")
+MANIFEST_VERSION = 1
+DATA_DIR = Path("_data")
+INCLUDES_DIR = Path("_includes")
+LAYOUTS_DIR = Path("_layouts")
+CONFIG_FILES = (Path("_config.yml"), Path("Gemfile"), Path("Gemfile.lock"))
+FULL_RATIO = 0.5
+# Layouts GitHub Pages' jekyll-default-layout applies when a file sets none.
+DEFAULT_LAYOUTS = {"post": "post", "page": "page", "index": "home"}
+# minima layouts used without a local copy, and the layout each one extends.
+THEME_LAYOUTS = {"page": "default", "post": "default", "home": "default"}
+ALL = "*"  # a data dependency on every key
+
+_INCLUDE = re.compile(r"{%-?\s*include\s+([\w./-]+)")
+_DATA = re.compile(r"""site\.data\.(\w+)(?:\[\s*([^\]]+?)\s*\])?""")
+# ``{% if site.data.X %}`` only tests that the file exists.
+_DATA_GUARD = re.compile(r"{%-?\s*(?:if|unless|elsif)\s+site\.data\.\w+\s*-?%}")
+_INCLUDE_CALL = re.compile(r"{%-?\s*include\s+[\w./-]+([^%]*)%}")
+_INCLUDE_ARG = re.compile(r"""\b(\w+)=("[^"]*"|'[^']*'|[^\s%-]+)""")
+_POST_LISTS = re.compile(r"\b(?:site\.posts|paginator\.posts)\b")
+_TAG_LISTS = re.compile(r"\bsite\.(?:tags|categories)\b")
+_NEIGHBOURS = re.compile(r"\bpage\.(?:previous|next)\b")
+
+
+def _as_list(value: object) -> list[str]:
+    if value is None:
+        return []
+    return [str(item) for item in value] if isinstance(value, list) else str(value).split()
+
+
+def file_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def data_key_hashes(path: Path, data: bytes) -> dict[str, str]:
+    """Hash of each top-level entry of a YAML mapping; ``{ALL: hash}`` for anything else."""
+    try:
+        parsed = parse_yaml(data.decode("utf-8").splitlines()) if path.suffix in (".yml", ".yaml") else None
+    except (UnicodeDecodeError, FrontMatterError):
+        parsed = None
+    if not isinstance(parsed, dict):
+        return {ALL: file_hash(data)}
+    return {str(key): file_hash(json.dumps(value, sort_keys=True).encode("utf-8")) for key, value in parsed.items()}
+
+
+def _front_matter(data: bytes) -> dict:
+    try:
+        return read_front_matter(io.BytesIO(data)) or {}
+    except (UnicodeDecodeError, FrontMatterError):
+        return {}
+
+
+class SiteGraph:
+    """Pages and posts of the tree with the templates, data keys and collections each one reads."""
+
+    def __init__(self, root: Path = Path(".")) -> None:
+        self.root = root
+        self.files: dict[str, dict] = {}
+        self.data_keys: dict[str, dict[str, str]] = {}
+        self.posts: dict[str, dict] = {}
+        self.sources: dict[str, dict] = {}
+        self.templates: dict[str, str] = {}
+        self._reach: dict[str, set[str]] = {}
+
+        for directory in (INCLUDES_DIR, LAYOUTS_DIR):
+            for path in sorted((root / directory).rglob("*")):
+                if path.is_file():
+                    self.templates[self._track(path)] = path.read_text(encoding="utf-8", errors="replace")
+        for path in sorted((root / DATA_DIR).rglob("*")):
+            if path.is_file():
+                self.data_keys[self._track(path)] = data_key_hashes(path, path.read_bytes())
+        for path in CONFIG_FILES:
+            if (root / path).is_file():
+                self._track(root / path)
+
+        for path in sorted((root / POSTS_DIR).glob("*.md")):
+            key = self._track(path)
+            fields = read_front_matter_fields(path)
+            self.posts[key] = {
+                "url": jekyll_url(fields) if fields["date"] else None,
+                "date": fields["date"] or "",
+                "tags": fields["tags"],
+                "categories": fields["categories"],
+            }
+            self._add_source(key, path, self.posts[key]["url"], "post")
+        for path, front_matter in page_files(root):
+            self._add_source(self._track(root / path), root / path, page_url(path, front_matter), "page")
+
+    def _track(self, path: Path) -> str:
+        key = path.relative_to(self.root).as_posix()
+        stat = path.stat()
+        self.files[key] = {"hash": file_hash(path.read_bytes()), "mtime_ns": stat.st_mtime_ns}
+        return key
+
+    def _layout_file(self, name: str | None) -> str | None:
+        return f"{LAYOUTS_DIR.as_posix()}/{name}.html" if name else None
+
+    def _reachable(self, template: str) -> set[str]:
+        """Templates ``template`` pulls in: its includes and, for a layout, its parent layout, transitively."""
+        if template not in self._reach:
+            self._reach[template] = found = {template}
+            text = self.templates.get(template, "")
+            children = [f"{INCLUDES_DIR.as_posix()}/{name}" for name in _INCLUDE.findall(text)]
+            if template.startswith(LAYOUTS_DIR.as_posix() + "/"):
+                parent = _front_matter(text.encode("utf-8")).get("layout")
+                children.append(self._layout_file(self._resolve_layout(parent)))
+            for child in filter(None, children):
+                found |= self._reachable(child)
+        return self._reach[template]
+
+    def _resolve_layout(self, name: str | None) -> str | None:
+        """Follow minima layouts without a local copy up to the first local one."""
+        while name and not (self.root / LAYOUTS_DIR / f"{name}.html").is_file():
+            name = THEME_LAYOUTS.get(name)
+        return name
+
+    def _add_source(self, key: str, path: Path, url: str | None, kind: str) -> None:
+        if url is None:
+            return
+        data = path.read_bytes()
+        front_matter = _front_matter(data)
+        default = DEFAULT_LAYOUTS["index" if path.stem == "index" else kind]
+        layout = self._layout_file(self._resolve_layout(front_matter.get("layout", default)))
+        templates = {key}
+        self.templates[key] = data.decode("utf-8", errors="replace")
+        for template in filter(None, [layout, key]):
+            templates |= self._reachable(template)
+        text = "\n".join(self.templates.get(t, "") for t in templates)
+        include_args: dict[str, set[str]] = defaultdict(set)
+        for call in _INCLUDE_CALL.findall(text):
+            for arg, expression in _INCLUDE_ARG.findall(call):
+                include_args[arg].add(expression)
+
+        data_refs: dict[str, set[str]] = defaultdict(set)
+        for name, subscript in _DATA.findall(_DATA_GUARD.sub("", text)):
+            data_refs[name] |= self._data_keys(subscript, url, front_matter, include_args)
+        self.sources[key] = {
+            "url": url,
+            "kind": kind,
+            "templates": templates - {key},
+            "data": dict(data_refs),
+            "lists_posts": bool(_POST_LISTS.search(text)),
+            "lists_tags": bool(_TAG_LISTS.search(text)),
+            "terms": sorted(set(_as_list(front_matter.get("tags")) + _as_list(front_matter.get("categories")))),
+            "neighbours": bool(_NEIGHBOURS.search(text)),
+        }
+
+    @staticmethod
+    def _data_keys(subscript: str, url: str, front_matter: dict, include_args: dict[str, set[str]]) -> set[str]:
+        """Keys of a data file that ``site.data.X[subscript]`` can read on the page at ``url``."""
+        if len(subscript) > 1 and subscript[0] == subscript[-1] and subscript[0] in "'\"":
+            return {subscript[1:-1]}
+        expressions = include_args.get(subscript.removeprefix("include."), set()) if subscript.startswith("include.") else {subscript}
+        keys = set()
+        for expression in expressions or {""}:
+            if expression == "page.url":
+                keys.add(url)
+            elif expression.startswith("page.") and isinstance(front_matter.get(expression[5:]), str):
+                keys.add(front_matter[expression[5:]])
+            else:
+                return {ALL}
+        return keys
+
+    def manifest(self) -> dict:
+        return {
+            "version": MANIFEST_VERSION,
+            "files": self.files,
+            "data_keys": self.data_keys,
+            "posts": self.posts,
+            "urls": {key: source["url"] for key, source in self.sources.items()},
+        }
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict | None:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("version") == MANIFEST_VERSION else None
+
+
+def _neighbours(posts: dict[str, dict], changed: set[str]) -> set[str]:
+    order = sorted(posts, key=lambda key: (posts[key]["date"], key))
+    found = set()
+    for i, key in enumerate(order):
+        if key in changed:
+            found.update(order[max(i - 1, 0) : i + 2])
+    return found - changed
+
+
+def impact(graph: SiteGraph, manifest: dict | None, full_ratio: float = FULL_RATIO) -> dict:
+    """Changed sources, the pages they affect (with why) and whether a full build is needed."""
+    if manifest is None:
+        return {"mode": "full", "reasons": ["no stored manifest"], "changed": [], "affected": [], "removed_urls": []}
+    old_files, new_files = manifest["files"], graph.files
+    changed = sorted(p for p in old_files.keys() | new_files.keys() if (old_files.get(p) or {}).get("hash") != (new_files.get(p) or {}).get("hash"))
+    changed_set = set(changed)
+    reasons = [f"{p} changed" for p in changed if Path(p) in CONFIG_FILES]
+
+    changed_keys: dict[str, set[str]] = {}
+    for path in changed_set & (manifest["data_keys"].keys() | graph.data_keys.keys()):
+        old, new = manifest["data_keys"].get(path, {}), graph.data_keys.get(path, {})
+        keys = {k for k in old.keys() | new.keys() if old.get(k) != new.get(k)}
+        changed_keys[Path(path).stem] = {ALL} if ALL in keys else keys
+
+    old_posts, new_posts = manifest["posts"], graph.posts
+    changed_posts = changed_set & (old_posts.keys() | new_posts.keys())
+    shared_terms = {
+        term for key in changed_posts for post in (old_posts.get(key), new_posts.get(key)) if post
+        for term in post["tags"] + post["categories"]
+    }
+    neighbours = _neighbours(old_posts, changed_posts) | _neighbours(new_posts, changed_posts)
+
+    affected = []
+    for key, source in sorted(graph.sources.items()):
+        why = []
+        if key in changed_set:
+            why.append("changed")
+        why += [f"uses {t}" for t in sorted(source["templates"] & changed_set)]
+        for name, keys in sorted(source["data"].items()):
+            hit = changed_keys.get(name, set())
+            if hit and (ALL in keys or ALL in hit or keys & hit):
+                why.append(f"reads _data/{name}")
+        if changed_posts and source["lists_posts"]:
+            why.append("lists posts")
+        if changed_posts and source["lists_tags"] and (not source["terms"] or shared_terms & set(source["terms"])):
+            why.append("shares a tag or category with a changed post")
+        if source["neighbours"] and key in neighbours:
+            why.append("next to a changed post")
+        if why:
+            affected.append({"path": key, "url": source["url"], "why": why})
+
+    urls = {key: source["url"] for key, source in graph.sources.items()}
+    removed_urls = sorted({url for key, url in manifest.get("urls", {}).items() if url and urls.get(key) != url} - set(urls.values()))
+    if graph.sources and len(affected) > full_ratio * len(graph.sources):
+        reasons.append(f"{len(affected)} of {len(graph.sources)} pages affected")
+    return {
+        "mode": "full" if reasons else "incremental",
+        "reasons": reasons,
+        "changed": changed,
+        "affected": affected,
+        "removed_urls": removed_urls,
+    }
+
+
+def apply_mtimes(graph: SiteGraph, manifest: dict, report: dict) -> tuple[int, int]:
+    """Give unchanged files their stored mtimes and touch the affected pages; returns both counts."""
+    restored = 0
+    for key, info in graph.files.items():
+        stored = manifest["files"].get(key)
+        if stored and stored["hash"] == info["hash"] and stored["mtime_ns"] != info["mtime_ns"]:
+            os.utime(graph.root / key, ns=(stored["mtime_ns"], stored["mtime_ns"]))
+            restored += 1
+    for entry in report["affected"]:
+        os.utime(graph.root / entry["path"])
+    return restored, len(report["affected"])
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report which pages changed since the last build and prepare an incremental build.")
+    parser.add_argument("--manifest", type=Path, default=MANIFEST_PATH)
+    parser.add_argument("--full-ratio", type=float, default=FULL_RATIO, help="Share of affected pages above which a full build is chosen.")
+    parser.add_argument("--apply", action="store_true", help="Restore unchanged mtimes and touch affected pages for `jekyll build --incremental`.")
+    parser.add_argument("--update", action="store_true", help="Store the current tree as the manifest (run after a successful build).")
+    parser.add_argument("--json", type=Path, help="Also write the report to this JSON file.")
+    parser.add_argument("--github-output", type=Path, help="Append mode= and affected= lines to this file (GitHub Actions step outputs).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    graph = SiteGraph()
+    if args.update:
+        write_if_changed(args.manifest, json.dumps(graph.manifest(), indent=1, sort_keys=True))
+        print(f"Build manifest: {len(graph.files)} files, {len(graph.sources)} pages stored in {args.manifest}")
+        return 0
+
+    manifest = load_manifest(args.manifest)
+    report = impact(graph, manifest, args.full_ratio)
+    for entry in report["affected"]:
+        print(f"{entry['url']}  ({entry['path']}: {'; '.join(entry['why'])})")
+    for url in report["removed_urls"]:
+        print(f"{url}  (removed)")
+    detail = f" ({'; '.join(report['reasons'])})" if report["reasons"] else ""
+    print(f"Build: {report['mode']}{detail}; {len(report['changed'])} sources changed, {len(report['affected'])} of {len(graph.sources)} pages affected")
+    if args.apply and report["mode"] == "incremental":
+        restored, touched = apply_mtimes(graph, manifest, report)
+        print(f"Prepared incremental build: {restored} mtimes restored, {touched} pages touched")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.github_output:
+        with args.github_output.open("a", encoding="utf-8") as handle:
+            handle.write(f"mode={report['mode']}\naffected={len(report['affected'])}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
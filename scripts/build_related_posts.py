@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter, defaultdict
+import json
+import math
+from pathlib import Path
+
+try:
+    from scripts.fsutil import write_if_changed, yaml_str
+    from scripts.post_index import INDEX_PATH, POSTS_DIR, PostIndex, jekyll_url, read_post_body
+    from scripts.text_analysis import plain_text, terms
+except ImportError:  # executed as `python scripts/build_related_posts.py`
+    from fsutil import write_if_changed, yaml_str
+    from post_index import INDEX_PATH, POSTS_DIR, PostIndex, jekyll_url, read_post_body
+    from text_analysis import plain_text, terms
+
+OUTPUT_PATH = Path("_data/related.yml")
+CACHE_PATH = Path(".cache/related.json")
+CACHE_VERSION = 1
+TOP_K = 3
+TAG_WEIGHT = 0.3
+TITLE_WEIGHT = 3
+
+
+def term_counts(path: Path, title: str) -> dict[str, int]:
+    counts = Counter(terms(plain_text(read_post_body(path))))
+    for term in terms(title):
+        counts[term] += TITLE_WEIGHT
+    return dict(counts)
+
+
+class Similarity:
+    """TF-IDF cosine blended with tag/category Jaccard overlap, over sparse vectors.
+
+    Inverted indexes over terms and labels restrict each query to posts that
+    share at least one term or label with it.
+    """
+
+    def __init__(self, docs: dict[str, dict]) -> None:
+        self.docs = docs
+        doc_freq = Counter(term for doc in docs.values() for term in doc["counts"])
+        n_docs = len(docs)
+        self.vectors: dict[str, dict[str, float]] = {}
+        self.by_term: dict[str, list[str]] = defaultdict(list)
+        self.by_label: dict[str, list[str]] = defaultdict(list)
+        for url, doc in docs.items():
+            vector = {t: tf * math.log(1 + n_docs / doc_freq[t]) for t, tf in doc["counts"].items()}
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+            self.vectors[url] = {t: w / norm for t, w in vector.items()}
+            for term in vector:
+                self.by_term[term].append(url)
+            for label in doc["labels"]:
+                self.by_label[label].append(url)
+
+    def score(self, a: str, b: str) -> float:
+        va, vb = self.vectors[a], self.vectors[b]
+        if len(vb) < len(va):
+            va, vb = vb, va
+        cosine = sum(w * vb.get(t, 0.0) for t, w in va.items())
+        la, lb = set(self.docs[a]["labels"]), set(self.docs[b]["labels"])
+        jaccard = len(la & lb) / len(la | lb) if la | lb else 0.0
+        return (1 - TAG_WEIGHT) * cosine + TAG_WEIGHT * jaccard
+
+    def top_k(self, url: str, k: int) -> list[list]:
+        candidates: set[str] = set()
+        for term in self.vectors[url]:
+            candidates.update(self.by_term[term])
+        for label in self.docs[url]["labels"]:
+            candidates.update(self.by_label[label])
+        candidates.discard(url)
+        scored = [[round(self.score(url, other), 6), other] for other in candidates]
+        return rank(scored, k)
+
+
+def rank(scored: list[list], k: int) -> list[list]:
+    return sorted((row for row in scored if row[0] > 0), key=lambda row: (-row[0], row[1]))[:k]
+
+
+def load_cache(path: Path) -> dict:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"docs": {}, "rows": {}}
+    if cache.get("version") != CACHE_VERSION:
+        return {"docs": {}, "rows": {}}
+    return cache
+
+
+def update_related(index: PostIndex, cache: dict, k: int = TOP_K, full: bool = False) -> tuple[dict, set[str]]:
+    """Refresh cached term counts and related rows; return the new cache and the rows recomputed.
+
+    Only rows for new or edited posts, and rows that listed an edited or removed
+    post, are recomputed against the whole archive. Every other row is patched
+    by scoring it against the changed posts alone. IDF weights drift slightly
+    as the archive grows; pass ``full=True`` to recompute every row.
+    """
+    old_docs = cache.get("docs", {})
+    docs: dict[str, dict] = {}
+    changed: set[str] = set()
+    for path, entry in index.posts():
+        url = jekyll_url(entry)
+        stamp = [entry["mtime_ns"], entry["size"]]
+        cached = old_docs.get(url)
+        if cached and cached["path"] == path.as_posix() and cached["stamp"] == stamp:
+            docs[url] = cached
+            continue
+        title = entry.get("title") or path.stem
+        labels = {t.lower() for t in entry.get("tags") or []}
+        labels |= {f"category:{c.lower()}" for c in entry.get("categories") or []}
+        docs[url] = {
+            "path": path.as_posix(),
+            "stamp": stamp,
+            "title": title,
+            "labels": sorted(labels),
+            "counts": term_counts(path, title),
+        }
+        changed.add(url)
+    removed = set(old_docs) - set(docs)
+
+    old_rows = {url: rows for url, rows in cache.get("rows", {}).items() if url in docs}
+    stale = changed | removed
+    if full or cache.get("top_k") != k:
+        recompute = set(docs)
+    else:
+        recompute = changed | (set(docs) - set(old_rows))
+        recompute |= {url for url, rows in old_rows.items() if any(other in stale for _, other in rows)}
+
+    similarity = Similarity(docs)
+    rows: dict[str, list[list]] = {}
+    for url in docs:
+        if url in recompute:
+            rows[url] = similarity.top_k(url, k)
+        else:
+            patched = old_rows[url] + [[round(similarity.score(url, other), 6), other] for other in changed]
+            rows[url] = rank(patched, k)
+
+    return {"version": CACHE_VERSION, "top_k": k, "docs": docs, "rows": rows}, recompute
+
+
+def render_yaml(cache: dict) -> str:
+    docs = cache["docs"]
+    lines = ["# Generated by scripts/build_related_posts.py; do not edit by hand."]
+    for url in sorted(cache["rows"]):
+        related = cache["rows"][url]
+        if not related:
+            lines.append(f"{yaml_str(url)}: []")
+            continue
+        lines.append(f"{yaml_str(url)}:")
+        for _, other in related:
+            lines.append(f"  - url: {yaml_str(other)}")
+            lines.append(f"    title: {yaml_str(docs[other]['title'])}")
+    return "\n".join(lines) + "\n"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Precompute related posts for each post into _data/related.yml.")
+    parser.add_argument("--posts-dir", type=Path, default=POSTS_DIR)
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH)
+    parser.add_argument("--top-k", type=int, default=TOP_K)
+    parser.add_argument("--full", action="store_true", help="Recompute every row instead of only rows affected by changes.")
+    parser.add_argument("--check", action="store_true", help="Write nothing; exit 1 if the output is out of date.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = PostIndex.load(args.posts_dir, INDEX_PATH)
+    index.save()
+
+    cache, recomputed = update_related(index, load_cache(args.cache), args.top_k, args.full)
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else None
+        if current != render_yaml(cache):
+            print(f"{args.output} is out of date; run python scripts/build_related_posts.py")
+            return 1
+        print(f"Related posts: {len(cache['rows'])} posts, {args.output} up to date")
+        return 0
+
+    write_if_changed(args.cache, json.dumps(cache, sort_keys=True))
+    written = write_if_changed(args.output, render_yaml(cache))
+    print(
+        f"Related posts: {len(cache['rows'])} posts, {len(recomputed)} rows recomputed, "
+        f"{args.output} {'updated' if written else 'unchanged'}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
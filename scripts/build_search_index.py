@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter, defaultdict
+import json
+from pathlib import Path
+
+try:
+    from scripts.fsutil import write_if_changed
+    from scripts.post_index import POSTS_DIR, PostIndex, jekyll_url, read_post_body
+    from scripts.text_analysis import MIN_STEM, STOPWORDS, SUFFIX_RULES, plain_text, terms
+except ImportError:  # executed as `python scripts/build_search_index.py`
+    from fsutil import write_if_changed
+    from post_index import POSTS_DIR, PostIndex, jekyll_url, read_post_body
+    from text_analysis import MIN_STEM, STOPWORDS, SUFFIX_RULES, plain_text, terms
+
+OUTPUT_DIR = Path("assets/search")
+INDEX_VERSION = 2
+SHARD_PREFIX_LEN = 2
+TITLE_WEIGHT = 3
+
+
+def shard_key(term: str) -> str:
+    return term[:SHARD_PREFIX_LEN]
+
+
+def post_term_counts(path: Path, entry: dict, cache: dict[str, tuple] | None = None) -> list[tuple[str, int]]:
+    """Sorted ``(term, tf)`` pairs for one post, reused from ``cache`` while its stamp is unchanged."""
+    stamp = (entry["mtime_ns"], entry["size"])
+    cached = cache.get(path.as_posix()) if cache is not None else None
+    if cached and cached[0] == stamp:
+        return cached[1]
+    counts = Counter(terms(plain_text(read_post_body(path))))
+    for term in terms(entry.get("title") or path.stem):
+        counts[term] += TITLE_WEIGHT
+    pairs = sorted(counts.items())
+    if cache is not None:
+        cache[path.as_posix()] = (stamp, pairs)
+    return pairs
+
+
+def load_manifest(output_dir: Path = OUTPUT_DIR) -> dict | None:
+    try:
+        return json.loads((output_dir / "manifest.json").read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def assign_ids(posts: list[tuple[Path, dict]], previous: dict | None = None) -> list[str | None]:
+    """Doc id slots for ``posts``: ``slots[doc_id]`` is the post path holding that id, or None.
+
+    Ids from the ``previous`` manifest are kept and removed posts leave their slot
+    empty; new posts are appended oldest first. A new post therefore changes only
+    the shards holding its own terms instead of renumbering every document.
+    """
+    slots = list(previous.get("paths", [])) if previous and previous.get("version") == INDEX_VERSION else []
+    live = {path.as_posix() for path, _ in posts}
+    slots = [key if key in live else None for key in slots]
+    taken = set(slots)
+    for path, _ in sorted(posts, key=lambda item: (item[1].get("date") or "", item[0].name)):
+        if path.as_posix() not in taken:
+            slots.append(path.as_posix())
+    while slots and slots[-1] is None:
+        slots.pop()
+    return slots
+
+
+def build_index(
+    posts: list[tuple[Path, dict]],
+    counts_cache: dict[str, tuple] | None = None,
+    previous: dict | None = None,
+) -> tuple[dict, dict[str, dict[str, list[int]]]]:
+    """Build the manifest and prefix-keyed shards for ``posts``.
+
+    Each shard maps a stemmed term to a flat ``[doc, tf, doc, tf, ...]`` postings
+    list; title terms count ``TITLE_WEIGHT`` times. Doc ids stay stable across
+    builds when the last manifest is passed as ``previous`` (see ``assign_ids``).
+    A long-lived caller can pass ``counts_cache`` so that only posts changed since
+    the last build are re-read.
+    """
+    by_path = {path.as_posix(): (path, entry) for path, entry in posts}
+    slots = assign_ids(posts, previous)
+    docs: list[list[str] | None] = []
+    postings: dict[str, list[int]] = defaultdict(list)
+    for doc_id, key in enumerate(slots):
+        if key is None:
+            docs.append(None)
+            continue
+        path, entry = by_path[key]
+        title = entry.get("title") or path.stem
+        docs.append([title, jekyll_url(entry), (entry.get("date") or "")[:10]])
+
+        for term, tf in post_term_counts(path, entry, counts_cache):
+            postings[term] += [doc_id, tf]
+
+    shards: dict[str, dict[str, list[int]]] = defaultdict(dict)
+    for term in sorted(postings):
+        shards[shard_key(term)][term] = postings[term]
+
+    manifest = {
+        "version": INDEX_VERSION,
+        "doc_count": len(by_path),
+        "docs": docs,
+        "paths": slots,
+        "shard_prefix": SHARD_PREFIX_LEN,
+        "shards": sorted(shards),
+        "min_stem": MIN_STEM,
+        "suffixes": SUFFIX_RULES,
+        "stopwords": sorted(STOPWORDS),
+    }
+    return manifest, shards
+
+
+def _dump(data: object) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def write_index(manifest: dict, shards: dict[str, dict], output_dir: Path = OUTPUT_DIR) -> dict[str, int]:
+    """Write manifest and shards, touching only files whose bytes change and removing stale shards."""
+    shard_dir = output_dir / "shards"
+    shard_dir.mkdir(parents=True, exist_ok=True)
+
+    stats = {"written": 0, "unchanged": 0, "removed": 0}
+    for key, shard in shards.items():
+        changed = write_if_changed(shard_dir / f"{key}.json", _dump(shard))
+        stats["written" if changed else "unchanged"] += 1
+    for stale in shard_dir.glob("*.json"):
+        if stale.stem not in shards:
+            stale.unlink()
+            stats["removed"] += 1
+
+    write_if_changed(output_dir / "manifest.json", _dump(manifest))
+    return stats
+
+
+def stale_files(manifest: dict, shards: dict[str, dict], output_dir: Path = OUTPUT_DIR) -> list[Path]:
+    """Files under ``output_dir`` that ``write_index`` would write or remove."""
+    shard_dir = output_dir / "shards"
+    expected = {output_dir / "manifest.json": _dump(manifest)}
+    expected.update((shard_dir / f"{key}.json", _dump(shard)) for key, shard in shards.items())
+    stale = [path for path, payload in expected.items() if not path.is_file() or path.read_bytes() != payload]
+    return stale + [path for path in sorted(shard_dir.glob("*.json")) if path.stem not in shards]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Build the sharded client-side search index from _posts/.")
+    parser.add_argument("--posts-dir", type=Path, default=POSTS_DIR)
+    parser.add_argument("--output-dir", type=Path, default=OUTPUT_DIR)
+    parser.add_argument("--check", action="store_true", help="Write nothing; exit 1 if the committed index is out of date.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = PostIndex.load(args.posts_dir)
+    index.save()
+
+    manifest, shards = build_index(index.posts(), previous=load_manifest(args.output_dir))
+    if args.check:
+        stale = stale_files(manifest, shards, args.output_dir)
+        for path in stale:
+            print(f"{path} is out of date; run python scripts/build_search_index.py")
+        if not stale:
+            print(f"Search index: {manifest['doc_count']} posts, {args.output_dir} up to date")
+        return 1 if stale else 0
+
+    stats = write_index(manifest, shards, args.output_dir)
+    print(
+        f"Search index: {manifest['doc_count']} posts, {len(shards)} shards "
+        f"({stats['written']} written, {stats['unchanged']} unchanged, {stats['removed']} removed)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
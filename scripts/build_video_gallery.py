@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import re
+
+try:
+    from scripts.front_matter import FrontMatterError, parse_yaml
+    from scripts.fsutil import write_if_changed, yaml_str
+except ImportError:  # executed as `python scripts/build_video_gallery.py`
+    from front_matter import FrontMatterError, parse_yaml
+    from fsutil import write_if_changed, yaml_str
+
+SOURCE_PATH = Path("_data/youtube_videos.yml")
+OUTPUT_PATH = Path("_data/video_gallery.yml")
+PAGE_SIZE = 12
+VIDEO_ID = re.compile(r"^[A-Za-z0-9_-]{11}$")
+FIELDS = ("id", "title", "description")
+
+
+def load_videos(path: Path = SOURCE_PATH) -> list[dict]:
+    try:
+        data = parse_yaml(path.read_text(encoding="utf-8").splitlines())
+    except FrontMatterError as exc:
+        raise ValueError(f"{path}: {exc}") from exc
+    if data == {}:
+        return []
+    if not isinstance(data, list):
+        raise ValueError(f"{path}: expected a list of videos")
+    return data
+
+
+def validate_videos(videos: list) -> list[str]:
+    """Return every problem with ``videos``; an empty list means the data is usable."""
+    errors = []
+    seen: dict[str, int] = {}
+    for number, video in enumerate(videos, 1):
+        if not isinstance(video, dict):
+            errors.append(f"video {number}: expected a mapping with id and title")
+            continue
+        video_id = video.get("id")
+        if not isinstance(video_id, str) or not VIDEO_ID.match(video_id):
+            errors.append(f"video {number}: id {video_id!r} is not an 11-character YouTube video id")
+        elif video_id in seen:
+            errors.append(f"video {number}: id {video_id} repeats video {seen[video_id]}")
+        else:
+            seen[video_id] = number
+        if not isinstance(video.get("title"), str) or not video["title"].strip():
+            errors.append(f"video {number}: missing title")
+        unknown = sorted(set(video) - set(FIELDS))
+        if unknown:
+            errors.append(f"video {number}: unknown fields {', '.join(unknown)}")
+    return errors
+
+
+def facade(video: dict) -> dict:
+    """Static thumbnail and player URLs for one video; the player loads only on click."""
+    video_id = video["id"]
+    return {
+        "id": video_id,
+        "title": video["title"].strip(),
+        "description": (video.get("description") or "").strip(),
+        "thumbnail": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg",
+        "thumbnail_srcset": (
+            f"https://i.ytimg.com/vi/{video_id}/mqdefault.jpg 320w, "
+            f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg 480w"
+        ),
+        "embed_url": f"https://www.youtube-nocookie.com/embed/{video_id}?autoplay=1",
+        "watch_url": f"https://www.youtube.com/watch?v={video_id}",
+    }
+
+
+def paginate(videos: list[dict], page_size: int = PAGE_SIZE) -> list[list[dict]]:
+    return [videos[start : start + page_size] for start in range(0, len(videos), page_size)]
+
+
+def render_gallery(videos: list[dict], page_size: int = PAGE_SIZE) -> str:
+    pages = paginate([facade(video) for video in videos], page_size)
+    lines = [
+        f"# Generated by scripts/build_video_gallery.py from {SOURCE_PATH}; do not edit by hand.",
+        f"total: {len(videos)}",
+        f"page_size: {page_size}",
+        f"page_count: {len(pages)}",
+        "pages:" if pages else "pages: []",
+    ]
+    for number, page in enumerate(pages, 1):
+        lines.append(f"  - number: {number}")
+        lines.append("    videos:")
+        for video in page:
+            first, *rest = video.items()
+            lines.append(f"      - {first[0]}: {yaml_str(first[1])}")
+            lines.extend(f"        {key}: {yaml_str(value)}" for key, value in rest)
+    return "\n".join(lines) + "\n"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate _data/youtube_videos.yml and build paged, facade-ready gallery data.")
+    parser.add_argument("--source", type=Path, default=SOURCE_PATH)
+    parser.add_argument("--output", type=Path, default=OUTPUT_PATH)
+    parser.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    parser.add_argument("--check", action="store_true", help="Only validate, and fail if the output is out of date.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        videos = load_videos(args.source)
+    except ValueError as exc:
+        print(f"Error: {exc}")
+        return 1
+    errors = validate_videos(videos)
+    for error in errors:
+        print(f"Error: {args.source}: {error}")
+    if errors:
+        return 1
+
+    text = render_gallery(videos, max(1, args.page_size))
+    if args.check:
+        current = args.output.read_text(encoding="utf-8") if args.output.exists() else None
+        if current != text:
+            print(f"{args.output} is out of date; run python scripts/build_video_gallery.py")
+            return 1
+        print(f"Video gallery: {len(videos)} videos, {args.output} up to date")
+        return 0
+
+    written = write_if_changed(args.output, text)
+    print(f"Video gallery: {len(videos)} videos, {args.output} {'updated' if written else 'unchanged'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
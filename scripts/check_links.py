@@ -0,0 +1,258 @@
+"""Check the links and images referenced by posts, data files and topic templates.
+
+Every ``http(s)`` URL in _posts/*.md, _data/*.yml and _templates/topics.json
+is requested concurrently (--workers in total, at most --per-host at a time
+per host) with HEAD, falling back to GET for hosts that refuse HEAD.
+Results are cached in .cache/links.json together with the server's ETag and
+Last-Modified: a URL checked less than --ttl hours ago is not requested
+again, and a stale one is revalidated with a conditional request, so an
+unchanged resource costs a 304. Failures are always re-checked.
+
+Site-relative links and links to the site's own domain are resolved without
+the network, against the post index, the site's pages and the files on disk.
+
+    python scripts/check_links.py
+    python scripts/check_links.py --offline          # internal links only
+    python scripts/check_links.py --check --json links.json
+"""
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import json
+from pathlib import Path
+import re
+import threading
+import time
+from urllib import parse
+
+try:
+    from scripts.build_feeds import SITE_URL, collect_pages
+    from scripts.fsutil import write_if_changed
+    from scripts.http_client import HttpClient
+    from scripts.post_index import INDEX_PATH, POSTS_DIR, PostIndex, jekyll_url
+except ImportError:  # executed as `python scripts/check_links.py`
+    from build_feeds import SITE_URL, collect_pages
+    from fsutil import write_if_changed
+    from http_client import HttpClient
+    from post_index import INDEX_PATH, POSTS_DIR, PostIndex, jekyll_url
+
+CACHE_PATH = Path(".cache/links.json")
+CACHE_VERSION = 1
+SOURCE_GLOBS = ("_posts/*.md", "_data/*.yml", "_templates/topics.json")
+TTL_HOURS = 24 * 7
+WORKERS = 8
+PER_HOST = 2
+TIMEOUT = 10.0
+MAX_REDIRECTS = 5
+USER_AGENT = "weso-blog-link-checker/1.0 (+https://blog.wesoamochildcancer.app)"
+# Statuses some hosts return for HEAD while serving GET normally.
+HEAD_REFUSED = {403, 405, 501}
+
+# Possessive, so a URL cut short by Liquid (``https://x/{{ page.url }}``) is skipped rather than truncated.
+_EXTERNAL = re.compile(r"https?://[^\s\"'<>()\[\]{}|\\^`]++(?!\{)")
+# Markdown link targets, href/src attributes, and YAML scalars (keys or values) that start with one "/".
+_INTERNAL = re.compile(r"""(?:\]\(|\b(?:href|src)=["']|^\s*(?:[\w-]+:\s*)?["']?)(/(?!/)[^\s"'<>(){}#?]*)""", re.MULTILINE)
+
+
+def source_files(root: Path = Path(".")) -> list[Path]:
+    return sorted(path for pattern in SOURCE_GLOBS for path in root.glob(pattern))
+
+
+def extract_links(paths: list[Path]) -> dict[str, list[str]]:
+    """Map each URL found in ``paths`` to the ``file:line`` locations that reference it."""
+    links: dict[str, list[str]] = defaultdict(list)
+    for path in paths:
+        for number, line in enumerate(path.read_text(encoding="utf-8").splitlines(), 1):
+            found = [url.rstrip(".,;:!") for url in _EXTERNAL.findall(line)] + _INTERNAL.findall(line)
+            for url in dict.fromkeys(found):
+                links[url].append(f"{path.as_posix()}:{number}")
+    return dict(links)
+
+
+def internal_path(url: str, site_url: str = SITE_URL) -> str | None:
+    """Site-relative path of ``url`` if it points at this site, else None."""
+    if url.startswith("/"):
+        return parse.unquote(url)
+    prefix = site_url.rstrip("/")
+    if url == prefix or url.startswith(prefix + "/"):
+        return parse.unquote(parse.urlsplit(url).path) or "/"
+    return None
+
+
+class InternalResolver:
+    """Answer whether a site-relative path exists, from the post index, the pages and the source tree."""
+
+    def __init__(self, index: PostIndex, pages: list[str], root: Path = Path(".")) -> None:
+        self.root = root
+        self.urls = set(pages)
+        for _, entry in index.posts():
+            if entry.get("date") or entry.get("permalink"):
+                self.urls.add(jekyll_url(entry))
+
+    def exists(self, path: str) -> bool:
+        path = path.split("#", 1)[0].split("?", 1)[0] or "/"
+        # Pages serve with or without ".html" and with or without a trailing slash.
+        variants = {path, path.rstrip("/") + "/", path.removesuffix(".html"), path + ".html"}
+        if variants & self.urls:
+            return True
+        target = self.root / path.lstrip("/")
+        return target.is_file() or (target / "index.html").is_file() or (target / "index.md").is_file()
+
+
+def load_cache(path: Path = CACHE_PATH) -> dict:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": CACHE_VERSION, "urls": {}}
+    if cache.get("version") != CACHE_VERSION:
+        return {"version": CACHE_VERSION, "urls": {}}
+    return cache
+
+
+def is_fresh(entry: dict | None, now: float, ttl: float) -> bool:
+    return bool(entry) and entry["ok"] and now - entry["checked"] < ttl
+
+
+class LinkChecker:
+    """Check external URLs on a thread pool, with one keep-alive client per thread and a per-host limit."""
+
+    def __init__(self, workers: int = WORKERS, per_host: int = PER_HOST, timeout: float = TIMEOUT) -> None:
+        self.workers = workers
+        self.per_host = per_host
+        self.timeout = timeout
+        self._local = threading.local()
+        self._clients: list[HttpClient] = []
+        self._hosts: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _client(self) -> HttpClient:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = HttpClient(connect_timeout=self.timeout, read_timeout=self.timeout)
+            with self._lock:
+                self._clients.append(client)
+        return client
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = parse.urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+            return self._hosts[host]
+
+    def _request(self, method: str, url: str, headers: dict[str, str]) -> tuple[int, dict]:
+        with self._host_slot(url):
+            with self._client().stream(method, url, headers=headers) as response:
+                # The body is never read; the client drops the connection if one was sent.
+                return response.status, response.headers
+
+    def check(self, url: str, previous: dict | None = None) -> dict:
+        """Request ``url`` (revalidating ``previous`` when it has validators) and return its cache entry."""
+        headers = {"User-Agent": USER_AGENT, "Accept": "*/*"}
+        if previous and previous.get("ok"):
+            if previous.get("etag"):
+                headers["If-None-Match"] = previous["etag"]
+            if previous.get("last_modified"):
+                headers["If-Modified-Since"] = previous["last_modified"]
+        target = url
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                status, response_headers = self._request("HEAD", target, headers)
+                if status in HEAD_REFUSED:
+                    status, response_headers = self._request("GET", target, headers)
+                location = response_headers.get("Location")
+                if status in (301, 302, 303, 307, 308) and location:
+                    target = parse.urljoin(target, location)
+                    continue
+                break
+        except (OSError, ValueError) as exc:  # DNS, refused connections, timeouts, TLS, bad schemes
+            return {"ok": False, "status": 0, "error": f"{type(exc).__name__}: {exc}", "checked": time.time()}
+
+        if status == 304:
+            return {**previous, "status": 304, "checked": time.time()}
+        entry = {"ok": 200 <= status < 300, "status": status, "checked": time.time()}
+        if target != url:
+            entry["final_url"] = target
+        if entry["ok"]:
+            if response_headers.get("ETag"):
+                entry["etag"] = response_headers["ETag"]
+            if response_headers.get("Last-Modified"):
+                entry["last_modified"] = response_headers["Last-Modified"]
+        return entry
+
+    def check_all(self, urls: list[str], cache: dict, ttl: float, now: float | None = None) -> tuple[dict, list[str]]:
+        """Return ``cache`` updated for ``urls`` and the URLs that were requested.
+
+        Entries for URLs no longer referenced are dropped.
+        """
+        now = time.time() if now is None else now
+        old = cache.get("urls", {})
+        entries = {url: old[url] for url in urls if url in old}
+        stale = [url for url in urls if not is_fresh(old.get(url), now, ttl)]
+        if stale:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for url, entry in zip(stale, pool.map(lambda u: self.check(u, old.get(u)), stale)):
+                    entries[url] = entry
+        return {"version": CACHE_VERSION, "urls": dict(sorted(entries.items()))}, stale
+
+    def close(self) -> None:
+        for client in self._clients:
+            client.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check links and images in _posts/, _data/ and the topic templates.")
+    parser.add_argument("--posts-dir", type=Path, default=POSTS_DIR)
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH)
+    parser.add_argument("--ttl", type=float, default=TTL_HOURS, help="Hours before a working URL is checked again.")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Concurrent requests in total.")
+    parser.add_argument("--per-host", type=int, default=PER_HOST, help="Concurrent requests per host.")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT, help="Connect and read timeout in seconds.")
+    parser.add_argument("--offline", action="store_true", help="Only resolve internal links; make no requests.")
+    parser.add_argument("--json", type=Path, help="Also write the failures to this JSON file.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any link is broken.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = PostIndex.load(args.posts_dir, INDEX_PATH)
+    index.save()
+    links = extract_links(source_files())
+    resolver = InternalResolver(index, collect_pages())
+
+    failures = []
+    internal = {url: internal_path(url) for url in links}
+    for url, path in internal.items():
+        if path is not None and not resolver.exists(path):
+            failures.append({"url": url, "status": "missing", "sources": links[url]})
+
+    external = sorted(url for url, path in internal.items() if path is None)
+    requested: list[str] = []
+    if not args.offline:
+        checker = LinkChecker(args.workers, args.per_host, args.timeout)
+        try:
+            cache, requested = checker.check_all(external, load_cache(args.cache), args.ttl * 3600)
+        finally:
+            checker.close()
+        write_if_changed(args.cache, json.dumps(cache, indent=1, sort_keys=True))
+        for url in external:
+            entry = cache["urls"][url]
+            if not entry["ok"]:
+                failures.append({"url": url, "status": entry.get("error") or entry["status"], "sources": links[url]})
+
+    for failure in failures:
+        print(f"{failure['status']}: {failure['url']}")
+        for source in failure["sources"]:
+            print(f"  {source}")
+    checked = "not checked (--offline)" if args.offline else f"{len(requested)} requested, {len(external) - len(requested)} cached"
+    print(f"Links: {len(links) - len(external)} internal, {len(external)} external ({checked}), {len(failures)} broken")
+    if args.json:
+        args.json.write_text(json.dumps(failures, indent=2) + "\n", encoding="utf-8")
+    return 1 if args.check and failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
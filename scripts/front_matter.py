@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import IO, Iterable, Iterator
+
+try:
+    from scripts.metrics import METRICS
+except ImportError:  # executed from the scripts/ directory
+    from metrics import METRICS
+
+FENCE = "---"
+
+
+class FrontMatterError(ValueError):
+    pass
+
+
+def _strip_comment(value: str) -> str:
+    if value.startswith(("'", '"')):
+        return value
+    cut = value.find(" #")
+    return value[:cut].rstrip() if cut != -1 else value
+
+
+def parse_scalar(value: str) -> str | None:
+    value = _strip_comment(value.strip())
+    if not value or value == "~" or value == "null":
+        return None
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value[1:-1]
+    if len(value) >= 2 and value[0] == value[-1] == "'":
+        return value[1:-1].replace("''", "'")
+    return value
+
+
+def _split_flow(inner: str) -> Iterator[str]:
+    item: list[str] = []
+    quote = ""
+    for ch in inner:
+        if quote:
+            item.append(ch)
+            if ch == quote:
+                quote = ""
+        elif ch in "'\"":
+            quote = ch
+            item.append(ch)
+        elif ch == ",":
+            yield "".join(item)
+            item = []
+        else:
+            item.append(ch)
+    yield "".join(item)
+
+
+def parse_value(value: str) -> object:
+    stripped = _strip_comment(value.strip())
+    if stripped.startswith("[") and stripped.endswith("]"):
+        return [parse_scalar(item) for item in _split_flow(stripped[1:-1]) if item.strip()]
+    return parse_scalar(stripped)
+
+
+def _indent(line: str) -> int:
+    return len(line) - len(line.lstrip(" "))
+
+
+def _is_item(content: str) -> bool:
+    return content == "-" or content.startswith("- ")
+
+
+def _quote_end(content: str) -> int | None:
+    quote = content[0]
+    pos = 1
+    while pos < len(content):
+        ch = content[pos]
+        if quote == '"' and ch == "\\":
+            pos += 2
+            continue
+        if ch == quote:
+            if quote == "'" and content[pos + 1 : pos + 2] == "'":
+                pos += 2
+                continue
+            return pos
+        pos += 1
+    return None
+
+
+def _split_entry(content: str) -> tuple[str, str] | None:
+    """Split ``key: value`` into key and raw value; ``None`` if ``content`` is not a mapping entry."""
+    if not content or content[0] == "[":
+        return None
+    if content[0] in "'\"":
+        end = _quote_end(content)
+        if end is None:
+            return None
+        rest = content[end + 1 :]
+        if rest != ":" and not rest.startswith(": "):
+            return None
+        return parse_scalar(content[: end + 1]) or "", rest[1:]
+    if ": " not in content and not content.endswith(":"):
+        return None
+    key, _, value = content.partition(":")
+    return key.strip(), value
+
+
+def parse_yaml(lines: Iterable[str]) -> dict | list:
+    """Parse the small YAML subset used by post front matter and ``_data`` files.
+
+    Supports plain, single- and double-quoted scalars and keys, flow lists such as
+    ``tags: [a, "b, c"]``, block lists (including lists of maps), and maps
+    nested by indentation like the ``seo:`` block ``build_post`` writes.
+    Scalars are returned as strings; anchors, multi-line strings and other
+    YAML features are rejected or left as plain text.
+    """
+    content_lines = []
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        if line.strip() and not line.lstrip().startswith("#"):
+            content_lines.append(line)
+
+    root: dict | list = [] if content_lines and _is_item(content_lines[0].strip()) else {}
+    # Stack frames are (indent of the frame's entries, container).
+    stack: list[tuple[int, dict | list]] = [(-1, root)]
+    pending: tuple[dict, str, int] | None = None
+
+    for line in content_lines:
+        indent = _indent(line)
+        content = line.strip()
+
+        if pending is not None:
+            parent, key, parent_indent = pending
+            pending = None
+            if indent > parent_indent or (indent == parent_indent and _is_item(content)):
+                child: dict | list = [] if _is_item(content) else {}
+                parent[key] = child
+                stack.append((indent, child))
+
+        while len(stack) > 1:
+            frame_indent, frame = stack[-1]
+            closes_list = indent == frame_indent and isinstance(frame, list) and not _is_item(content)
+            if indent >= frame_indent and not closes_list:
+                break
+            stack.pop()
+        container = stack[-1][1]
+
+        if _is_item(content):
+            if not isinstance(container, list):
+                raise FrontMatterError(f"Unexpected list item: {line!r}")
+            rest = content[1:].strip()
+            if _split_entry(rest) is None:
+                container.append(parse_value(rest))
+                continue
+            item: dict = {}
+            container.append(item)
+            indent += len(content) - len(rest)
+            stack.append((indent, item))
+            container, content = item, rest
+
+        entry = _split_entry(content)
+        if not isinstance(container, dict) or entry is None:
+            raise FrontMatterError(f"Could not parse YAML line: {line!r}")
+        key, value = entry
+        if value.strip():
+            container[key] = parse_value(value)
+        else:
+            container[key] = None
+            pending = (container, key, indent)
+
+    return root
+
+
+def parse_front_matter_lines(lines: Iterable[str]) -> dict:
+    """Parse front-matter lines (without the ``---`` fences) into nested dicts and lists."""
+    data = parse_yaml(lines)
+    if not isinstance(data, dict):
+        raise FrontMatterError("Front matter must be a mapping.")
+    return data
+
+
+def read_front_matter(handle: IO[bytes]) -> dict | None:
+    """Read front matter from a binary handle positioned at the start of a post.
+
+    Leaves the handle at the first body line and never reads past it. Returns
+    ``None`` (with the handle rewound) if the post has no front matter, and
+    raises ``FrontMatterError`` if the block is unclosed or malformed.
+    """
+    start = handle.tell()
+    first = handle.readline().decode("utf-8-sig").rstrip("\r\n")
+    if first != FENCE:
+        handle.seek(start)
+        return None
+
+    lines = []
+    while True:
+        raw = handle.readline()
+        if not raw:
+            raise FrontMatterError("Could not find the closing front matter fence.")
+        line = raw.decode("utf-8")
+        if line.rstrip("\r\n") == FENCE:
+            break
+        lines.append(line)
+    return parse_front_matter_lines(lines)
+
+
+class PostFile:
+    """A post whose front matter is parsed up front and whose body is read lazily.
+
+    Only the header is read on construction; ``iter_body`` reopens the file at
+    the recorded body offset and streams the rest.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with path.open("rb") as handle:
+            self.front_matter = read_front_matter(handle) or {}
+            self.body_offset = handle.tell()
+        METRICS.count("bytes_read", self.body_offset)
+
+    def get(self, key: str, default: object = None) -> object:
+        return self.front_matter.get(key, default)
+
+    def iter_body(self) -> Iterator[str]:
+        read = 0
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(self.body_offset)
+                for raw in handle:
+                    read += len(raw)
+                    yield raw.decode("utf-8")
+        finally:
+            METRICS.count("bytes_read", read)
+
+    def read_body(self) -> str:
+        return "".join(self.iter_body())
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+
+def yaml_str(value: str) -> str:
+    """Quote ``value`` for a generated ``_data/*.yml`` file."""
+    # JSON string literals are valid double-quoted YAML scalars.
+    return json.dumps(value, ensure_ascii=False)
+
+
+def write_if_changed(path: Path, data: str | bytes) -> bool:
+    """Atomically write ``data`` (text is UTF-8 encoded) to ``path`` unless it already holds it; True if written.
+
+    Leaving unchanged files alone keeps their mtimes, so Jekyll's incremental
+    build and ``jekyll serve`` do not regenerate pages that read them.
+    """
+    payload = data.encode("utf-8") if isinstance(data, str) else data
+    try:
+        if path.read_bytes() == payload:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, path)
+    return True
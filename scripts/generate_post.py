@@ -1,34 +1,46 @@
 from __future__ import annotations
 
 import argparse
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+import hashlib
+import json
+import os
 from pathlib import Path
-import re
+import tempfile
+
+try:
+    from scripts.metrics import METRICS, add_instrumentation_args, run_instrumented
+    from scripts.near_duplicates import NearDuplicateIndex, load_detector, signature
+    from scripts.post_index import PostIndex
+    from scripts.slugs import SlugRegistry, slugify
+except ImportError:  # executed as `python scripts/generate_post.py`
+    from metrics import METRICS, add_instrumentation_args, run_instrumented
+    from near_duplicates import NearDuplicateIndex, load_detector, signature
+    from post_index import PostIndex
+    from slugs import SlugRegistry, slugify
 
 POSTS_DIR = Path("_posts")
+TOPIC_CATALOG_PATH = Path(__file__).resolve().parent.parent / "_templates" / "topics.json"
 
-
-def slugify(text: str) -> str:
-    text = text.strip().lower()
-    text = re.sub(r"[^a-z0-9\s-]", "", text)
-    text = re.sub(r"\s+", "-", text)
-    text = re.sub(r"-+", "-", text)
-    return (text[:90].strip("-") or "post")
+_RENDERED_BODIES: dict[str, str] = {}
 
 
 def build_post(
     title: str,
-    excerpt: str,
+    excerpt: str | None,
     category: str,
     tags: list[str],
-    image_url: str,
-    image_alt: str,
-    permalink_slug: str,
-    seo_title: str,
-    seo_description: str,
+    image_url: str | None,
+    image_alt: str | None,
+    permalink_slug: str | None,
+    seo_title: str | None,
+    seo_description: str | None,
     body: str,
     publish_date: str,
 ) -> str:
+    """Render a post; optional fields passed as None are left out (as in hand-written posts)."""
     tag_string = ", ".join(tags)
 
     fm = [
@@ -38,16 +50,22 @@ def build_post(
         f"date: {publish_date}",
         f"tags: [{tag_string}]",
         f"categories: [{category}]",
-        f'excerpt: "{excerpt}"',
-        f"image: {image_url}",
-        f'image_alt: "{image_alt}"',
-        f"permalink: /{permalink_slug}/",
-        "seo:",
-        f'  title: "{seo_title}"',
-        f'  description: "{seo_description}"',
-        "---",
-        "",
     ]
+    if excerpt is not None:
+        fm.append(f'excerpt: "{excerpt}"')
+    if image_url is not None:
+        fm.append(f"image: {image_url}")
+    if image_alt is not None:
+        fm.append(f'image_alt: "{image_alt}"')
+    if permalink_slug is not None:
+        fm.append(f"permalink: /{permalink_slug}/")
+    if seo_title is not None or seo_description is not None:
+        fm.append("seo:")
+        if seo_title is not None:
+            fm.append(f'  title: "{seo_title}"')
+        if seo_description is not None:
+            fm.append(f'  description: "{seo_description}"')
+    fm += ["---", ""]
     return "\n".join(fm) + body.strip() + "\n"
 
 
@@ -90,90 +108,28 @@ def build_structured_body(
     return "\n".join(lines)
 
 
+def render_body(spec: dict) -> str:
+    """Render a ``build_structured_body`` spec, memoized by the spec's content hash."""
+    key = hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+    body = _RENDERED_BODIES.get(key)
+    if body is None:
+        body = _RENDERED_BODIES[key] = build_structured_body(**spec)
+    return body
+
+
+@lru_cache(maxsize=None)
+def load_topic_catalog(path: Path = TOPIC_CATALOG_PATH) -> dict:
+    raw = path.read_bytes()
+    METRICS.count("bytes_read", len(raw))
+    return json.loads(raw)
+
+
 def awareness_body() -> str:
-    return build_structured_body(
-        intro_heading="Why childhood cancer awareness matters",
-        intro_lines=[
-            "Early recognition can reduce delays in treatment and improve outcomes.",
-            "Communities, schools, and faith groups all play a role in sharing life-saving information.",
-        ],
-        sections=[
-            {
-                "title": "Know common warning signs",
-                "explanation": ["Persistent symptoms should be checked by a health professional as early as possible."],
-                "examples": [
-                    "Unexplained weight loss or prolonged fever",
-                    "Frequent unexplained bruising or bleeding",
-                    "Persistent headaches, vomiting, or unusual swelling",
-                ],
-            },
-            {
-                "title": "Act quickly and seek care",
-                "explanation": ["Timely referral to a hospital can make a major difference for the child and family."],
-                "examples": [
-                    "Encourage parents to visit qualified health facilities",
-                    "Help families access referral information and transport options",
-                ],
-            },
-        ],
-        quick_points=[
-            "Awareness can reduce late diagnosis.",
-            "Simple community education saves time and stress for families.",
-            "Trusted local voices help break myths and fear.",
-        ],
-        action_items=[
-            "Share one verified awareness message this week.",
-            "Invite a health professional for a short community talk.",
-            "Support outreach campaigns in schools and churches/mosques.",
-        ],
-        final_lines=[
-            "When we spread accurate information, families can seek help earlier.",
-            "Awareness is one of the most powerful forms of support we can offer.",
-        ],
-    )
+    return render_body(load_topic_catalog()["bodies"]["awareness"])
 
 
 def support_body() -> str:
-    return build_structured_body(
-        intro_heading="Supporting treatment journeys with dignity",
-        intro_lines=[
-            "Families facing childhood cancer often carry medical, emotional, and financial burdens at once.",
-            "Practical support can ease pressure and help children stay on treatment.",
-        ],
-        sections=[
-            {
-                "title": "Welfare and emergency support",
-                "explanation": ["Small interventions can prevent interruptions in treatment and reduce distress."],
-                "examples": [
-                    "Transport support for hospital visits",
-                    "Essential supplies for children in treatment",
-                    "Emergency relief for urgent family needs",
-                ],
-            },
-            {
-                "title": "Parent counselling and emotional care",
-                "explanation": ["Parents need safe spaces to process difficult diagnoses and care decisions."],
-                "examples": [
-                    "Counselling check-ins during treatment",
-                    "Guidance and referrals where needed",
-                ],
-            },
-        ],
-        quick_points=[
-            "Compassion and privacy are central to our work.",
-            "Family wellbeing influences treatment consistency.",
-            "Long-term follow-up supports recovery and reintegration.",
-        ],
-        action_items=[
-            "Donate toward welfare and treatment support.",
-            "Volunteer skills for outreach, counselling support, or logistics.",
-            "Partner with us on hospital child welfare projects.",
-        ],
-        final_lines=[
-            "No parent should walk this journey alone.",
-            "Together, we can provide hope, dignity, and practical support.",
-        ],
-    )
+    return render_body(load_topic_catalog()["bodies"]["support"])
 
 
 def week_index_utc() -> int:
@@ -181,131 +137,14 @@ def week_index_utc() -> int:
 
 
 def get_topic_for_week(week_index: int) -> dict:
-    topics = [
-        {
-            "title": "Early Signs of Childhood Cancer Every Parent Should Know",
-            "excerpt": "A practical guide to warning signs and why early hospital care matters.",
-            "category": "Awareness",
-            "tags": ["childhood cancer", "awareness", "ghana", "parents"],
-            "image": "https://images.pexels.com/photos/6753163/pexels-photo-6753163.jpeg",
-            "image_alt": "Doctor speaking with parent and child in a clinic",
-            "seo_title": "Early Signs of Childhood Cancer: Parent Awareness Guide",
-            "seo_description": "Learn key warning signs of childhood cancer and how early action can support better outcomes for children.",
-            "permalink_slug": "early-signs-of-childhood-cancer-parents-guide",
-            "body": awareness_body(),
-        },
-        {
-            "title": "Hope, Dignity, and Support for Children Fighting Cancer",
-            "excerpt": "How compassionate welfare support helps children and families through treatment.",
-            "category": "Support",
-            "tags": ["childhood cancer", "support", "welfare", "ghana"],
-            "image": "https://images.pexels.com/photos/7551674/pexels-photo-7551674.jpeg",
-            "image_alt": "Caregiver comforting a child",
-            "seo_title": "Hope and Dignity for Children Fighting Cancer in Ghana",
-            "seo_description": "See how welfare and emotional support can reduce burden for children in treatment and their families.",
-            "permalink_slug": "hope-dignity-support-for-children-fighting-cancer",
-            "body": support_body(),
-        },
-        {
-            "title": "Why Childhood Cancer Awareness Campaigns Save Lives",
-            "excerpt": "Community awareness helps families recognize symptoms early and seek care quickly.",
-            "category": "Awareness",
-            "tags": ["awareness", "community", "childhood cancer", "ghana"],
-            "image": "https://images.pexels.com/photos/6646917/pexels-photo-6646917.jpeg",
-            "image_alt": "Community health education session",
-            "seo_title": "Childhood Cancer Awareness Campaigns in Ghana",
-            "seo_description": "Understand why community campaigns are critical for early detection and timely hospital referral.",
-            "permalink_slug": "childhood-cancer-awareness-campaigns-save-lives",
-            "body": awareness_body(),
-        },
-        {
-            "title": "Financial and Welfare Support: What Families Need Most",
-            "excerpt": "A look at practical needs families face during childhood cancer treatment.",
-            "category": "Support",
-            "tags": ["financial support", "welfare", "families", "childhood cancer"],
-            "image": "https://images.pexels.com/photos/4386466/pexels-photo-4386466.jpeg",
-            "image_alt": "Parent and child holding hands in hospital",
-            "seo_title": "Financial and Welfare Support for Childhood Cancer Families",
-            "seo_description": "Explore priority welfare and financial needs for families caring for children undergoing cancer treatment.",
-            "permalink_slug": "financial-welfare-support-for-families",
-            "body": support_body(),
-        },
-        {
-            "title": "Standing with Parents Through Difficult Diagnoses",
-            "excerpt": "Why counselling and emotional support matter for parents and caregivers.",
-            "category": "Counselling",
-            "tags": ["counselling", "parents", "emotional support", "ghana"],
-            "image": "https://images.pexels.com/photos/7176305/pexels-photo-7176305.jpeg",
-            "image_alt": "Counsellor supporting a parent",
-            "seo_title": "Parent Counselling and Emotional Support in Childhood Cancer",
-            "seo_description": "Learn how counselling support helps parents cope, make decisions, and sustain care for their children.",
-            "permalink_slug": "standing-with-parents-through-difficult-diagnoses",
-            "body": support_body(),
-        },
-        {
-            "title": "Survivor Follow-Up: Life After Childhood Cancer Treatment",
-            "excerpt": "Follow-up support helps survivors heal, grow in confidence, and reintegrate.",
-            "category": "Survivorship",
-            "tags": ["survivor follow-up", "childhood cancer", "reintegration", "ghana"],
-            "image": "https://images.pexels.com/photos/3768166/pexels-photo-3768166.jpeg",
-            "image_alt": "Young survivor smiling outdoors",
-            "seo_title": "Survivor Follow-Up Support After Childhood Cancer",
-            "seo_description": "Discover why survivor follow-up is essential for emotional wellbeing, confidence, and reintegration.",
-            "permalink_slug": "survivor-follow-up-after-childhood-cancer-treatment",
-            "body": support_body(),
-        },
-        {
-            "title": "Hospital Child Welfare Projects That Bring Comfort",
-            "excerpt": "How child-focused hospital projects improve dignity and comfort during treatment.",
-            "category": "Projects",
-            "tags": ["hospital projects", "child welfare", "support", "ghana"],
-            "image": "https://images.pexels.com/photos/1257110/pexels-photo-1257110.jpeg",
-            "image_alt": "Colorful child-friendly hospital room",
-            "seo_title": "Hospital Child Welfare Projects for Children in Treatment",
-            "seo_description": "See how child welfare projects in hospitals can provide comfort and dignity to young patients.",
-            "permalink_slug": "hospital-child-welfare-projects-bring-comfort",
-            "body": support_body(),
-        },
-        {
-            "title": "How Volunteers Can Make a Difference for Families",
-            "excerpt": "Simple volunteer actions can reduce stress and strengthen family support systems.",
-            "category": "Get Involved",
-            "tags": ["volunteer", "community", "family support", "childhood cancer"],
-            "image": "https://images.pexels.com/photos/6646918/pexels-photo-6646918.jpeg",
-            "image_alt": "Volunteers engaging with families",
-            "seo_title": "Volunteer Support for Childhood Cancer Families",
-            "seo_description": "Learn practical ways volunteers can support children in treatment and their families in Ghana.",
-            "permalink_slug": "how-volunteers-can-make-a-difference",
-            "body": support_body(),
-        },
-        {
-            "title": "Community Partnerships for Better Childhood Cancer Care",
-            "excerpt": "Partnerships with communities and institutions expand support for children and parents.",
-            "category": "Partnerships",
-            "tags": ["partnership", "community", "awareness", "support"],
-            "image": "https://images.pexels.com/photos/3184338/pexels-photo-3184338.jpeg",
-            "image_alt": "Group partnership meeting",
-            "seo_title": "Community Partnerships for Childhood Cancer Support",
-            "seo_description": "Strong partnerships help scale awareness, welfare support, and counselling for families.",
-            "permalink_slug": "community-partnerships-for-better-childhood-cancer-care",
-            "body": awareness_body(),
-        },
-        {
-            "title": "Transparent Giving: How Donations Support Real Needs",
-            "excerpt": "Transparency builds trust and ensures support reaches children and families effectively.",
-            "category": "Donate",
-            "tags": ["donate", "transparency", "welfare", "charity"],
-            "image": "https://images.pexels.com/photos/6647037/pexels-photo-6647037.jpeg",
-            "image_alt": "Hands giving donation envelope",
-            "seo_title": "Transparent Giving for Childhood Cancer Support",
-            "seo_description": "Understand how transparent charitable giving can support practical needs for children in treatment.",
-            "permalink_slug": "transparent-giving-how-donations-support-real-needs",
-            "body": support_body(),
-        },
-    ]
+    catalog = load_topic_catalog()
+    topics = catalog["topics"]
+    topic = dict(topics[(week_index - 1) % len(topics)])
 
-    idx = (week_index - 1) % len(topics)
-    return topics[idx]
+    body = topic["body"]
+    spec = catalog["bodies"][body] if isinstance(body, str) else body
+    topic["body"] = render_body(spec)
+    return topic
 
 
 def parse_args() -> argparse.Namespace:
@@ -318,7 +157,30 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--force", action="store_true", help="Create a file even if one with the same name already exists.")
     parser.add_argument("--dry-run", action="store_true", help="Print planned filename/topic and exit without writing files.")
-    return parser.parse_args()
+    parser.add_argument(
+        "--skip-near-duplicates",
+        action="store_true",
+        help="Do not write a post whose body is a near-duplicate of an existing one (default: warn and write).",
+    )
+    parser.add_argument(
+        "--from",
+        dest="from_date",
+        help="Backfill: first publishing date in YYYY-MM-DD format; one post is planned every 7 days.",
+    )
+    parser.add_argument("--to", dest="to_date", help="Backfill: last publishing date in YYYY-MM-DD format (default: --date or today).")
+    parser.add_argument("--weeks", type=int, help="Backfill: number of weekly posts to plan (ending at --to/--date unless --from is set).")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Backfill: worker threads used to render and write posts.")
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+
+    if args.from_date or args.to_date or args.weeks:
+        if args.week_index:
+            parser.error("--week-index cannot be combined with --from/--to/--weeks")
+        if args.weeks is not None and args.weeks < 1:
+            parser.error("--weeks must be at least 1")
+        if args.from_date and args.to_date and args.weeks:
+            parser.error("use either --from/--to or --weeks with one endpoint")
+    return args
 
 
 def resolve_publish_date(raw_date: str | None) -> str:
@@ -329,42 +191,42 @@ def resolve_publish_date(raw_date: str | None) -> str:
     return raw_date
 
 
-def post_already_contains_title(title: str) -> bool:
-    escaped_title = re.escape(f'title: "{title}"')
-    title_pattern = re.compile(rf"^{escaped_title}$", re.MULTILINE)
-    for post_file in POSTS_DIR.glob("*.md"):
-        if title_pattern.search(post_file.read_text(encoding="utf-8")):
-            return True
-    return False
+def post_already_contains_title(title: str, index: PostIndex | None = None) -> bool:
+    if index is None:
+        index = PostIndex.load(POSTS_DIR)
+    return index.has_title(title)
 
 
-def main() -> int:
-    args = parse_args()
-    POSTS_DIR.mkdir(parents=True, exist_ok=True)
+def find_collision(topic: dict, index: PostIndex, claimed: set[str] | None = None) -> str | None:
+    """Return why ``topic`` would duplicate an existing or already planned post, if it would."""
+    if post_already_contains_title(topic["title"], index) or topic["title"] in (claimed or ()):
+        return f"title already exists: {topic['title']}"
+    return None
 
-    selected_week_index = args.week_index or week_index_utc()
-    topic = get_topic_for_week(selected_week_index)
 
-    publish_date = resolve_publish_date(args.date)
-    slug = slugify(topic["title"])
-    filename = f"{publish_date}-{slug}.md"
-    path = POSTS_DIR / filename
+def find_near_duplicate(sig: list[int], detector: NearDuplicateIndex) -> str | None:
+    """Describe the closest existing post whose body is a near-duplicate of ``sig``, if any."""
+    matches = detector.query(sig)
+    if not matches:
+        return None
+    score, other = matches[0]
+    return f"near-duplicate of {other} (similarity {score:.2f})"
 
-    if args.dry_run:
-        print(f"[dry-run] Week index: {selected_week_index}")
-        print(f"[dry-run] Topic: {topic['title']}")
-        print(f"[dry-run] Target file: {path}")
-        return 0
 
-    if path.exists() and not args.force:
-        print(f"Post already exists: {path}")
-        return 0
+def claim_slugs(topic: dict, slug: str, registry: SlugRegistry) -> str:
+    """Claim unique filename and permalink slugs for ``topic``; returns the filename slug.
+
+    A slug or permalink already used by a post with a different title gets a
+    ``-2``, ``-3``, ... suffix instead of overwriting or shadowing that post.
+    """
+    filename_slug = registry.claim(slug)
+    permalink_slug = topic["permalink_slug"]
+    topic["permalink_slug"] = filename_slug if permalink_slug == slug else registry.claim(permalink_slug)
+    return filename_slug
 
-    if post_already_contains_title(topic["title"]) and not args.force:
-        print(f"Post with this title already exists: {topic['title']}")
-        return 0
 
-    md = build_post(
+def render_topic(topic: dict, publish_date: str) -> str:
+    return build_post(
         title=topic["title"],
         excerpt=topic["excerpt"],
         category=topic["category"],
@@ -378,10 +240,193 @@ def main() -> int:
         publish_date=publish_date,
     )
 
-    path.write_text(md, encoding="utf-8")
+
+def write_atomic(path: Path, text: str) -> None:
+    data = text.encode("utf-8")
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    METRICS.count("bytes_written", len(data))
+
+
+def resolve_batch_dates(from_date: str | None, to_date: str | None, weeks: int | None, default_end: str) -> list[date]:
+    end = date.fromisoformat(resolve_publish_date(to_date or default_end))
+    if from_date:
+        start = date.fromisoformat(resolve_publish_date(from_date))
+        if weeks:
+            return [start + timedelta(weeks=n) for n in range(weeks)]
+    else:
+        start = end - timedelta(weeks=(weeks or 1) - 1)
+
+    if start > end:
+        raise ValueError(f"--from ({start}) is after --to ({end})")
+    return [start + timedelta(weeks=n) for n in range((end - start).days // 7 + 1)]
+
+
+def plan_batch(
+    publish_dates: list[date],
+    index: PostIndex,
+    force: bool,
+    detector: NearDuplicateIndex | None = None,
+    skip_near_duplicates: bool = False,
+) -> list[dict]:
+    """Pick a topic and target file per date, classifying each as create/skip/collision.
+
+    With a ``detector``, bodies are also compared with the archive and with
+    posts planned earlier in the batch; near-duplicates get a warning, or the
+    ``near-duplicate`` status when ``skip_near_duplicates`` is set.
+    """
+    plans = []
+    claimed: set[str] = set()
+    registry = SlugRegistry.from_index(index)
+    signatures: dict[str, list[int]] = {}
+    for publish_day in publish_dates:
+        week_index = publish_day.isocalendar().week
+        topic = get_topic_for_week(week_index)
+        publish_date = publish_day.isoformat()
+        slug = slugify(topic["title"])
+        path = POSTS_DIR / f"{publish_date}-{slug}.md"
+        plan = {"date": publish_date, "week_index": week_index, "topic": topic, "path": path, "reason": None}
+
+        if path.exists() and not force:
+            plan["status"] = "skipped"
+            plan["reason"] = "file already exists"
+        elif not force and (reason := find_collision(topic, index, claimed)):
+            plan["status"] = "colliding"
+            plan["reason"] = reason
+        else:
+            sig = None
+            if detector is not None:
+                if topic["body"] not in signatures:
+                    signatures[topic["body"]] = signature(topic["body"])
+                sig = signatures[topic["body"]]
+                plan["reason"] = find_near_duplicate(sig, detector)
+            if plan["reason"] and skip_near_duplicates:
+                plan["status"] = "near-duplicate"
+            else:
+                plan["status"] = "create"
+                claimed.add(topic["title"])
+                if not force:
+                    plan["path"] = POSTS_DIR / f"{publish_date}-{claim_slugs(topic, slug, registry)}.md"
+                if sig is not None:
+                    detector.add(plan["path"].as_posix(), sig)
+        plans.append(plan)
+    return plans
+
+
+def write_planned_post(plan: dict) -> Path:
+    with METRICS.span("render"):
+        text = render_topic(plan["topic"], plan["date"])
+    with METRICS.span("write"):
+        write_atomic(plan["path"], text)
+    return plan["path"]
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    publish_dates = resolve_batch_dates(args.from_date, args.to_date, args.weeks, resolve_publish_date(args.date))
+    with METRICS.span("scan"):
+        index = PostIndex.load(POSTS_DIR)
+    detector = None
+    if not args.force:
+        with METRICS.span("near_duplicate_check"):
+            detector = load_detector(index)
+    with METRICS.span("plan"):
+        plans = plan_batch(publish_dates, index, args.force, detector, args.skip_near_duplicates)
+
+    to_create = [plan for plan in plans if plan["status"] == "create"]
+    if args.dry_run:
+        for plan in plans:
+            print(f"[dry-run] {plan['date']} (week {plan['week_index']}): {plan['status']} {plan['path']}")
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+            for path in pool.map(write_planned_post, to_create):
+                index.update(path)
+                print(f"Created: {path}")
+    with METRICS.span("index_save"):
+        index.save()
+
+    statuses = ("create", "skipped", "colliding", "near-duplicate")
+    summary = {status: [p for p in plans if p["status"] == status] for status in statuses}
+    verb = "planned" if args.dry_run else "created"
+    print(
+        f"Backfill summary: {len(summary['create'])} {verb}, {len(summary['skipped'])} skipped, "
+        f"{len(summary['colliding'])} colliding, {len(summary['near-duplicate'])} near-duplicate"
+    )
+    for plan in summary["skipped"] + summary["colliding"] + summary["near-duplicate"]:
+        print(f"  {plan['status']}: {plan['path']} ({plan['reason']})")
+    for plan in summary["create"]:
+        if plan["reason"]:
+            print(f"  warning: {plan['path']} is a {plan['reason']}")
+    return 0
+
+
+def generate(args: argparse.Namespace) -> int:
+    POSTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    if args.from_date or args.to_date or args.weeks:
+        return run_batch(args)
+
+    selected_week_index = args.week_index or week_index_utc()
+    with METRICS.span("parse"):
+        topic = get_topic_for_week(selected_week_index)
+
+    publish_date = resolve_publish_date(args.date)
+    slug = slugify(topic["title"])
+    filename = f"{publish_date}-{slug}.md"
+    path = POSTS_DIR / filename
+
+    if args.dry_run:
+        print(f"[dry-run] Week index: {selected_week_index}")
+        print(f"[dry-run] Topic: {topic['title']}")
+        print(f"[dry-run] Target file: {path}")
+        return 0
+
+    if path.exists() and not args.force:
+        print(f"Post already exists: {path}")
+        return 0
+
+    with METRICS.span("scan"):
+        index = PostIndex.load(POSTS_DIR)
+        index.save()
+    if not args.force:
+        with METRICS.span("collision_check"):
+            collision = find_collision(topic, index)
+        if collision:
+            print(f"Post with this {collision}")
+            return 0
+        with METRICS.span("near_duplicate_check"):
+            near_duplicate = find_near_duplicate(signature(topic["body"]), load_detector(index))
+        if near_duplicate and args.skip_near_duplicates:
+            print(f"Post body is a {near_duplicate}; not writing {path}")
+            return 0
+        if near_duplicate:
+            print(f"Warning: post body is a {near_duplicate}")
+        requested = (slug, topic["permalink_slug"])
+        slug = claim_slugs(topic, slug, SlugRegistry.from_index(index))
+        if (slug, topic["permalink_slug"]) != requested:
+            print(f"Slug or permalink already in use; using {slug} and /{topic['permalink_slug']}/")
+        path = POSTS_DIR / f"{publish_date}-{slug}.md"
+
+    with METRICS.span("render"):
+        text = render_topic(topic, publish_date)
+    with METRICS.span("write"):
+        write_atomic(path, text)
+    with METRICS.span("index_save"):
+        index.update(path)
+        index.save()
     print(f"Created: {path}")
     return 0
 
 
+def main() -> int:
+    args = parse_args()
+    return run_instrumented(lambda: generate(args), args.metrics_json, args.profile)
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+import http.client
+import threading
+from typing import Iterator, Mapping
+from urllib import parse
+import zlib
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 30.0
+CHUNK_SIZE = 16 * 1024
+
+# Errors that mean a kept-alive connection was dropped by the server while idle.
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class HttpError(RuntimeError):
+    def __init__(self, status: int, url: str, body: str, headers: Mapping[str, str] | None = None) -> None:
+        super().__init__(f"HTTP {status} from {url}: {body[:300]}")
+        self.status = status
+        self.url = url
+        self.body = body
+        self.headers = headers or {}
+
+
+class HttpResponse:
+    """Streaming view of an ``http.client`` response that decodes gzip/deflate on the fly."""
+
+    def __init__(self, raw: http.client.HTTPResponse, chunk_size: int = CHUNK_SIZE) -> None:
+        self.raw = raw
+        self.status = raw.status
+        self.headers = raw.headers
+        self.chunk_size = chunk_size
+
+    def iter_bytes(self) -> Iterator[bytes]:
+        encoding = (self.headers.get("Content-Encoding") or "").lower()
+        if encoding == "gzip":
+            decoder = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        elif encoding == "deflate":
+            decoder = zlib.decompressobj()
+        else:
+            decoder = None
+
+        while True:
+            chunk = self.raw.read(self.chunk_size)
+            if not chunk:
+                break
+            yield decoder.decompress(chunk) if decoder else chunk
+        if decoder:
+            yield decoder.flush()
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return b"".join(self.iter_bytes()).decode(encoding)
+
+
+class HttpClient:
+    """Keep-alive HTTP client holding one persistent connection per host.
+
+    Requests to the same host are serialized on that host's connection; requests
+    to different hosts can run concurrently from separate threads.
+    """
+
+    def __init__(
+        self,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> None:
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.chunk_size = chunk_size
+        self._connections: dict[tuple[str, str, int | None], http.client.HTTPConnection] = {}
+        self._locks: dict[tuple[str, str, int | None], threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+
+    def _connection_for(self, scheme: str, host: str, port: int | None) -> tuple[http.client.HTTPConnection, threading.Lock]:
+        key = (scheme, host, port)
+        with self._registry_lock:
+            conn = self._connections.get(key)
+            if conn is None:
+                conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+                conn = self._connections[key] = conn_cls(host, port, timeout=self.connect_timeout)
+                self._locks[key] = threading.Lock()
+            return conn, self._locks[key]
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        read_timeout: float | None = None,
+    ) -> Iterator[HttpResponse]:
+        parts = parse.urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {url}")
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+
+        send_headers = {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+        send_headers.update(headers or {})
+        conn, lock = self._connection_for(parts.scheme, parts.hostname or "", parts.port)
+
+        with lock:
+            raw = self._send(conn, method, path, body, send_headers, read_timeout or self.read_timeout)
+            try:
+                yield HttpResponse(raw, self.chunk_size)
+            finally:
+                # A partially read body or a server-side close leaves the connection
+                # unusable; drop it so the next request reconnects.
+                if not raw.isclosed() or raw.will_close:
+                    conn.close()
+
+    def _send(
+        self,
+        conn: http.client.HTTPConnection,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        read_timeout: float,
+    ) -> http.client.HTTPResponse:
+        while True:
+            reused = conn.sock is not None
+            try:
+                if conn.sock is None:
+                    # A caller running against a deadline passes a short read timeout;
+                    # never let the connect outlast it.
+                    conn.timeout = min(self.connect_timeout, read_timeout)
+                    conn.connect()
+                conn.sock.settimeout(read_timeout)
+                conn.request(method, path, body=body, headers=headers)
+                return conn.getresponse()
+            except STALE_CONNECTION_ERRORS:
+                # Retry once on a fresh connection if an idle kept-alive one was dropped.
+                conn.close()
+                if not reused:
+                    raise
+            except Exception:
+                conn.close()
+                raise
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+        read_timeout: float | None = None,
+    ) -> tuple[int, str]:
+        with self.stream(method, url, body, headers, read_timeout) as resp:
+            text = resp.text()
+        if resp.status >= 400:
+            raise HttpError(resp.status, url, text, resp.headers)
+        return resp.status, text
+
+    def close(self) -> None:
+        with self._registry_lock:
+            for conn in self._connections.values():
+                conn.close()
+            self._connections.clear()
+            self._locks.clear()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from contextlib import contextmanager
+import cProfile
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Callable, Iterator
+
+
+class Metrics:
+    """Thread-safe timing spans and counters for one script run.
+
+    Spans are aggregated by name into a count, total and maximum duration;
+    numeric attributes set on a span (e.g. payload bytes) are summed per name.
+    """
+
+    def __init__(self) -> None:
+        self.spans: dict[str, dict] = {}
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[dict]:
+        attrs: dict = {}
+        started = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                stats = self.spans.setdefault(name, {"count": 0, "total_s": 0.0, "max_s": 0.0})
+                stats["count"] += 1
+                stats["total_s"] += elapsed
+                stats["max_s"] = max(stats["max_s"], elapsed)
+                for key, value in attrs.items():
+                    if isinstance(value, (int, float)):
+                        stats[key] = stats.get(key, 0) + value
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "spans": {
+                    name: {key: round(value, 6) if isinstance(value, float) else value for key, value in stats.items()}
+                    for name, stats in sorted(self.spans.items())
+                },
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+
+
+METRICS = Metrics()
+
+
+def add_instrumentation_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--metrics-json", type=Path, help="Write per-phase timings and byte counters to this JSON file.")
+    parser.add_argument("--profile", type=Path, help="Run under cProfile and dump the stats to this file (read with pstats).")
+
+
+def run_instrumented(run: Callable[[], int], metrics_path: Path | None = None, profile_path: Path | None = None) -> int:
+    """Call ``run`` inside a ``total`` span, optionally under cProfile, and write what was asked for."""
+    profiler = cProfile.Profile() if profile_path else None
+    if profiler:
+        profiler.enable()
+    try:
+        with METRICS.span("total"):
+            return run()
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+            print(f"cProfile stats written to {profile_path}")
+        if metrics_path:
+            metrics_path.parent.mkdir(parents=True, exist_ok=True)
+            metrics_path.write_text(json.dumps(METRICS.snapshot(), indent=2) + "\n", encoding="utf-8")
+            print(f"Metrics written to {metrics_path}")
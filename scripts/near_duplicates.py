@@ -0,0 +1,215 @@
+"""Find posts whose bodies are near-duplicates of each other.
+
+Bodies are reduced to word shingles and summarized as MinHash signatures
+(one-permutation hashing: each shingle hash lands in one of 128 bins and the
+minimum per bin is kept, so a body is hashed once rather than 128 times).
+Signatures are cached per body hash in .cache/near_duplicates.json. Locality
+sensitive hashing over signature bands limits each query to the few posts
+that share a band, so checks stay cheap as the archive grows.
+
+    python scripts/near_duplicates.py                 # report duplicate clusters
+    python scripts/near_duplicates.py --check         # exit 1 if any are found
+"""
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+import hashlib
+import json
+from pathlib import Path
+
+try:
+    from scripts.fsutil import write_if_changed
+    from scripts.post_index import INDEX_PATH, POSTS_DIR, PostIndex, read_post_body
+    from scripts.text_analysis import plain_text, tokenize
+except ImportError:  # executed as `python scripts/near_duplicates.py`
+    from fsutil import write_if_changed
+    from post_index import INDEX_PATH, POSTS_DIR, PostIndex, read_post_body
+    from text_analysis import plain_text, tokenize
+
+CACHE_PATH = Path(".cache/near_duplicates.json")
+CACHE_VERSION = 1
+SHINGLE_SIZE = 5
+BANDS = 16
+ROWS = 8
+NUM_BINS = BANDS * ROWS  # a power of two, so the low hash bits pick the bin
+BIN_BITS = NUM_BINS.bit_length() - 1
+# Estimated Jaccard similarity of shingle sets at or above which two bodies
+# count as near-duplicates. With 16 bands of 8 rows, pairs at 0.8 become
+# candidates with probability ~0.94; pairs at 0.5 only ~0.06.
+THRESHOLD = 0.8
+# Offset added per step when an empty bin borrows a neighbour's minimum; larger
+# than any binned value, so borrowed slots only match slots borrowed alike.
+_ROTATION = 1 << (64 - BIN_BITS)
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set[str]:
+    tokens = tokenize(plain_text(text))
+    if len(tokens) <= size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def signature(text: str) -> list[int]:
+    """MinHash signature of ``text``'s shingles; empty for text without words.
+
+    Empty bins are filled from the next non-empty bin (rotation
+    densification), keeping the slot-agreement estimate of Jaccard unbiased.
+    """
+    hashes = [int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big") for s in shingles(text)]
+    if not hashes:
+        return []
+    # Visiting hashes in descending order leaves the smallest value per bin.
+    mins = {h & (NUM_BINS - 1): h >> BIN_BITS for h in sorted(hashes, reverse=True)}
+    sig = []
+    for slot in range(NUM_BINS):
+        step = 0
+        while (slot + step) % NUM_BINS not in mins:
+            step += 1
+        sig.append(mins[(slot + step) % NUM_BINS] + step * _ROTATION)
+    return sig
+
+
+def similarity(a: list[int], b: list[int]) -> float:
+    """Estimated Jaccard similarity: the share of signature slots that agree."""
+    if not a or not b:
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+class NearDuplicateIndex:
+    """MinHash LSH index: signatures are bucketed per band, and only posts sharing a bucket are compared."""
+
+    def __init__(self, threshold: float = THRESHOLD) -> None:
+        self.threshold = threshold
+        self.signatures: dict[str, list[int]] = {}
+        self.buckets: list[dict[tuple, list[str]]] = [defaultdict(list) for _ in range(BANDS)]
+
+    @classmethod
+    def from_cache(cls, cache: dict, threshold: float = THRESHOLD) -> "NearDuplicateIndex":
+        detector = cls(threshold)
+        for path, info in sorted(cache["files"].items()):
+            detector.add(path, cache["signatures"][info["hash"]])
+        return detector
+
+    @staticmethod
+    def _bands(sig: list[int]):
+        for band in range(BANDS):
+            yield band, tuple(sig[band * ROWS : (band + 1) * ROWS])
+
+    def add(self, key: str, sig: list[int]) -> None:
+        self.signatures[key] = sig
+        if sig:
+            for band, rows in self._bands(sig):
+                self.buckets[band][rows].append(key)
+
+    def query(self, sig: list[int], exclude: str | None = None) -> list[tuple[float, str]]:
+        """Posts at or above the threshold, most similar first."""
+        if not sig:
+            return []
+        candidates = {key for band, rows in self._bands(sig) for key in self.buckets[band].get(rows, ())}
+        candidates.discard(exclude)
+        scored = [(round(similarity(sig, self.signatures[key]), 3), key) for key in candidates]
+        return sorted((row for row in scored if row[0] >= self.threshold), key=lambda row: (-row[0], row[1]))
+
+    def clusters(self) -> list[list[str]]:
+        """Groups of posts linked by near-duplicate pairs, largest first."""
+        parent = {key: key for key in self.signatures}
+
+        def find(key: str) -> str:
+            while parent[key] != key:
+                parent[key] = parent[parent[key]]
+                key = parent[key]
+            return key
+
+        for key, sig in self.signatures.items():
+            for _, other in self.query(sig, exclude=key):
+                parent[find(other)] = find(key)
+        groups: dict[str, list[str]] = defaultdict(list)
+        for key in sorted(self.signatures):
+            groups[find(key)].append(key)
+        return sorted((group for group in groups.values() if len(group) > 1), key=lambda group: (-len(group), group))
+
+
+def load_cache(path: Path = CACHE_PATH) -> dict:
+    try:
+        cache = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"files": {}, "signatures": {}}
+    if cache.get("version") != CACHE_VERSION:
+        return {"files": {}, "signatures": {}}
+    return cache
+
+
+def update_signatures(index: PostIndex, cache: dict) -> tuple[dict, int]:
+    """Return a cache holding a signature for every indexed post, and how many were computed.
+
+    Unchanged files (same mtime and size) are not read; edited files are
+    re-hashed, and only bodies whose hash is new get a fresh signature.
+    """
+    old_files, old_signatures = cache.get("files", {}), cache.get("signatures", {})
+    files: dict[str, dict] = {}
+    signatures: dict[str, list[int]] = {}
+    computed = 0
+    for path, entry in index.posts():
+        key = path.as_posix()
+        stamp = [entry["mtime_ns"], entry["size"]]
+        cached = old_files.get(key)
+        if cached and cached["stamp"] == stamp and cached["hash"] in old_signatures:
+            files[key] = cached
+            signatures[cached["hash"]] = old_signatures[cached["hash"]]
+            continue
+        body = read_post_body(path)
+        digest = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        files[key] = {"stamp": stamp, "hash": digest}
+        if digest not in signatures:
+            if digest in old_signatures:
+                signatures[digest] = old_signatures[digest]
+            else:
+                signatures[digest] = signature(body)
+                computed += 1
+    return {"version": CACHE_VERSION, "files": files, "signatures": signatures}, computed
+
+
+def load_detector(index: PostIndex, cache_path: Path = CACHE_PATH, threshold: float = THRESHOLD) -> NearDuplicateIndex:
+    """Bring the signature cache up to date with ``index`` and build an LSH index over it."""
+    cache, _ = update_signatures(index, load_cache(cache_path))
+    write_if_changed(cache_path, json.dumps(cache, sort_keys=True))
+    return NearDuplicateIndex.from_cache(cache, threshold)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report clusters of near-duplicate posts in _posts/.")
+    parser.add_argument("--posts-dir", type=Path, default=POSTS_DIR)
+    parser.add_argument("--cache", type=Path, default=CACHE_PATH)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="Estimated Jaccard similarity that counts as a duplicate.")
+    parser.add_argument("--json", type=Path, help="Also write the clusters to this JSON file.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any near-duplicate cluster is found.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = PostIndex.load(args.posts_dir, INDEX_PATH)
+    index.save()
+
+    cache, computed = update_signatures(index, load_cache(args.cache))
+    write_if_changed(args.cache, json.dumps(cache, sort_keys=True))
+    detector = NearDuplicateIndex.from_cache(cache, args.threshold)
+    clusters = detector.clusters()
+
+    report = []
+    for number, cluster in enumerate(clusters, 1):
+        pairs = [similarity(detector.signatures[a], detector.signatures[b]) for a in cluster for b in cluster if a < b]
+        report.append({"posts": cluster, "min_similarity": round(min(pairs), 3), "max_similarity": round(max(pairs), 3)})
+        print(f"Cluster {number}: {len(cluster)} posts, similarity {min(pairs):.2f}-{max(pairs):.2f}")
+        for path in cluster:
+            print(f"  {path}")
+    print(f"Near-duplicates: {len(cache['files'])} posts, {computed} signatures computed, {len(clusters)} clusters")
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 1 if args.check and clusters else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from urllib import parse
+
+try:
+    from scripts.front_matter import FrontMatterError, PostFile
+    from scripts.metrics import METRICS
+except ImportError:  # executed from the scripts/ directory
+    from front_matter import FrontMatterError, PostFile
+    from metrics import METRICS
+
+POSTS_DIR = Path("_posts")
+INDEX_PATH = Path(".cache/post-index.json")
+INDEX_VERSION = 5
+
+
+def slug_from_path(path: Path) -> str:
+    return re.sub(r"^\d{4}-\d{2}-\d{2}-", "", path.stem)
+
+
+def normalize_permalink(permalink: str | None) -> str | None:
+    if not permalink:
+        return None
+    return "/" + permalink.strip().strip("/") + "/"
+
+
+def post_date_from_path(path: Path) -> str | None:
+    match = re.match(r"^(\d{4}-\d{2}-\d{2})-", path.name)
+    return match.group(1) if match else None
+
+
+def jekyll_url(entry: dict) -> str:
+    """Site-relative URL Jekyll gives a post: its ``permalink``, else the default date style."""
+    if entry.get("permalink"):
+        return entry["permalink"]
+    year, month, day = (entry.get("date") or "")[:10].split("-")
+    categories = "".join(f"/{parse.quote(c.lower())}" for c in entry.get("categories") or [])
+    return f"{categories}/{year}/{month}/{day}/{entry['slug']}.html"
+
+
+def read_post_body(path: Path) -> str:
+    """Return everything after the front-matter block of ``path``."""
+    return PostFile(path).read_body()
+
+
+def _as_list(value: object) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [str(item) for item in value if item is not None]
+    return str(value).split()
+
+
+def read_front_matter_fields(path: Path) -> dict:
+    """Read the indexed front-matter fields of ``path`` without touching the body."""
+    try:
+        fm = PostFile(path).front_matter
+    except FrontMatterError as exc:
+        print(f"Warning: ignoring front matter of {path}: {exc}")
+        fm = {}
+    title = fm.get("title")
+    image = fm.get("image")
+    excerpt = fm.get("excerpt")
+    return {
+        "title": str(title) if title else None,
+        "slug": slug_from_path(path),
+        "permalink": normalize_permalink(fm.get("permalink")),
+        "date": str(fm["date"]) if fm.get("date") else post_date_from_path(path),
+        "tags": _as_list(fm.get("tags")),
+        "categories": _as_list(fm.get("categories")),
+        "image": str(image) if image else None,
+        "excerpt": str(excerpt) if excerpt else None,
+    }
+
+
+class PostIndex:
+    """Front-matter index of ``_posts`` persisted between runs.
+
+    Entries are keyed by path and revalidated by ``(mtime_ns, size)``, so only
+    new or changed posts are read, and only up to their closing ``---``.
+    """
+
+    def __init__(self, posts_dir: Path = POSTS_DIR, index_path: Path = INDEX_PATH) -> None:
+        self.posts_dir = posts_dir
+        self.index_path = index_path
+        self.entries: dict[str, dict] = {}
+        self.titles: set[str] = set()
+        self.slugs: set[str] = set()
+        self.permalinks: set[str] = set()
+        self.dirty = False
+
+    @classmethod
+    def load(cls, posts_dir: Path = POSTS_DIR, index_path: Path = INDEX_PATH) -> "PostIndex":
+        index = cls(posts_dir, index_path)
+        try:
+            stored = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            stored = {}
+        if stored.get("version") == INDEX_VERSION:
+            index.entries = stored.get("entries", {})
+        index.refresh()
+        return index
+
+    def refresh(self) -> None:
+        seen: set[str] = set()
+        for post_file in self.posts_dir.glob("*.md"):
+            key = post_file.as_posix()
+            seen.add(key)
+            self._scan(post_file)
+
+        for key in set(self.entries) - seen:
+            del self.entries[key]
+            self.dirty = True
+        self._rebuild_lookups()
+
+    def update(self, post_file: Path) -> dict:
+        entry = self._scan(post_file)
+        self._rebuild_lookups()
+        return entry
+
+    def remove(self, post_file: Path) -> None:
+        if self.entries.pop(post_file.as_posix(), None) is not None:
+            self.dirty = True
+            self._rebuild_lookups()
+
+    def _scan(self, post_file: Path) -> dict:
+        key = post_file.as_posix()
+        stat = post_file.stat()
+        entry = self.entries.get(key)
+        if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry
+
+        entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+        entry.update(read_front_matter_fields(post_file))
+        METRICS.count("posts_parsed")
+        self.entries[key] = entry
+        self.dirty = True
+        return entry
+
+    def _rebuild_lookups(self) -> None:
+        self.titles = {e["title"] for e in self.entries.values() if e.get("title")}
+        self.slugs = {e["slug"] for e in self.entries.values() if e.get("slug")}
+        self.permalinks = {e["permalink"] for e in self.entries.values() if e.get("permalink")}
+
+    def get(self, post_file: Path) -> dict | None:
+        return self.entries.get(post_file.as_posix())
+
+    def posts(self) -> list[tuple[Path, dict]]:
+        """All indexed posts, newest first by date then path."""
+        items = [(Path(key), entry) for key, entry in self.entries.items()]
+        return sorted(items, key=lambda item: (item[1].get("date") or "", item[0].name), reverse=True)
+
+    def has_title(self, title: str) -> bool:
+        return title in self.titles
+
+    def has_slug(self, slug: str) -> bool:
+        return slug in self.slugs
+
+    def has_permalink(self, permalink: str) -> bool:
+        return normalize_permalink(permalink) in self.permalinks
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        payload = {"version": INDEX_VERSION, "entries": self.entries}
+        tmp_path.write_text(json.dumps(payload, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+        self.dirty = False
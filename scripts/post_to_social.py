@@ -1,30 +1,47 @@
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from datetime import datetime, timezone
+import glob
 import json
 import os
+import queue
 import re
+import subprocess
+import threading
+import time
 from pathlib import Path
-from urllib import parse, request
-
-
-def parse_front_matter(markdown_text: str) -> dict[str, str]:
+from typing import Callable, Iterable, Iterator
+from urllib import parse
+
+try:
+    from scripts.front_matter import PostFile, parse_front_matter_lines
+    from scripts.http_client import HttpClient, HttpError
+    from scripts.metrics import METRICS, add_instrumentation_args, run_instrumented
+    from scripts.post_index import PostIndex
+    from scripts.publish_ledger import LEDGER_PATH, PostLedger, PublishLedger, content_hash
+except ImportError:  # executed as `python scripts/post_to_social.py`
+    from front_matter import PostFile, parse_front_matter_lines
+    from http_client import HttpClient, HttpError
+    from metrics import METRICS, add_instrumentation_args, run_instrumented
+    from post_index import PostIndex
+    from publish_ledger import LEDGER_PATH, PostLedger, PublishLedger, content_hash
+
+
+def parse_front_matter(markdown_text: str) -> dict:
     if not markdown_text.startswith("---\n"):
         raise ValueError("Post does not start with YAML front matter.")
 
-    try:
-        _, fm_block, body = markdown_text.split("---\n", 2)
-    except ValueError as exc:
-        raise ValueError("Could not parse front matter block.") from exc
-
-    data: dict[str, str] = {}
-    for line in fm_block.splitlines():
-        if ":" not in line:
-            continue
-        key, value = line.split(":", 1)
-        data[key.strip()] = value.strip().strip('"')
+    lines = markdown_text.splitlines(keepends=True)
+    for end, line in enumerate(lines[1:], 1):
+        if line.rstrip("\r\n") == "---":
+            break
+    else:
+        raise ValueError("Could not parse front matter block.")
 
-    data["_body"] = body.strip()
+    data = parse_front_matter_lines(lines[1:end])
+    data["_body"] = "".join(lines[end + 1 :]).strip()
     return data
 
 
@@ -33,7 +50,9 @@ def slug_from_filename(path: Path) -> str:
     return re.sub(r"^\d{4}-\d{2}-\d{2}-", "", name)
 
 
-def post_url(site_url: str, post_path: Path) -> str:
+def post_url(site_url: str, post_path: Path, permalink: str | None = None) -> str:
+    if permalink:
+        return f"{site_url.rstrip('/')}/{permalink.strip('/')}/"
     return f"{site_url.rstrip('/')}/{slug_from_filename(post_path)}/"
 
 
@@ -45,23 +64,107 @@ def excerpt_from_body(body: str, max_len: int = 220) -> str:
     return cleaned[: max_len - 1].rstrip() + "…"
 
 
-def post_json(url: str, payload: dict, headers: dict[str, str]) -> tuple[int, str]:
-    data = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=data, method="POST")
-    for k, v in headers.items():
-        req.add_header(k, v)
-    req.add_header("Content-Type", "application/json")
+DEFAULT_TIMEOUT = 30.0
+# Production API roots; each can be pointed elsewhere (e.g. scripts/social_stand_in.py)
+# with the matching *_API_BASE environment variable.
+API_BASES = {
+    "linkedin": "https://api.linkedin.com/v2",
+    "medium": "https://api.medium.com/v1",
+    "instagram": "https://graph.facebook.com/v20.0",
+}
+# 429 and 503 mean the request was not processed, so retrying cannot publish twice.
+RETRY_STATUSES = (429, 503)
+MAX_RETRIES = 3
+RETRY_BACKOFF = 1.0
+MAX_RETRY_DELAY = 30.0
+# Instagram media containers expire about 24 hours after creation; older saved
+# containers are not worth resuming.
+CONTAINER_TTL = 23 * 3600.0
+
+HTTP_CLIENT = HttpClient(read_timeout=DEFAULT_TIMEOUT)
+
 
-    with request.urlopen(req) as resp:  # noqa: S310 - trusted URLs from APIs
-        return resp.status, resp.read().decode("utf-8")
+def api_base(channel: str) -> str:
+    return os.getenv(f"{channel.upper()}_API_BASE", API_BASES[channel]).rstrip("/")
 
 
-def publish_linkedin(text: str, article_url: str, dry_run: bool) -> None:
+def retry_delay(error: HttpError, attempt: int) -> float:
+    """Seconds to wait before retrying: the server's Retry-After, else exponential backoff."""
+    try:
+        delay = float(error.headers.get("Retry-After", ""))
+    except ValueError:
+        delay = RETRY_BACKOFF * 2**attempt
+    return min(max(0.0, delay), MAX_RETRY_DELAY)
+
+
+def post_json(
+    url: str,
+    payload: dict,
+    headers: dict[str, str],
+    timeout: float = DEFAULT_TIMEOUT,
+    deadline: float | None = None,
+) -> tuple[int, str]:
+    """POST ``payload`` as JSON, retrying throttled responses.
+
+    ``deadline`` is a ``time.monotonic()`` value bounding the whole call: socket
+    timeouts are cut to the time left, a retry whose delay would pass it is not
+    attempted, and TimeoutError is raised once it has passed.
+    """
+    data = json.dumps(payload).encode("utf-8")
+    send_headers = dict(headers)
+    send_headers["Content-Type"] = "application/json"
+    attempt = 0
+    while True:
+        read_timeout = timeout
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"deadline passed before POST {url}")
+            read_timeout = min(timeout, remaining)
+        # One span per host, so each channel's HTTP latency and payload sizes add up separately.
+        with METRICS.span(f"http.{parse.urlsplit(url).netloc}") as span:
+            span["request_bytes"] = len(data)
+            try:
+                status, body = HTTP_CLIENT.request("POST", url, data, send_headers, read_timeout=read_timeout)
+                span["response_bytes"] = len(body.encode("utf-8"))
+                return status, body
+            except HttpError as exc:
+                span["response_bytes"] = len(exc.body.encode("utf-8"))
+                status, delay = exc.status, retry_delay(exc, attempt)
+                out_of_time = deadline is not None and time.monotonic() + delay >= deadline
+                if exc.status not in RETRY_STATUSES or attempt >= MAX_RETRIES or out_of_time:
+                    span["errors"] = 1
+                    raise
+                span["retries"] = 1
+        print(f"[retry] HTTP {status} from {url}; retrying in {delay:.2f}s")
+        time.sleep(delay)
+        attempt += 1
+
+
+def response_id(body: str) -> str | None:
+    """Pull the created object's id out of a LinkedIn, Medium or Graph API response."""
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return None
+    if isinstance(data.get("data"), dict):
+        data = data["data"]
+    remote_id = data.get("id")
+    return str(remote_id) if remote_id is not None else None
+
+
+def publish_linkedin(
+    text: str,
+    article_url: str,
+    dry_run: bool,
+    deadline: float | None = None,
+    ledger: PostLedger | None = None,
+) -> str:
     token = os.getenv("LINKEDIN_ACCESS_TOKEN")
     person_urn = os.getenv("LINKEDIN_PERSON_URN")
     if not token or not person_urn:
         print("[linkedin] Skipped: missing LINKEDIN_ACCESS_TOKEN or LINKEDIN_PERSON_URN")
-        return
+        return "skipped"
 
     payload = {
         "author": person_urn,
@@ -76,22 +179,33 @@ def publish_linkedin(text: str, article_url: str, dry_run: bool) -> None:
     }
     if dry_run:
         print("[linkedin] Dry run: would publish post")
-        return
+        return "dry-run"
 
     status, body = post_json(
-        "https://api.linkedin.com/v2/ugcPosts",
+        f"{api_base('linkedin')}/ugcPosts",
         payload,
         {"Authorization": f"Bearer {token}", "X-Restli-Protocol-Version": "2.0.0"},
+        deadline=deadline,
     )
     print(f"[linkedin] Published (status={status}): {body[:160]}")
-
-
-def publish_medium(title: str, content_markdown: str, article_url: str, dry_run: bool) -> None:
+    if ledger:
+        ledger.record("linkedin", "published", response_id(body))
+    return "published"
+
+
+def publish_medium(
+    title: str,
+    content_markdown: str,
+    article_url: str,
+    dry_run: bool,
+    deadline: float | None = None,
+    ledger: PostLedger | None = None,
+) -> str:
     token = os.getenv("MEDIUM_TOKEN")
     user_id = os.getenv("MEDIUM_USER_ID")
     if not token or not user_id:
         print("[medium] Skipped: missing MEDIUM_TOKEN or MEDIUM_USER_ID")
-        return
+        return "skipped"
 
     content = f"{content_markdown}\n\nOriginally published: [{article_url}]({article_url})"
     payload = {
@@ -102,75 +216,435 @@ def publish_medium(title: str, content_markdown: str, article_url: str, dry_run:
     }
     if dry_run:
         print("[medium] Dry run: would publish article")
-        return
+        return "dry-run"
 
     status, body = post_json(
-        f"https://api.medium.com/v1/users/{parse.quote(user_id)}/posts",
+        f"{api_base('medium')}/users/{parse.quote(user_id)}/posts",
         payload,
         {"Authorization": f"Bearer {token}"},
+        deadline=deadline,
     )
     print(f"[medium] Published (status={status}): {body[:160]}")
-
-
-def publish_instagram(caption: str, article_url: str, image_url: str | None, dry_run: bool) -> None:
+    if ledger:
+        ledger.record("medium", "published", response_id(body))
+    return "published"
+
+
+def saved_container(ledger: PostLedger, now: datetime | None = None) -> str | None:
+    """The media container a previous run created but never published, if it is younger than CONTAINER_TTL.
+
+    A failure record after the container does not make it unusable; a published
+    record naming it as ``creation_id`` does.
+    """
+    container = ledger.latest("instagram", "container")
+    if not container:
+        return None
+    published = ledger.latest("instagram", "published")
+    if published and published.get("creation_id") == container["remote_id"]:
+        return None
+    age = ((now or datetime.now(timezone.utc)) - datetime.fromisoformat(container["ts"])).total_seconds()
+    if age > CONTAINER_TTL:
+        print(f"[instagram] Saved media container {container['remote_id']} is {age / 3600:.0f}h old; not reusing it")
+        return None
+    return container["remote_id"]
+
+
+def publish_instagram(
+    caption: str,
+    article_url: str,
+    image_url: str | None,
+    dry_run: bool,
+    deadline: float | None = None,
+    ledger: PostLedger | None = None,
+) -> str:
     token = os.getenv("INSTAGRAM_ACCESS_TOKEN")
     account_id = os.getenv("INSTAGRAM_ACCOUNT_ID")
     if not token or not account_id:
         print("[instagram] Skipped: missing INSTAGRAM_ACCESS_TOKEN or INSTAGRAM_ACCOUNT_ID")
-        return
+        return "skipped"
     if not image_url:
         print("[instagram] Skipped: post has no `image:` URL in front matter")
-        return
+        return "skipped"
 
     final_caption = f"{caption}\n\nRead more: {article_url}"
-    create_url = f"https://graph.facebook.com/v20.0/{account_id}/media"
-    publish_url = f"https://graph.facebook.com/v20.0/{account_id}/media_publish"
+    create_url = f"{api_base('instagram')}/{account_id}/media"
+    publish_url = f"{api_base('instagram')}/{account_id}/media_publish"
 
     if dry_run:
         print("[instagram] Dry run: would create media container + publish")
-        return
+        return "dry-run"
+
+    def create_container() -> str:
+        container_payload = {
+            "image_url": image_url,
+            "caption": final_caption,
+            "access_token": token,
+        }
+        status, body = post_json(create_url, container_payload, {}, deadline=deadline)
+        creation_id = response_id(body)
+        if not creation_id:
+            raise RuntimeError(f"[instagram] Failed creating media container (status={status}): {body}")
+        if ledger:
+            ledger.record("instagram", "container", creation_id)
+        return creation_id
+
+    def media_publish(creation_id: str) -> tuple[int, str]:
+        return post_json(publish_url, {"creation_id": creation_id, "access_token": token}, {}, deadline=deadline)
+
+    creation_id = saved_container(ledger) if ledger else None
+    if creation_id:
+        print(f"[instagram] Resuming saved media container {creation_id}")
+        try:
+            status2, body2 = media_publish(creation_id)
+        except HttpError as exc:
+            # A 4xx here usually means the container expired or was rejected; start over.
+            if not 400 <= exc.status < 500 or exc.status in RETRY_STATUSES:
+                raise
+            print(f"[instagram] Saved container {creation_id} rejected (HTTP {exc.status}); creating a new one")
+            creation_id = None
+    if not creation_id:
+        creation_id = create_container()
+        status2, body2 = media_publish(creation_id)
+    print(f"[instagram] Published (status={status2}): {body2[:160]}")
+    if ledger:
+        ledger.record("instagram", "published", response_id(body2), creation_id=creation_id)
+    return "published"
+
+
+def _timed_call(publish: Callable[[float], str], deadline: float) -> tuple[str, float]:
+    started = time.perf_counter()
+    status = publish(deadline)
+    return status, time.perf_counter() - started
+
+
+def publish_channels(
+    jobs: dict[str, Callable[[float], str]],
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrent: bool = True,
+) -> list[dict]:
+    """Run each channel's publish job and report status, latency and error per channel.
+
+    Every job is called with a ``time.monotonic()`` deadline ``timeout`` seconds
+    out, which it passes on to ``post_json`` so its requests and retries stop
+    there too. In concurrent mode every channel starts at once; a channel that
+    fails or overruns is reported without holding up the others.
+    """
+    results = []
+    if not concurrent:
+        for channel, publish in jobs.items():
+            started = time.perf_counter()
+            try:
+                status, latency = _timed_call(publish, time.monotonic() + timeout)
+                results.append({"channel": channel, "status": status, "latency": latency, "error": None})
+            except TimeoutError as exc:
+                latency = time.perf_counter() - started
+                results.append({"channel": channel, "status": "timeout", "latency": latency, "error": str(exc)})
+            except Exception as exc:  # noqa: BLE001 - one channel must not stop the rest
+                latency = time.perf_counter() - started
+                results.append({"channel": channel, "status": "failed", "latency": latency, "error": str(exc)})
+        return results
+
+    pool = ThreadPoolExecutor(max_workers=max(1, len(jobs)), thread_name_prefix="publish")
+    started = time.perf_counter()
+    deadline = time.monotonic() + timeout
+    futures = {channel: pool.submit(_timed_call, publish, deadline) for channel, publish in jobs.items()}
+    try:
+        for channel, future in futures.items():
+            try:
+                status, latency = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                results.append({"channel": channel, "status": status, "latency": latency, "error": None})
+            except (FutureTimeoutError, TimeoutError) as exc:  # the wait ran out, or the job hit its deadline
+                error = str(exc) or f"timed out after {timeout:.1f}s"
+                results.append({"channel": channel, "status": "timeout", "latency": timeout, "error": error})
+            except Exception as exc:  # noqa: BLE001 - one channel must not stop the rest
+                latency = time.perf_counter() - started
+                results.append({"channel": channel, "status": "failed", "latency": latency, "error": str(exc)})
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+    return results
+
+
+CHANNELS = ("linkedin", "instagram", "medium")
+CHANNEL_CREDENTIALS = {
+    "linkedin": ("LINKEDIN_ACCESS_TOKEN", "LINKEDIN_PERSON_URN"),
+    "instagram": ("INSTAGRAM_ACCESS_TOKEN", "INSTAGRAM_ACCOUNT_ID"),
+    "medium": ("MEDIUM_TOKEN", "MEDIUM_USER_ID"),
+}
+# Conservative default publish rates (posts per minute, burst size) per channel.
+DEFAULT_RATES = {"linkedin": (10.0, 3), "instagram": (4.0, 2), "medium": (4.0, 2)}
+RATE_UNITS = {"s": 1.0, "min": 60.0, "h": 3600.0}
+
+
+class TokenBucket:
+    """Thread-safe token bucket; ``acquire`` blocks until a token is available."""
+
+    def __init__(self, rate_per_second: float, capacity: int = 1) -> None:
+        self.rate = rate_per_second
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, returning how long the caller waited for it."""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+def parse_rate(spec: str) -> tuple[str, float]:
+    """Parse ``CHANNEL=N[/s|/min|/h]`` into (channel, tokens per second); N=0 disables the limit."""
+    channel, _, rate = spec.partition("=")
+    amount, _, unit = rate.partition("/")
+    if channel not in CHANNELS or unit not in ("", *RATE_UNITS):
+        raise ValueError(f"Invalid --rate {spec!r}; expected e.g. linkedin=10/min")
+    return channel, float(amount) / RATE_UNITS[unit or "s"]
+
+
+def channel_configured(channel: str) -> bool:
+    return all(os.getenv(name) for name in CHANNEL_CREDENTIALS[channel])
+
+
+def resolve_post_paths(posts: Iterable[str], patterns: Iterable[str], diff_range: str | None) -> Iterator[Path]:
+    """Yield post paths from explicit paths, glob patterns and a git diff range, without duplicates."""
+    seen: set[str] = set()
+
+    def candidates() -> Iterator[str]:
+        yield from posts
+        for pattern in patterns:
+            yield from sorted(glob.glob(pattern))
+        if diff_range:
+            out = subprocess.run(
+                ["git", "diff", "--name-only", "--diff-filter=AM", diff_range, "--", "_posts/*.md"],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            yield from out.split()
+
+    for candidate in candidates():
+        if candidate not in seen:
+            seen.add(candidate)
+            yield Path(candidate)
+
+
+def prepare_post(post_path: Path, args: argparse.Namespace, index: PostIndex, ledger: PublishLedger) -> dict:
+    """Parse a post and build its per-channel publish jobs."""
+    if not post_path.exists():
+        raise FileNotFoundError(f"Post not found: {post_path}")
 
-    container_payload = {
-        "image_url": image_url,
-        "caption": final_caption,
-        "access_token": token,
+    with METRICS.span("parse"):
+        entry = index.update(post_path)
+        post = PostFile(post_path)
+    title = entry.get("title") or post_path.stem
+    excerpt = post.get("excerpt") or excerpt_from_body(post.read_body())
+    image_url = post.get("image")
+    url = post_url(args.site_url, post_path, entry.get("permalink"))
+
+    post_ledger = ledger.for_post(content_hash(post_path), post_path.as_posix())
+    caption = f"{title}\n\n{excerpt}"
+    jobs = {
+        "linkedin": lambda deadline: publish_linkedin(caption, url, args.dry_run, deadline, post_ledger),
+        "instagram": lambda deadline: publish_instagram(caption, url, image_url, args.dry_run, deadline, post_ledger),
+        "medium": lambda deadline: publish_medium(title, post.read_body().strip(), url, args.dry_run, deadline, post_ledger),
+    }
+    done = [] if args.force else [channel for channel in jobs if post_ledger.is_published(channel)]
+    return {
+        "path": post_path.as_posix(),
+        "ledger": post_ledger,
+        "jobs": {channel: job for channel, job in jobs.items() if channel not in done},
+        "done": done,
     }
-    status, body = post_json(create_url, container_payload, {})
-    data = json.loads(body)
-    creation_id = data.get("id")
-    if not creation_id:
-        raise RuntimeError(f"[instagram] Failed creating media container (status={status}): {body}")
 
-    status2, body2 = post_json(publish_url, {"creation_id": creation_id, "access_token": token}, {})
-    print(f"[instagram] Published (status={status2}): {body2[:160]}")
+
+def start_post(post_path: Path, prepare: Callable[[Path], dict]) -> tuple[dict | None, list[dict]]:
+    """Prepare one post and return it with its report rows so far.
+
+    A post that cannot be prepared yields ``None`` and a single failed row, so one
+    bad post never stops the batch; channels the ledger already marks published
+    yield ``already-published`` rows.
+    """
+    try:
+        post = prepare(post_path)
+    except Exception as exc:  # noqa: BLE001 - one bad post must not stop the batch
+        return None, [{"post": post_path.as_posix(), "channel": "-", "status": "failed", "latency": 0.0, "error": str(exc)}]
+    rows = [
+        {
+            "post": post["path"],
+            "channel": channel,
+            "status": "already-published",
+            "latency": 0.0,
+            "error": None,
+            "remote_id": post["ledger"].latest(channel, "published")["remote_id"],
+        }
+        for channel in post["done"]
+    ]
+    return post, rows
+
+
+def finish_job(post: dict, result: dict, dry_run: bool) -> dict:
+    """Attach ``post`` to a publish result and record failures and timeouts in its ledger."""
+    result["post"] = post["path"]
+    if not dry_run and result["status"] in ("failed", "timeout"):
+        post["ledger"].record(result["channel"], "failed", error=result["error"])
+    return result
+
+
+def publish_pipeline(
+    post_paths: Iterable[Path],
+    prepare: Callable[[Path], dict],
+    limiters: dict[str, TokenBucket],
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = 2,
+    queue_size: int = 8,
+    dry_run: bool = False,
+) -> list[dict]:
+    """Stream posts through parse -> per-channel queue -> rate-limited publish.
+
+    Each channel drains its own bounded queue with ``concurrency`` workers, taking a
+    token from its bucket before every publish, so a slow or tightly limited
+    channel never holds back the others. The bounded queues keep parsing only a
+    little ahead of publishing.
+    """
+    queues: dict[str, queue.Queue] = {channel: queue.Queue(maxsize=queue_size) for channel in CHANNELS}
+    results: list[dict] = []
+    results_lock = threading.Lock()
+
+    def add_result(result: dict) -> None:
+        with results_lock:
+            results.append(result)
+
+    def worker(channel: str) -> None:
+        while True:
+            item = queues[channel].get()
+            if item is None:
+                return
+            post, job = item
+            limiter = limiters.get(channel)
+            if limiter and not dry_run and channel_configured(channel):
+                limiter.acquire()
+            add_result(finish_job(post, publish_channels({channel: job}, timeout)[0], dry_run))
+
+    workers = [
+        threading.Thread(target=worker, args=(channel,), name=f"publish-{channel}-{n}", daemon=True)
+        for channel in CHANNELS
+        for n in range(max(1, concurrency))
+    ]
+    for thread in workers:
+        thread.start()
+
+    try:
+        for post_path in post_paths:
+            post, rows = start_post(post_path, prepare)
+            for row in rows:
+                add_result(row)
+            if post is None:
+                continue
+            for channel, job in post["jobs"].items():
+                queues[channel].put((post, job))
+    finally:
+        for channel in CHANNELS:
+            for _ in range(max(1, concurrency)):
+                queues[channel].put(None)
+        for thread in workers:
+            thread.join()
+    return results
+
+
+def print_report(results: list[dict]) -> None:
+    print("Publish report:")
+    for result in results:
+        line = f"  {result['channel']:<10} {result['status']:<17} {result['latency']:.3f}s"
+        if result.get("post"):
+            line = f"  {result['post']}" + line
+        if result["error"]:
+            line += f"  {result['error']}"
+        print(line)
 
 
 def parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Publish a blog post to social channels.")
-    parser.add_argument("--post", required=True, help="Path to post markdown file in _posts/.")
+    parser = argparse.ArgumentParser(
+        description="Publish blog posts to social channels.",
+        epilog="API endpoints can be redirected with LINKEDIN_API_BASE, MEDIUM_API_BASE and INSTAGRAM_API_BASE.",
+    )
+    parser.add_argument("--post", nargs="+", action="extend", default=[], help="Path(s) to post markdown files in _posts/.")
+    parser.add_argument("--glob", nargs="+", action="extend", default=[], help="Glob pattern(s) selecting posts, e.g. '_posts/2026-*.md'.")
+    parser.add_argument("--diff", help="Git revision range; publishes posts added or modified in it, e.g. HEAD~1..HEAD.")
     parser.add_argument("--site-url", default=os.getenv("SITE_URL", "https://www.wesoamochildcancer.com"))
     parser.add_argument("--dry-run", action="store_true")
-    return parser.parse_args()
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=float(os.getenv("SOCIAL_TIMEOUT", DEFAULT_TIMEOUT)),
+        help="Per-channel timeout in seconds.",
+    )
+    parser.add_argument("--sequential", action="store_true", help="Publish channels one after another instead of concurrently.")
+    parser.add_argument("--ledger", type=Path, default=LEDGER_PATH, help="Append-only publish ledger (JSON Lines).")
+    parser.add_argument("--force", action="store_true", help="Publish to every channel even if the ledger says it is done.")
+    parser.add_argument("--concurrency", type=int, default=2, help="Concurrent publish workers per channel.")
+    parser.add_argument(
+        "--rate",
+        action="append",
+        default=[],
+        help="Per-channel rate limit as CHANNEL=N[/s|/min|/h], e.g. linkedin=10/min (repeatable).",
+    )
+    add_instrumentation_args(parser)
+    args = parser.parse_args()
+    if not (args.post or args.glob or args.diff):
+        parser.error("one of --post, --glob or --diff is required")
+    try:
+        args.rates = dict(parse_rate(spec) for spec in args.rate)
+    except ValueError as exc:
+        parser.error(str(exc))
+    return args
+
+
+def publish(args: argparse.Namespace) -> int:
+    with METRICS.span("scan"):
+        index = PostIndex.load()
+    with METRICS.span("ledger_load"):
+        ledger = PublishLedger.load(args.ledger)
+    post_paths = resolve_post_paths(args.post, args.glob, args.diff)
+
+    def prepare(post_path: Path) -> dict:
+        return prepare_post(post_path, args, index, ledger)
+
+    with METRICS.span("publish"):
+        if args.sequential:
+            results = []
+            for post_path in post_paths:
+                post, rows = start_post(post_path, prepare)
+                results.extend(rows)
+                if post is not None:
+                    for result in publish_channels(post["jobs"], args.timeout, concurrent=False):
+                        results.append(finish_job(post, result, args.dry_run))
+        else:
+            limiters = {
+                channel: TokenBucket(args.rates.get(channel, rate / 60.0), burst)
+                for channel, (rate, burst) in DEFAULT_RATES.items()
+            }
+            results = publish_pipeline(post_paths, prepare, limiters, args.timeout, args.concurrency, dry_run=args.dry_run)
+    index.save()
+
+    results.sort(key=lambda r: (r.get("post", ""), r["channel"]))
+    print_report(results)
+    return 1 if any(r["status"] in ("failed", "timeout") for r in results) else 0
 
 
 def main() -> int:
     args = parse_args()
-    post_path = Path(args.post)
-    if not post_path.exists():
-        raise FileNotFoundError(f"Post not found: {post_path}")
-
-    fm = parse_front_matter(post_path.read_text(encoding="utf-8"))
-    title = fm.get("title", post_path.stem)
-    body = fm.get("_body", "")
-    excerpt = fm.get("excerpt") or excerpt_from_body(body)
-    image_url = fm.get("image")
-
-    url = post_url(args.site_url, post_path)
-
-    publish_linkedin(f"{title}\n\n{excerpt}", url, args.dry_run)
-    publish_instagram(f"{title}\n\n{excerpt}", url, image_url, args.dry_run)
-    publish_medium(title, body, url, args.dry_run)
-    return 0
+    return run_instrumented(lambda: publish(args), args.metrics_json, args.profile)
 
 
 if __name__ == "__main__":
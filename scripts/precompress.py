@@ -0,0 +1,188 @@
+"""Precompress the built site so the host can serve .gz/.zst files as they are.
+
+Run after ``bundle exec jekyll build``. Text assets in ``_site`` get a ``.gz``
+sibling, and a ``.zst`` one when a zstd binding is installed (Python 3.14's
+``compression.zstd`` or the ``zstandard`` package). Compressed bytes are kept
+in a content-addressed store under .cache/precompress, so a file whose
+content hash is unchanged since the last run is copied from the store
+instead of being compressed again. Jekyll removes the siblings on every
+build, so the store is what makes reruns cheap.
+
+    python scripts/precompress.py
+    python scripts/precompress.py --site-dir _site --json precompress.json
+"""
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import gzip
+import hashlib
+import json
+import os
+from pathlib import Path
+import shutil
+
+try:  # zstd is optional; .gz alone is still worth serving.
+    from compression import zstd
+except ImportError:
+    try:
+        import zstandard as zstd
+    except ImportError:
+        zstd = None
+
+SITE_DIR = Path("_site")
+STORE_DIR = Path(".cache/precompress")
+SUFFIXES = {".html", ".css", ".js", ".json", ".xml", ".svg", ".txt", ".map", ".webmanifest"}
+MIN_SIZE = 256  # bytes; smaller files gain less than a compressed response's overhead
+MAX_RATIO = 0.9  # keep a compressed copy only if it is at most this share of the original
+GZIP_LEVEL = 9
+ZSTD_LEVEL = 19
+
+
+def available_formats() -> tuple[str, ...]:
+    return ("gz", "zst") if zstd is not None else ("gz",)
+
+
+def compress(data: bytes, fmt: str) -> bytes:
+    if fmt == "gz":
+        return gzip.compress(data, GZIP_LEVEL, mtime=0)
+    return zstd.compress(data, level=ZSTD_LEVEL)  # same signature in compression.zstd and zstandard
+
+
+def compress_into_store(source: str, digest: str, store_dir: str, formats: tuple[str, ...]) -> dict[str, int]:
+    """Compress one file into ``store_dir/<digest>.<fmt>``; runs in a worker process."""
+    data = Path(source).read_bytes()
+    sizes = {}
+    for fmt in formats:
+        blob = compress(data, fmt)
+        path = Path(store_dir) / f"{digest}.{fmt}"
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(blob)
+        os.replace(tmp_path, path)
+        sizes[fmt] = len(blob)
+    return sizes
+
+
+def eligible_files(site_dir: Path) -> list[Path]:
+    return sorted(
+        path
+        for path in site_dir.rglob("*")
+        if path.suffix.lower() in SUFFIXES and path.is_file() and path.stat().st_size >= MIN_SIZE
+    )
+
+
+def content_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def precompress(
+    site_dir: Path = SITE_DIR, store_dir: Path = STORE_DIR, formats: tuple[str, ...] | None = None, workers: int | None = None
+) -> dict:
+    """Write compressed siblings for every eligible file and return per-type totals.
+
+    Only files whose content hash is missing from the store are compressed;
+    store entries not used by this run are pruned, as are compressed siblings
+    whose source is gone or did not compress well.
+    """
+    formats = formats or available_formats()
+    store_dir.mkdir(parents=True, exist_ok=True)
+    files = {path: content_hash(path) for path in eligible_files(site_dir)}
+    pending = {
+        digest: path for path, digest in files.items() if not all((store_dir / f"{digest}.{fmt}").is_file() for fmt in formats)
+    }
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [(str(path), digest, str(store_dir), formats) for digest, path in sorted(pending.items())]
+            list(pool.map(compress_into_store, *zip(*jobs)))
+
+    totals: dict[str, dict] = defaultdict(lambda: {"files": 0, "bytes": 0, **{fmt: 0 for fmt in formats}})
+    written = set()
+    for path, digest in files.items():
+        size = path.stat().st_size
+        stats = totals[path.suffix.lower()]
+        stats["files"] += 1
+        stats["bytes"] += size
+        for fmt in formats:
+            blob = store_dir / f"{digest}.{fmt}"
+            compressed = blob.stat().st_size
+            if compressed > size * MAX_RATIO:
+                stats[fmt] += size  # served uncompressed
+                continue
+            target = path.with_name(f"{path.name}.{fmt}")
+            shutil.copyfile(blob, target)
+            written.add(target)
+            stats[fmt] += compressed
+
+    removed = 0
+    for fmt in ("gz", "zst"):
+        for sibling in site_dir.rglob(f"*.{fmt}"):
+            source = sibling.with_suffix("")
+            if sibling not in written and source.suffix.lower() in SUFFIXES:
+                sibling.unlink()
+                removed += 1
+    used = {f"{digest}.{fmt}" for digest in files.values() for fmt in formats}
+    for blob in store_dir.iterdir():
+        if blob.name not in used:
+            blob.unlink()
+
+    return {
+        "formats": list(formats),
+        "files": len(files),
+        "compressed": len(pending),
+        "reused": len(set(files.values())) - len(pending),
+        "written": len(written),
+        "removed": removed,
+        "types": dict(sorted(totals.items())),
+    }
+
+
+def format_bytes(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KiB"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Precompress text assets in the built site with gzip (and zstd if available).")
+    parser.add_argument("--site-dir", type=Path, default=SITE_DIR)
+    parser.add_argument("--store-dir", type=Path, default=STORE_DIR, help="Content-addressed cache of compressed files.")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes used to compress.")
+    parser.add_argument("--json", type=Path, help="Also write the report to this JSON file.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if not args.site_dir.is_dir():
+        print(f"Error: {args.site_dir} does not exist; run `bundle exec jekyll build` first.")
+        return 1
+    report = precompress(args.site_dir, args.store_dir, workers=args.workers)
+
+    formats = report["formats"]
+    print(f"{'type':<13} {'files':>6} {'original':>11}" + "".join(f" {fmt:>11} {'saved':>6}" for fmt in formats))
+    for suffix, stats in report["types"].items():
+        row = f"{suffix:<13} {stats['files']:>6} {format_bytes(stats['bytes']):>11}"
+        for fmt in formats:
+            saved = 1 - stats[fmt] / stats["bytes"] if stats["bytes"] else 0.0
+            row += f" {format_bytes(stats[fmt]):>11} {saved:>6.0%}"
+        print(row)
+    if zstd is None:
+        print("zstd: no binding installed (Python 3.14+ or `pip install zstandard`); wrote .gz only")
+    print(
+        f"Precompressed {report['files']} files: {report['compressed']} compressed, {report['reused']} reused from "
+        f"{args.store_dir}, {report['written']} written, {report['removed']} stale removed"
+    )
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+
+LEDGER_PATH = Path(".cache/publish-ledger.jsonl")
+
+
+def content_hash(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+class PublishLedger:
+    """Append-only JSON Lines record of publish attempts, keyed by post content hash and channel.
+
+    The latest record for a key wins. Lines that fail to parse (e.g. a write cut
+    short by a killed job) are ignored on load.
+    """
+
+    def __init__(self, path: Path = LEDGER_PATH) -> None:
+        self.path = path
+        self.records: dict[tuple[str, str], list[dict]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path = LEDGER_PATH) -> "PublishLedger":
+        ledger = cls(path)
+        try:
+            handle = path.open("r", encoding="utf-8")
+        except FileNotFoundError:
+            return ledger
+        with handle:
+            for line in handle:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                ledger.records.setdefault((record["hash"], record["channel"]), []).append(record)
+        return ledger
+
+    def latest(self, post_hash: str, channel: str, status: str | None = None) -> dict | None:
+        for record in reversed(self.records.get((post_hash, channel), [])):
+            if status is None or record["status"] == status:
+                return record
+        return None
+
+    def append(self, record: dict) -> dict:
+        line = json.dumps(record, sort_keys=True) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+            self.records.setdefault((record["hash"], record["channel"]), []).append(record)
+        return record
+
+    def for_post(self, post_hash: str, post: str) -> "PostLedger":
+        return PostLedger(self, post_hash, post)
+
+
+class PostLedger:
+    """Ledger view bound to one version of one post."""
+
+    def __init__(self, ledger: PublishLedger, post_hash: str, post: str) -> None:
+        self.ledger = ledger
+        self.post_hash = post_hash
+        self.post = post
+
+    def latest(self, channel: str, status: str | None = None) -> dict | None:
+        return self.ledger.latest(self.post_hash, channel, status)
+
+    def is_published(self, channel: str) -> bool:
+        return self.latest(channel, "published") is not None
+
+    def record(self, channel: str, status: str, remote_id: str | None = None, **extra: object) -> dict:
+        record = {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "hash": self.post_hash,
+            "post": self.post,
+            "channel": channel,
+            "status": status,
+            "remote_id": remote_id,
+        }
+        record.update(extra)
+        return self.ledger.append(record)
@@ -0,0 +1,139 @@
+"""Re-render existing posts through build_post's current front-matter format.
+
+Each post's front-matter values are read back and passed to
+``generate_post.build_post`` with its body unchanged, so a change to the
+generated format can be applied to the whole archive at once. Titles, dates,
+permalinks and every other value are preserved; a post is skipped if it has
+fields build_post does not write, or if its values would not read back the
+same from the re-rendered front matter. Posts are processed on a process
+pool, and only files whose bytes change are rewritten.
+
+    python scripts/rerender_posts.py
+    python scripts/rerender_posts.py --check    # print the diffs, exit 1 if any post would change
+"""
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import difflib
+import io
+import os
+from pathlib import Path
+
+try:
+    from scripts.front_matter import FrontMatterError, PostFile, read_front_matter
+    from scripts.generate_post import build_post, write_atomic
+    from scripts.post_index import POSTS_DIR
+except ImportError:  # executed as `python scripts/rerender_posts.py`
+    from front_matter import FrontMatterError, PostFile, read_front_matter
+    from generate_post import build_post, write_atomic
+    from post_index import POSTS_DIR
+
+FIELDS = {"layout", "title", "date", "tags", "categories", "excerpt", "image", "image_alt", "permalink", "seo"}
+SEO_FIELDS = {"title", "description"}
+
+
+def _as_list(value: object) -> list[str]:
+    if value is None:
+        return []
+    return [str(item) for item in value] if isinstance(value, list) else [str(value)]
+
+
+def post_arguments(front_matter: dict) -> dict:
+    """``build_post`` keyword arguments (all but ``body``) that reproduce ``front_matter``.
+
+    Raises ValueError when build_post cannot represent the front matter.
+    """
+    extra = sorted(set(front_matter) - FIELDS)
+    if extra:
+        raise ValueError(f"fields build_post does not write: {', '.join(extra)}")
+    if front_matter.get("layout", "post") != "post":
+        raise ValueError(f"layout is {front_matter['layout']!r}, not 'post'")
+    for field in ("title", "date"):
+        if not front_matter.get(field):
+            raise ValueError(f"missing {field}")
+    categories = _as_list(front_matter.get("categories"))
+    if len(categories) != 1:
+        raise ValueError(f"build_post writes exactly one category, not {len(categories)}")
+    seo = front_matter.get("seo") or {}
+    if not isinstance(seo, dict) or set(seo) - SEO_FIELDS:
+        raise ValueError("seo must only hold title and description")
+    permalink = front_matter.get("permalink")
+    if permalink and not (permalink.startswith("/") and permalink.endswith("/")):
+        raise ValueError(f"permalink {permalink!r} is not /slug/; build_post would change the URL")
+    return {
+        "title": front_matter["title"],
+        "excerpt": front_matter.get("excerpt"),
+        "category": categories[0],
+        "tags": _as_list(front_matter.get("tags")),
+        "image_url": front_matter.get("image"),
+        "image_alt": front_matter.get("image_alt"),
+        "permalink_slug": permalink.strip("/") if permalink else None,
+        "seo_title": seo.get("title"),
+        "seo_description": seo.get("description"),
+        "publish_date": front_matter["date"],
+    }
+
+
+def rerender(path: Path) -> tuple[str, str]:
+    """Return the current text of ``path`` and its text re-rendered by build_post."""
+    post = PostFile(path)
+    arguments = post_arguments(post.front_matter)
+    text = build_post(**arguments, body=post.read_body())
+    if post_arguments(read_front_matter(io.BytesIO(text.encode("utf-8"))) or {}) != arguments:
+        raise ValueError("values would not read back unchanged (e.g. a double quote in a quoted field)")
+    return path.read_text(encoding="utf-8"), text
+
+
+def migrate_post(path: str, write: bool) -> dict:
+    """Re-render one post; runs in a worker process. Returns its status and, if it changed, the diff."""
+    try:
+        old, new = rerender(Path(path))
+    except (OSError, UnicodeDecodeError, FrontMatterError, ValueError) as exc:
+        return {"path": path, "status": "skipped", "reason": str(exc)}
+    if old == new:
+        return {"path": path, "status": "unchanged"}
+    if write:
+        write_atomic(Path(path), new)
+    diff = difflib.unified_diff(
+        old.splitlines(keepends=True), new.splitlines(keepends=True), fromfile=f"a/{path}", tofile=f"b/{path}"
+    )
+    return {"path": path, "status": "changed", "diff": "".join(diff)}
+
+
+def migrate_posts(posts_dir: Path = POSTS_DIR, write: bool = True, workers: int | None = None) -> list[dict]:
+    paths = [path.as_posix() for path in sorted(posts_dir.glob("*.md"))]
+    if not paths:
+        return []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(migrate_post, paths, [write] * len(paths), chunksize=max(1, len(paths) // 64)))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-render every post in _posts/ through build_post's current format.")
+    parser.add_argument("--posts-dir", type=Path, default=POSTS_DIR)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Worker processes.")
+    parser.add_argument("--check", action="store_true", help="Write nothing; print diffs and exit 1 if any post would change.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = migrate_posts(args.posts_dir, write=not args.check, workers=args.workers)
+    counts = {"changed": 0, "unchanged": 0, "skipped": 0}
+    for result in results:
+        counts[result["status"]] += 1
+        if result["status"] == "skipped":
+            print(f"skipped {result['path']}: {result['reason']}")
+        elif result["status"] == "changed":
+            if args.check:
+                print(result["diff"], end="")
+            else:
+                print(f"rewrote {result['path']}")
+    verb = "would change" if args.check else "changed"
+    print(f"Posts: {len(results)} scanned, {counts['changed']} {verb}, {counts['unchanged']} unchanged, {counts['skipped']} skipped")
+    return 1 if args.check and counts["changed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import argparse
+from collections import defaultdict
+from pathlib import Path
+import re
+import sys
+import unicodedata
+from typing import Iterable
+
+try:
+    from scripts.post_index import POSTS_DIR, PostIndex
+except ImportError:  # executed as `python scripts/slugs.py`
+    from post_index import POSTS_DIR, PostIndex
+
+MAX_LENGTH = 90
+FALLBACK = "post"
+
+# Letters that Unicode decomposition does not reduce to ASCII, including the
+# open vowels and consonants of Twi, Ga and Ewe.
+LETTERS = {
+    "ɛ": "e", "ɔ": "o", "ŋ": "ng", "ɖ": "d", "ƒ": "f", "ɣ": "g", "ʋ": "v",
+    "ß": "ss", "æ": "ae", "œ": "oe", "ø": "o", "đ": "d", "ð": "d", "þ": "th",
+    "ł": "l", "ı": "i", "ħ": "h", "ŧ": "t",
+}
+
+
+class _SlugTable(dict):
+    """``str.translate`` table mapping each code point to its slug text, filled on first use.
+
+    ASCII letters and digits are lowercased, whitespace and hyphens become
+    ``-``, other letters are transliterated and everything else is dropped.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        if char.isspace() or char == "-":
+            value = "-"
+        else:
+            lowered = char.lower()
+            value = LETTERS.get(lowered)
+            if value is None:
+                decomposed = unicodedata.normalize("NFKD", lowered)
+                value = "".join(c for c in decomposed if c.isascii() and c.isalnum()).lower()
+        self[codepoint] = value
+        return value
+
+
+_TABLE = _SlugTable()
+
+
+def slugify(text: str) -> str:
+    """Lowercase ASCII slug of ``text``; accented and West African letters are transliterated."""
+    text = re.sub(r"-{2,}", "-", text.strip().translate(_TABLE))
+    return text[:MAX_LENGTH].strip("-") or FALLBACK
+
+
+class SlugRegistry:
+    """Slugs and permalinks in use, handing out unique ones deterministically.
+
+    A taken candidate gets the first free ``-2``, ``-3``, ... suffix. The next
+    suffix to try is remembered per candidate, so allocating a batch stays
+    linear even when many titles share a slug.
+    """
+
+    def __init__(self, taken: Iterable[str] = ()) -> None:
+        self.taken = set(taken)
+        self._next_suffix: dict[str, int] = {}
+
+    @classmethod
+    def from_index(cls, index: PostIndex) -> "SlugRegistry":
+        return cls(index.slugs | {permalink.strip("/") for permalink in index.permalinks})
+
+    def claim(self, candidate: str) -> str:
+        slug = candidate
+        suffix = self._next_suffix.get(candidate, 2)
+        while slug in self.taken:
+            tail = f"-{suffix}"
+            slug = candidate[: MAX_LENGTH - len(tail)].rstrip("-") + tail
+            suffix += 1
+        self._next_suffix[candidate] = suffix
+        self.taken.add(slug)
+        return slug
+
+    def release(self, slug: str) -> None:
+        """Free ``slug``, e.g. when the post using it is renamed."""
+        self.taken.discard(slug)
+
+    def allocate(self, titles: Iterable[str]) -> list[str]:
+        """Unique slugs for ``titles``, in order."""
+        return [self.claim(slugify(title)) for title in titles]
+
+
+def find_duplicates(index: PostIndex) -> dict[str, list[str]]:
+    """Slugs or permalinks claimed by more than one post in the archive."""
+    users: dict[str, set[str]] = defaultdict(set)
+    for path, entry in index.posts():
+        users[entry["slug"]].add(path.as_posix())
+        if entry.get("permalink"):
+            users[entry["permalink"].strip("/")].add(path.as_posix())
+    return {slug: sorted(paths) for slug, paths in sorted(users.items()) if len(paths) > 1}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Allocate unique slugs for titles against the slugs used in _posts/.")
+    parser.add_argument("titles", nargs="*", help="Titles to slugify (default: one per line on stdin).")
+    parser.add_argument("--posts-dir", type=Path, default=POSTS_DIR)
+    parser.add_argument("--audit", action="store_true", help="List slugs or permalinks already shared by several posts.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = PostIndex.load(args.posts_dir)
+    index.save()
+
+    if args.audit:
+        duplicates = find_duplicates(index)
+        for slug, paths in duplicates.items():
+            print(f"{slug}: {', '.join(paths)}")
+        print(f"Slug audit: {len(index.entries)} posts, {len(duplicates)} shared slugs")
+        return 1 if duplicates else 0
+
+    titles = args.titles or [line.strip() for line in sys.stdin if line.strip()]
+    for title, slug in zip(titles, SlugRegistry.from_index(index).allocate(titles)):
+        print(f"{slug}\t{title}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,197 @@
+"""Local stand-in for the LinkedIn, Medium and Instagram Graph publish endpoints.
+
+Serves ``POST /v2/ugcPosts``, ``POST /v1/users/{id}/posts`` and
+``POST /v20.0/{account}/media`` + ``/media_publish`` with configurable latency,
+5xx error rate and 429 throttling, so post_to_social.py can be exercised
+offline. Point the publisher at it through the ``*_API_BASE`` variables:
+
+    python scripts/social_stand_in.py --port 8765 --latency 0.05 --throttle-rate 0.1
+    LINKEDIN_API_BASE=http://127.0.0.1:8765/v2 MEDIUM_API_BASE=http://127.0.0.1:8765/v1 \\
+    INSTAGRAM_API_BASE=http://127.0.0.1:8765/v20.0 python scripts/post_to_social.py --post ...
+"""
+from __future__ import annotations
+
+import argparse
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import itertools
+import json
+import random
+import re
+import threading
+import time
+
+DEFAULT_CONFIG = {
+    "latency": 0.0,  # mean seconds added to every response
+    "jitter": 0.0,  # +/- fraction of ``latency``
+    "error_rate": 0.0,  # share of requests answered with 500
+    "throttle_rate": 0.0,  # share of requests answered with 429
+    "throttle_first": 0,  # answer the first N requests per route with 429
+    "retry_after": 1.0,  # Retry-After seconds sent with 429s
+    "seed": 0,
+}
+
+ROUTES = (
+    ("linkedin", re.compile(r"^/v2/ugcPosts$")),
+    ("medium", re.compile(r"^/v1/users/[^/]+/posts$")),
+    ("instagram.media", re.compile(r"^/v20\.0/[^/]+/media$")),
+    ("instagram.publish", re.compile(r"^/v20\.0/[^/]+/media_publish$")),
+)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: dict | None = None) -> None:
+        super().__init__(address, StandInHandler)
+        self.config = {**DEFAULT_CONFIG, **(config or {})}
+        self.rng = random.Random(self.config["seed"])
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        self.containers: set[str] = set()
+        self.stats: Counter = Counter()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def api_bases(self) -> dict[str, str]:
+        """``*_API_BASE`` environment variables that point post_to_social.py here."""
+        return {
+            "LINKEDIN_API_BASE": f"{self.base_url}/v2",
+            "MEDIUM_API_BASE": f"{self.base_url}/v1",
+            "INSTAGRAM_API_BASE": f"{self.base_url}/v20.0",
+        }
+
+    def next_fault(self, route: str) -> int | None:
+        """Draw the injected failure status, if any, for the next request on ``route``."""
+        config = self.config
+        with self.lock:
+            self.stats[f"{route} requests"] += 1
+            if self.stats[f"{route} requests"] <= config["throttle_first"]:
+                return 429
+            draw = self.rng.random()
+            delay = config["latency"] * (1 + config["jitter"] * (2 * self.rng.random() - 1))
+        time.sleep(max(0.0, delay))
+        if draw < config["throttle_rate"]:
+            return 429
+        if draw < config["throttle_rate"] + config["error_rate"]:
+            return 500
+        return None
+
+    def snapshot(self) -> dict[str, int]:
+        with self.lock:
+            return dict(sorted(self.stats.items()))
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: StandInServer
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - requests are counted, not logged
+        pass
+
+    def send_json(self, route: str, status: int, payload: dict, headers: dict[str, str] | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+        with self.server.lock:
+            self.server.stats[f"{route} {status}"] += 1
+
+    def do_POST(self) -> None:
+        raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        route = next((name for name, pattern in ROUTES if pattern.match(self.path.split("?")[0])), None)
+        if route is None:
+            self.send_json("unknown", 404, {"error": f"no stand-in route for {self.path}"})
+            return
+        try:
+            payload = json.loads(raw or b"{}")
+        except ValueError:
+            self.send_json(route, 400, {"error": "body is not JSON"})
+            return
+
+        fault = self.server.next_fault(route)
+        if fault == 429:
+            retry_after = f"{self.server.config['retry_after']:g}"
+            self.send_json(route, 429, {"error": "rate limited"}, {"Retry-After": retry_after})
+            return
+        if fault == 500:
+            self.send_json(route, 500, {"error": "injected failure"})
+            return
+
+        if route.startswith("instagram"):
+            authorized = bool(payload.get("access_token"))
+        else:
+            authorized = (self.headers.get("Authorization") or "").startswith("Bearer ")
+        if not authorized:
+            self.send_json(route, 401, {"error": "missing credentials"})
+            return
+
+        with self.server.lock:
+            object_id = str(next(self.server.ids))
+        if route == "linkedin":
+            self.send_json(route, 201, {"id": f"urn:li:share:{object_id}"}, {"X-RestLi-Id": f"urn:li:share:{object_id}"})
+        elif route == "medium":
+            self.send_json(route, 201, {"data": {"id": object_id, "title": payload.get("title")}})
+        elif route == "instagram.media":
+            with self.server.lock:
+                self.server.containers.add(object_id)
+            self.send_json(route, 200, {"id": object_id})
+        elif payload.get("creation_id") in self.server.containers:
+            self.send_json(route, 200, {"id": f"media-{object_id}"})
+        else:
+            self.send_json(route, 400, {"error": f"unknown creation_id {payload.get('creation_id')!r}"})
+
+
+def start_stand_in(config: dict | None = None, host: str = "127.0.0.1", port: int = 0) -> StandInServer:
+    """Start a stand-in server on a background thread; stop it with ``shutdown()``."""
+    server = StandInServer((host, port), config)
+    threading.Thread(target=server.serve_forever, name="social-stand-in", daemon=True).start()
+    return server
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve local stand-ins for the social publish APIs.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=DEFAULT_CONFIG["latency"], help="Mean response latency in seconds.")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_CONFIG["jitter"], help="Latency jitter as a fraction, e.g. 0.5.")
+    parser.add_argument("--error-rate", type=float, default=DEFAULT_CONFIG["error_rate"], help="Share of requests failing with 500.")
+    parser.add_argument("--throttle-rate", type=float, default=DEFAULT_CONFIG["throttle_rate"], help="Share of requests answered with 429.")
+    parser.add_argument("--retry-after", type=float, default=DEFAULT_CONFIG["retry_after"], help="Retry-After seconds sent with 429s.")
+    parser.add_argument("--seed", type=int, default=DEFAULT_CONFIG["seed"])
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    config = {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "retry_after": args.retry_after,
+        "seed": args.seed,
+    }
+    server = StandInServer((args.host, args.port), config)
+    for name, value in server.api_bases().items():
+        print(f"export {name}={value}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for key, count in server.snapshot().items():
+            print(f"{key}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import re
+import unicodedata
+
+# Suffix rules are applied first-match-wins and only when at least MIN_STEM
+# characters remain. assets/js/search.js applies the same rules, read from the
+# search manifest, so queries and the index always stem identically.
+SUFFIX_RULES: list[tuple[str, str]] = [
+    ("ational", "ate"),
+    ("tional", "tion"),
+    ("ization", "ize"),
+    ("fulness", "ful"),
+    ("ousness", "ous"),
+    ("iveness", "ive"),
+    ("ingly", ""),
+    ("edly", ""),
+    ("ments", ""),
+    ("ment", ""),
+    ("ness", ""),
+    ("ies", "y"),
+    ("ing", ""),
+    ("ss", "ss"),
+    ("ed", ""),
+    ("ly", ""),
+    ("es", ""),
+    ("s", ""),
+]
+MIN_STEM = 3
+
+STOPWORDS = frozenset(
+    """
+    a about after all also an and any are as at be been but by can could do does for from had has have
+    how if in into is it its may more most no not of on or our out so such than that the their them then
+    there these they this those through to too up us was we were what when where which while who why will
+    with you your
+    """.split()
+)
+
+_LIQUID_RE = re.compile(r"{%.*?%}|{{.*?}}", re.DOTALL)
+_HTML_RE = re.compile(r"<[^>]+>")
+_MD_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def plain_text(markdown: str) -> str:
+    """Strip Liquid, HTML and Markdown link syntax, keeping the readable text."""
+    text = _LIQUID_RE.sub(" ", markdown)
+    text = _HTML_RE.sub(" ", text)
+    return _MD_LINK_RE.sub(r"\1", text)
+
+
+def fold(text: str) -> str:
+    """Lowercase and drop accents so "Café" and "cafe" tokenize the same."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def stem(token: str) -> str:
+    for suffix, replacement in SUFFIX_RULES:
+        if token.endswith(suffix):
+            base = token[: len(token) - len(suffix)]
+            if len(base) + len(replacement) >= MIN_STEM:
+                return base + replacement
+            return token
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    return [tok for tok in _TOKEN_RE.findall(fold(text)) if tok not in STOPWORDS]
+
+
+def terms(text: str) -> list[str]:
+    """Tokenize and stem ``text``; the unit used by the search and similarity indexes."""
+    return [stem(tok) for tok in tokenize(text)]
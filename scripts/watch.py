@@ -0,0 +1,299 @@
+"""Keep derived data up to date while posts, templates and data files are edited.
+
+The long-running counterpart of generate_post.py and the build_* scripts:
+the post index, per-post search terms and related-post state stay in memory,
+so a change re-parses only the files that changed and rewrites only the
+derived files they affect.
+
+    _posts/*.md                 -> assets/search/, _data/related.yml, sitemap.xml, feed.xml,
+                                   _data/images.yml (if an image: changed)
+    _templates/*                -> topic catalog reloaded and every topic re-rendered
+    _data/youtube_videos.yml    -> _data/video_gallery.yml
+
+On Linux, inotify is used through ctypes (the standard library has no
+binding); elsewhere, or with --poll, the directories are polled instead.
+Bursts of events are coalesced until the tree has been quiet for --debounce
+seconds.
+
+    python scripts/watch.py
+    python scripts/watch.py --poll --interval 1
+"""
+from __future__ import annotations
+
+import argparse
+import ctypes
+import ctypes.util
+import json
+import os
+from pathlib import Path
+import select
+import struct
+import sys
+import time
+
+try:
+    from scripts import (
+        build_feeds,
+        build_image_variants,
+        build_related_posts,
+        build_search_index,
+        build_video_gallery,
+        generate_post,
+    )
+    from scripts.fsutil import write_if_changed
+    from scripts.post_index import POSTS_DIR, PostIndex
+except ImportError:  # executed as `python scripts/watch.py`
+    import build_feeds
+    import build_image_variants
+    import build_related_posts
+    import build_search_index
+    import build_video_gallery
+    import generate_post
+    from fsutil import write_if_changed
+    from post_index import POSTS_DIR, PostIndex
+
+TEMPLATES_DIR = Path("_templates")
+DATA_DIR = Path("_data")
+WATCH_DIRS = (POSTS_DIR, TEMPLATES_DIR, DATA_DIR)
+DEBOUNCE = 0.2
+POLL_INTERVAL = 0.5
+
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_DELETE = 0x200
+_EVENT = struct.Struct("iIII")
+
+
+def ignored(path: Path) -> bool:
+    """Editor swap files and the ``*.tmp`` files behind atomic writes."""
+    return path.name.startswith(".") or path.name.endswith((".tmp", "~", ".swp"))
+
+
+class PollingWatcher:
+    """Detect changes by comparing ``(mtime_ns, size)`` snapshots of the watched directories."""
+
+    def __init__(self, dirs: tuple[Path, ...], interval: float = POLL_INTERVAL) -> None:
+        self.dirs = [d for d in dirs if d.is_dir()]
+        self.interval = interval
+        self.state = self._snapshot()
+
+    def _snapshot(self) -> dict[Path, tuple[int, int]]:
+        state = {}
+        for directory in self.dirs:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        state[directory / entry.name] = (stat.st_mtime_ns, stat.st_size)
+        return state
+
+    def read(self, timeout: float | None) -> set[Path]:
+        """Block up to ``timeout`` seconds (forever if None) and return the paths that changed."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._snapshot()
+            changed = {path for path in current.keys() | self.state.keys() if current.get(path) != self.state.get(path)}
+            self.state = current
+            changed = {path for path in changed if not ignored(path)}
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            time.sleep(self.interval if deadline is None else max(0.0, min(self.interval, deadline - time.monotonic())))
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify on each watched directory (non-recursive), via libc."""
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE
+
+    def __init__(self, dirs: tuple[Path, ...]) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: dict[int, Path] = {}
+        for directory in dirs:
+            if not directory.is_dir():
+                continue
+            wd = libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                self.close()
+                raise OSError(errno, f"inotify_add_watch failed for {directory}")
+            self.dirs[wd] = directory
+
+    def read(self, timeout: float | None) -> set[Path]:
+        """Block up to ``timeout`` seconds (forever if None) and return the paths that changed."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, _, _, length = _EVENT.unpack_from(data, offset)
+            name = data[offset + _EVENT.size : offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if name and wd in self.dirs:
+                path = self.dirs[wd] / os.fsdecode(name)
+                if not ignored(path):
+                    changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def open_watcher(dirs: tuple[Path, ...] = WATCH_DIRS, poll: bool = False, interval: float = POLL_INTERVAL):
+    if not poll and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(dirs)
+        except OSError as exc:
+            print(f"inotify unavailable ({exc}); polling every {interval:g}s instead")
+    return PollingWatcher(dirs, interval)
+
+
+def collect(watcher, debounce: float = DEBOUNCE, timeout: float | None = None) -> set[Path]:
+    """Wait for a change, then keep gathering events until ``debounce`` seconds pass without one."""
+    changed = watcher.read(timeout)
+    while changed:
+        more = watcher.read(debounce)
+        if not more:
+            break
+        changed |= more
+    return changed
+
+
+class WatchSession:
+    """In-memory state of the derived data, updated one batch of changed paths at a time."""
+
+    def __init__(self, posts_dir: Path = POSTS_DIR) -> None:
+        self.posts_dir = posts_dir
+        self.index = PostIndex.load(posts_dir)
+        self.index.save()
+        self.search_counts: dict[str, tuple] = {}
+        self.related_cache = build_related_posts.load_cache(build_related_posts.CACHE_PATH)
+        self.pages = build_feeds.collect_pages()
+        self.feeds_cache = build_feeds.load_cache()
+
+    def rebuild_posts(self) -> list[str]:
+        manifest, shards = build_search_index.build_index(
+            self.index.posts(), self.search_counts, build_search_index.load_manifest()
+        )
+        stats = build_search_index.write_index(manifest, shards)
+        self.related_cache, recomputed = build_related_posts.update_related(self.index, self.related_cache)
+        write_if_changed(build_related_posts.CACHE_PATH, json.dumps(self.related_cache, sort_keys=True))
+        related_written = write_if_changed(
+            build_related_posts.OUTPUT_PATH, build_related_posts.render_yaml(self.related_cache)
+        )
+        self.feeds_cache, feeds = build_feeds.update_feeds(self.index, self.pages, self.feeds_cache)
+        write_if_changed(build_feeds.CACHE_PATH, json.dumps(self.feeds_cache, sort_keys=True))
+        return [
+            f"search index: {stats['written']} shards written, {stats['removed']} removed",
+            f"related posts: {len(recomputed)} rows recomputed, {build_related_posts.OUTPUT_PATH} "
+            f"{'updated' if related_written else 'unchanged'}",
+            f"feeds: {build_feeds.SITEMAP_PATH} {feeds['sitemap']}, {build_feeds.FEED_PATH} {feeds['feed']}",
+        ]
+
+    def rebuild_images(self) -> list[str]:
+        references = build_image_variants.collect_references(self.index)
+        manifest_path = build_image_variants.MANIFEST_PATH
+        try:
+            entries, processed = build_image_variants.build_variants(references, build_image_variants.load_manifest(manifest_path))
+        except RuntimeError as exc:
+            return [f"images skipped: {exc}"]
+        build_image_variants.remove_stale_variants(entries)
+        written = write_if_changed(manifest_path, build_image_variants.render_manifest(entries))
+        return [f"images: {processed} processed, {manifest_path} {'updated' if written else 'unchanged'}"]
+
+    def reload_templates(self) -> list[str]:
+        generate_post.load_topic_catalog.cache_clear()
+        generate_post._RENDERED_BODIES.clear()
+        try:
+            count = len(generate_post.load_topic_catalog()["topics"])
+            for week in range(1, count + 1):
+                generate_post.get_topic_for_week(week)
+            upcoming = generate_post.get_topic_for_week(generate_post.week_index_utc())
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            return [f"topic catalog error: {exc!r}"]
+        return [f"topic catalog: {count} topics render; this week: {upcoming['title']}"]
+
+    def rebuild_videos(self) -> list[str]:
+        try:
+            videos = build_video_gallery.load_videos()
+        except (OSError, ValueError) as exc:
+            return [f"video gallery error: {exc}"]
+        errors = build_video_gallery.validate_videos(videos)
+        if errors:
+            return [f"video gallery error: {error}" for error in errors]
+        text = build_video_gallery.render_gallery(videos)
+        written = write_if_changed(build_video_gallery.OUTPUT_PATH, text)
+        return [f"video gallery: {len(videos)} videos, {build_video_gallery.OUTPUT_PATH} {'updated' if written else 'unchanged'}"]
+
+    def apply(self, changed: set[Path]) -> list[str]:
+        """Update the index for ``changed`` paths and rewrite what depends on them; returns log lines."""
+        messages = []
+        posts = sorted(p for p in changed if p.parent == self.posts_dir and p.suffix == ".md")
+        if posts:
+            images_before = {p: (self.index.get(p) or {}).get("image") for p in posts}
+            for path in posts:
+                if path.is_file():
+                    self.index.update(path)
+                else:
+                    self.index.remove(path)
+                    self.search_counts.pop(path.as_posix(), None)
+            self.index.save()
+            messages.append(f"{len(posts)} post(s) changed: {', '.join(p.name for p in posts)}")
+            messages += self.rebuild_posts()
+            if any((self.index.get(p) or {}).get("image") != image for p, image in images_before.items()):
+                messages += self.rebuild_images()
+        if any(p.parent == TEMPLATES_DIR for p in changed):
+            messages += self.reload_templates()
+        if build_video_gallery.SOURCE_PATH in changed:
+            messages += self.rebuild_videos()
+        return messages
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Watch _posts/, _templates/ and _data/ and keep derived data up to date.")
+    parser.add_argument("--poll", action="store_true", help="Poll for changes instead of using inotify.")
+    parser.add_argument("--interval", type=float, default=POLL_INTERVAL, help="Polling interval in seconds.")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE, help="Quiet period that ends a burst of changes, in seconds.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    session = WatchSession()
+    for message in session.rebuild_posts():
+        print(message)
+    watcher = open_watcher(WATCH_DIRS, args.poll, args.interval)
+    print(f"Watching {', '.join(d.as_posix() for d in WATCH_DIRS)} ({type(watcher).__name__}); Ctrl-C to stop")
+    try:
+        while True:
+            changed = collect(watcher, args.debounce)
+            started = time.perf_counter()
+            messages = session.apply(changed)
+            if messages:
+                for message in messages:
+                    print(message)
+                print(f"Updated in {(time.perf_counter() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,73 @@
+import contextlib
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.build_assets import build_assets, minify_css, minify_js, remove_stale, render_manifest
+from scripts.front_matter import parse_yaml
+
+
+class MinifierTests(unittest.TestCase):
+    def test_css_drops_comments_and_whitespace_but_keeps_strings(self) -> None:
+        source = '/* theme */\na , .b > .c {\n  color: red ;\n  content: "a  b";\n}\n.d :hover { margin: 0 auto; }\n'
+
+        self.assertEqual(minify_css(source), 'a,.b>.c{color:red;content:"a  b"}.d :hover{margin:0 auto}\n')
+
+    def test_js_keeps_statement_line_breaks_strings_and_regexes(self) -> None:
+        source = (
+            "// toggle\n"
+            "const a = 1\n"
+            "const b = a / 2;  /* half */\n"
+            "if (a) {\n"
+            "  return /ab+c\\//g.test('x // y')\n"
+            "}\n"
+        )
+
+        self.assertEqual(minify_js(source), "const a=1\nconst b=a / 2;if(a){return /ab+c\\//g.test('x // y')}\n")
+
+
+class BuildAssetsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "assets" / "js").mkdir(parents=True)
+        (self.root / "assets" / "css").mkdir(parents=True)
+        (self.root / "assets" / "css" / "main.css").write_text("body {\n  color: #000;\n}\n", encoding="utf-8")
+        (self.root / "assets" / "js" / "tabs.js").write_text("// tabs\nvar x = 1;\n", encoding="utf-8")
+        self.sources = (Path("assets/css/main.css"), Path("assets/js/tabs.js"))
+        self.output = Path("assets/dist")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_fingerprints_and_rebuilds_only_changed_sources(self) -> None:
+        with contextlib.chdir(self.root):
+            entries, rebuilt = build_assets(self.sources, {}, self.output)
+            self.assertEqual(rebuilt, ["/assets/css/main.css", "/assets/js/tabs.js"])
+            css = entries["/assets/css/main.css"]["path"]
+            self.assertRegex(css, r"^/assets/dist/main\.[0-9a-f]{10}\.css$")
+            self.assertEqual(Path(css.lstrip("/")).read_text(encoding="utf-8"), "body{color:#000}\n")
+
+            previous = parse_yaml(render_manifest(entries).splitlines())
+            Path("assets/js/tabs.js").write_text("var x = 2;\n", encoding="utf-8")
+            updated, rebuilt = build_assets(self.sources, previous, self.output)
+
+            self.assertEqual(rebuilt, ["/assets/js/tabs.js"])
+            self.assertEqual(updated["/assets/css/main.css"]["path"], css)
+            self.assertNotEqual(updated["/assets/js/tabs.js"]["path"], entries["/assets/js/tabs.js"]["path"])
+            self.assertEqual(remove_stale(updated, self.output), 1)
+            self.assertEqual(len(list(self.output.iterdir())), 2)
+
+    def test_missing_output_is_rebuilt(self) -> None:
+        with contextlib.chdir(self.root):
+            entries, _ = build_assets(self.sources, {}, self.output)
+            previous = parse_yaml(render_manifest(entries).splitlines())
+            Path(entries["/assets/js/tabs.js"]["path"].lstrip("/")).unlink()
+
+            _, rebuilt = build_assets(self.sources, previous, self.output)
+
+            self.assertEqual(rebuilt, ["/assets/js/tabs.js"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.bench_archive import compare
+from benchmarks.corpus import ensure_corpus
+from scripts.post_index import PostIndex
+
+
+class BenchmarkCorpusTests(unittest.TestCase):
+    def test_corpus_is_reused_until_its_size_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            site_root = ensure_corpus(root, 5)
+            posts = sorted((site_root / "_posts").glob("*.md"))
+            self.assertEqual(len(posts), 5)
+            entries = PostIndex.load(site_root / "_posts", root / "index.json").posts()
+            self.assertTrue(all(entry["title"] for _, entry in entries))
+
+            mtime = posts[0].stat().st_mtime_ns
+            self.assertEqual(ensure_corpus(root, 5), site_root)
+            self.assertEqual(posts[0].stat().st_mtime_ns, mtime)
+            self.assertEqual(len(list((ensure_corpus(root, 3) / "_posts").glob("*.md"))), 3)
+
+
+class CompareTests(unittest.TestCase):
+    def test_only_slowdowns_past_the_threshold_regress(self) -> None:
+        baseline = {"results": {"a": {"best_s": 1.0}, "b": {"best_s": 1.0}, "gone": {"best_s": 1.0}}}
+        current = {"results": {"a": {"best_s": 1.1}, "b": {"best_s": 1.5}, "new": {"best_s": 1.0}}}
+
+        rows = {row["name"]: row for row in compare(current, baseline, threshold=0.2)}
+
+        self.assertEqual(sorted(rows), ["a", "b"])
+        self.assertFalse(rows["a"]["regressed"])
+        self.assertTrue(rows["b"]["regressed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
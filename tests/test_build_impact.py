@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.build_impact import SiteGraph, apply_mtimes, impact
+
+FILES = {
+    "_config.yml": "title: Test\n",
+    "_layouts/default.html": "<html>{% include head-custom.html %}{{ content }}</html>\n",
+    "_layouts/home.html": "---\nlayout: default\n---\n{% for post in site.posts limit: 3 %}{{ post.title }}{% endfor %}\n",
+    "_layouts/post.html": (
+        "---\nlayout: default\n---\n{% include figure.html src=page.image %}{{ content }}\n"
+        "{{ page.previous.url }} {{ page.next.url }}\n{% include related.html %}\n"
+    ),
+    "_includes/head-custom.html": "<title>{{ page.title }}</title>\n",
+    "_includes/figure.html": "{% assign variants = site.data.images[include.src] %}<img src=\"{{ include.src }}\">\n",
+    "_includes/related.html": (
+        "{% if site.data.related %}{% assign rows = site.data.related[page.url] %}{% endif %}\n"
+        "{% for tag in page.tags %}{{ site.tags[tag].size }}{% endfor %}\n"
+    ),
+    "_data/related.yml": '"/a/":\n  - "/b/"\n"/b/":\n  - "/a/"\n"/c/":\n  - "/a/"\n',
+    "_data/images.yml": '"https://img/a.jpg":\n  width: 100\n',
+    "index.md": "---\nlayout: home\n---\n",
+    "about.md": "---\nlayout: default\ntitle: About\npermalink: /about/\n---\nAbout us\n",
+}
+
+
+def post(slug: str, date: str, tags: str, image: str = "https://img/a.jpg") -> str:
+    return f"---\nlayout: post\ntitle: {slug}\ndate: {date}\ntags: [{tags}]\npermalink: /{slug}/\nimage: {image}\n---\nBody of {slug}\n"
+
+
+class BuildImpactTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        files = dict(FILES)
+        files["_posts/2026-01-01-a.md"] = post("a", "2026-01-01", "hope")
+        files["_posts/2026-01-08-b.md"] = post("b", "2026-01-08", "hope")
+        files["_posts/2026-01-15-c.md"] = post("c", "2026-01-15", "ghana")
+        for name, text in files.items():
+            self.write(name, text)
+        self.manifest = SiteGraph(self.root).manifest()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write(self, name: str, text: str) -> None:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    def affected(self, report: dict) -> dict[str, list[str]]:
+        return {entry["url"]: entry["why"] for entry in report["affected"]}
+
+    def test_without_a_manifest_a_full_build_is_needed(self) -> None:
+        self.assertEqual(impact(SiteGraph(self.root), None)["mode"], "full")
+
+    def test_new_post_affects_only_its_neighbours_listings_and_changed_data_rows(self) -> None:
+        self.write("_posts/2026-01-22-d.md", post("d", "2026-01-22", "ghana", image="https://img/d.jpg"))
+        self.write("_data/related.yml", FILES["_data/related.yml"].replace('"/c/":\n  - "/a/"', '"/c/":\n  - "/d/"') + '"/d/":\n  - "/c/"\n')
+        self.write("_data/images.yml", FILES["_data/images.yml"] + '"https://img/d.jpg":\n  width: 100\n')
+
+        report = impact(SiteGraph(self.root), self.manifest, full_ratio=1.0)
+        affected = self.affected(report)
+
+        self.assertEqual(report["mode"], "incremental")
+        self.assertEqual(sorted(affected), ["/", "/c/", "/d/"])
+        self.assertIn("lists posts", affected["/"])
+        self.assertIn("reads _data/related", affected["/c/"])
+        self.assertIn("next to a changed post", affected["/c/"])
+        self.assertIn("reads _data/images", affected["/d/"])
+
+    def test_template_data_and_config_changes(self) -> None:
+        self.write("_layouts/post.html", FILES["_layouts/post.html"] + "<footer></footer>\n")
+        report = impact(SiteGraph(self.root), self.manifest, full_ratio=1.0)
+        self.assertEqual(sorted(self.affected(report)), ["/a/", "/b/", "/c/"])
+        self.assertEqual(self.affected(report)["/a/"], ["uses _layouts/post.html"])
+
+        self.write("_includes/head-custom.html", "<title>{{ page.title }} | Test</title>\n")
+        report = impact(SiteGraph(self.root), self.manifest)
+        self.assertEqual((report["mode"], len(report["affected"])), ("full", 5))
+
+        self.write("_layouts/post.html", FILES["_layouts/post.html"])
+        self.write("_includes/head-custom.html", FILES["_includes/head-custom.html"])
+        self.write("_config.yml", "title: Renamed\n")
+        report = impact(SiteGraph(self.root), self.manifest)
+        self.assertEqual((report["mode"], report["reasons"], report["affected"]), ("full", ["_config.yml changed"], []))
+
+    def test_retagged_and_removed_posts(self) -> None:
+        self.write("_posts/2026-01-01-a.md", post("a", "2026-01-01", "ghana"))
+        (self.root / "_posts/2026-01-08-b.md").unlink()
+
+        report = impact(SiteGraph(self.root), self.manifest, full_ratio=1.0)
+
+        self.assertEqual(report["removed_urls"], ["/b/"])
+        self.assertIn("shares a tag or category with a changed post", self.affected(report)["/c/"])
+        self.assertNotIn("/about/", self.affected(report))
+
+    def test_apply_restores_unchanged_mtimes_and_touches_affected_pages(self) -> None:
+        for path in self.root.rglob("*"):
+            if path.is_file():
+                os.utime(path, ns=(1, 1))  # a fresh checkout gives every file a new mtime
+        self.write("_posts/2026-01-15-c.md", post("c", "2026-01-15", "ghana") + "More.\n")
+        graph = SiteGraph(self.root)
+        report = impact(graph, self.manifest, full_ratio=1.0)
+
+        restored, touched = apply_mtimes(graph, self.manifest, report)
+
+        about = self.manifest["files"]["about.md"]["mtime_ns"]
+        self.assertEqual((self.root / "about.md").stat().st_mtime_ns, about)
+        self.assertGreater((self.root / "index.md").stat().st_mtime_ns, 1)
+        self.assertEqual(touched, len(report["affected"]))
+        self.assertEqual(restored, len(graph.files) - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import tempfile
+import threading
+import time
+import unittest
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from scripts.check_links import InternalResolver, LinkChecker, extract_links, internal_path
+from scripts.post_index import PostIndex
+
+
+class LinkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    requests: Counter = Counter()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - keep test output quiet
+        pass
+
+    def respond(self, status: int, headers: dict | None = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_HEAD(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.requests[(self.command, self.path)] += 1
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            time.sleep(0.02)
+            if self.path == "/photo.jpg":
+                if self.headers.get("If-None-Match") == '"v1"':
+                    self.respond(304)
+                else:
+                    self.respond(200, {"ETag": '"v1"'})
+            elif self.path == "/moved":
+                self.respond(301, {"Location": "/photo.jpg"})
+            elif self.path == "/no-head" and self.command == "HEAD":
+                self.respond(405)
+            elif self.path.startswith("/slow/") or self.path == "/no-head":
+                self.respond(200)
+            else:
+                self.respond(404)
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    do_GET = do_HEAD
+
+
+class LinkCheckerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        LinkHandler.requests = Counter()
+        LinkHandler.active = LinkHandler.peak = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), LinkHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.checker = LinkChecker(workers=8, per_host=2, timeout=2)
+
+    def tearDown(self) -> None:
+        self.checker.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_caches_results_and_revalidates_stale_entries(self) -> None:
+        urls = [f"{self.base_url}/photo.jpg", f"{self.base_url}/missing.jpg", f"{self.base_url}/moved", f"{self.base_url}/no-head"]
+        cache, requested = self.checker.check_all(urls, {}, ttl=3600)
+
+        self.assertEqual(sorted(requested), sorted(urls))
+        entries = cache["urls"]
+        self.assertEqual((entries[urls[0]]["ok"], entries[urls[0]]["etag"]), (True, '"v1"'))
+        self.assertEqual((entries[urls[1]]["ok"], entries[urls[1]]["status"]), (False, 404))
+        self.assertEqual(entries[urls[2]]["final_url"], urls[0])
+        self.assertTrue(entries[urls[3]]["ok"])
+        self.assertEqual(LinkHandler.requests[("GET", "/no-head")], 1)
+
+        _, requested = self.checker.check_all(urls, cache, ttl=3600)
+        self.assertEqual(requested, [urls[1]])  # only the failure is re-checked
+
+        cache, requested = self.checker.check_all(urls[:1], cache, ttl=3600, now=time.time() + 7200)
+        self.assertEqual(requested, urls[:1])
+        self.assertEqual((cache["urls"][urls[0]]["status"], cache["urls"][urls[0]]["etag"]), (304, '"v1"'))
+        self.assertEqual(list(cache["urls"]), urls[:1])
+
+    def test_limits_concurrent_requests_per_host(self) -> None:
+        urls = [f"{self.base_url}/slow/{n}" for n in range(12)]
+
+        cache, _ = self.checker.check_all(urls, {}, ttl=3600)
+
+        self.assertTrue(all(entry["ok"] for entry in cache["urls"].values()))
+        self.assertEqual(LinkHandler.peak, 2)
+
+    def test_connection_errors_are_recorded_as_failures(self) -> None:
+        entry = self.checker.check("http://127.0.0.1:9/unreachable")
+
+        self.assertEqual((entry["ok"], entry["status"]), (False, 0))
+        self.assertIn("Error", entry["error"])
+
+
+class InternalLinkTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        posts = self.root / "_posts"
+        posts.mkdir()
+        (posts / "2026-03-01-hope.md").write_text(
+            "---\ntitle: Hope\ndate: 2026-03-01\ncategories: [Community]\n---\n"
+            "See [the gallery](/media/2026/02/17/videos.html) and ![x](/photos/1.jpg)\n"
+            '<img src="https://images.example.org/a.jpg"> {{ site.url }}/{{ page.url }}\n',
+            encoding="utf-8",
+        )
+        (self.root / "photos").mkdir()
+        (self.root / "photos" / "1.jpg").write_bytes(b"jpg")
+        self.index = PostIndex(posts, self.root / "index.json")
+        self.index.refresh()
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_extracts_links_with_locations(self) -> None:
+        links = extract_links([self.root / "_posts" / "2026-03-01-hope.md"])
+
+        self.assertEqual(
+            sorted(links),
+            ["/media/2026/02/17/videos.html", "/photos/1.jpg", "https://images.example.org/a.jpg"],
+        )
+        self.assertTrue(links["/photos/1.jpg"][0].endswith("2026-03-01-hope.md:6"))
+
+    def test_resolves_posts_pages_and_files_without_network(self) -> None:
+        resolver = InternalResolver(self.index, ["/search/"], self.root)
+
+        self.assertTrue(resolver.exists("/community/2026/03/01/hope.html"))
+        self.assertTrue(resolver.exists("/community/2026/03/01/hope"))
+        self.assertTrue(resolver.exists("/search"))
+        self.assertTrue(resolver.exists("/photos/1.jpg"))
+        self.assertFalse(resolver.exists("/media/2026/02/17/videos.html"))
+        self.assertEqual(internal_path("https://blog.example.org/search/?q=x", "https://blog.example.org"), "/search/")
+        self.assertIsNone(internal_path("https://images.example.org/a.jpg", "https://blog.example.org"))
+
+
+if __name__ == "__main__":
+    unittest.main()
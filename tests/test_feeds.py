@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+import xml.dom.minidom
+from pathlib import Path
+
+from scripts.build_feeds import check_feeds, collect_pages, update_feeds
+from scripts.post_index import PostIndex
+
+POST = '---\ntitle: "{title}"\ndate: {date}\ncategories: [News]\nexcerpt: "About {title}"\nimage: /photos/{slug}.jpg\n---\nBody\n'
+
+
+class FeedTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.posts_dir = self.root / "_posts"
+        self.posts_dir.mkdir()
+        for day in (5, 12):
+            self.write_post(f"2026-01-{day:02d}", f"post-{day}")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def write_post(self, date: str, slug: str, title: str | None = None) -> None:
+        text = POST.format(title=title or slug.title(), date=date, slug=slug)
+        (self.posts_dir / f"{date}-{slug}.md").write_text(text, encoding="utf-8")
+
+    def update(self, cache: dict, limit: int = 10, full: bool = False) -> tuple[dict, dict]:
+        index = PostIndex.load(self.posts_dir, self.root / "index.json")
+        paths = (self.root / "sitemap.xml", self.root / "feed.xml")
+        return update_feeds(index, ["/", "/about/"], cache, "https://example.org", *paths, limit, full)
+
+    def outputs(self) -> tuple[str, str]:
+        return tuple((self.root / name).read_text(encoding="utf-8") for name in ("sitemap.xml", "feed.xml"))
+
+    def test_new_post_is_appended_and_matches_a_full_rebuild(self) -> None:
+        cache, summary = self.update({})
+        self.assertEqual((summary["sitemap"], summary["feed"]), ("rewritten", "rewritten"))
+        cache, summary = self.update(cache)
+        self.assertEqual((summary["rendered"], summary["sitemap"], summary["feed"]), (0, "unchanged", "unchanged"))
+
+        self.write_post("2026-01-19", "post-19", "Tips & Tricks")
+        cache, summary = self.update(cache)
+        self.assertEqual((summary["rendered"], summary["sitemap"], summary["feed"]), (1, "appended", "rewritten"))
+        incremental = self.outputs()
+
+        self.update({}, full=True)
+        self.assertEqual(self.outputs(), incremental)
+        sitemap, feed = incremental
+        for text in incremental:
+            xml.dom.minidom.parseString(text)
+        self.assertIn("<loc>https://example.org/about/</loc>", sitemap)
+        self.assertIn("<loc>https://example.org/news/2026/01/19/post-19.html</loc><lastmod>2026-01-19T00:00:00+00:00</lastmod>", sitemap)
+        self.assertLess(feed.index("Tips &amp; Tricks"), feed.index("Post-12"))
+        self.assertIn('url="https://example.org/photos/post-19.jpg"', feed)
+
+    def test_older_or_edited_posts_rewrite_the_sitemap_in_order(self) -> None:
+        cache, _ = self.update({}, limit=1)
+        self.write_post("2025-12-29", "post-old")
+        cache, summary = self.update(cache, limit=1)
+        self.assertEqual((summary["sitemap"], summary["feed"]), ("rewritten", "unchanged"))
+
+        (self.posts_dir / "2026-01-05-post-5.md").unlink()
+        cache, summary = self.update(cache, limit=1)
+        sitemap, _ = self.outputs()
+        self.assertEqual(summary["sitemap"], "rewritten")
+        self.assertNotIn("post-5.html", sitemap)
+        self.assertLess(sitemap.index("post-old.html"), sitemap.index("post-12.html"))
+
+    def test_check_flags_stale_files_and_the_cache_survives_a_fresh_checkout(self) -> None:
+        cache, _ = self.update({})
+        for path in self.root.rglob("*"):
+            os.utime(path, ns=(1, 1))  # a fresh checkout gives every file a new mtime
+
+        cache, summary = self.update(cache)
+        self.assertEqual((summary["rendered"], summary["sitemap"], summary["feed"]), (0, "unchanged", "unchanged"))
+
+        index = PostIndex.load(self.posts_dir, self.root / "index.json")
+        paths = (self.root / "sitemap.xml", self.root / "feed.xml")
+        self.assertEqual(check_feeds(index, ["/", "/about/"], "https://example.org", *paths), [])
+        self.write_post("2026-01-19", "post-19")
+        index = PostIndex.load(self.posts_dir, self.root / "index.json")
+        self.assertEqual(check_feeds(index, ["/", "/about/"], "https://example.org", *paths), list(paths))
+
+    def test_pages_use_permalinks_and_skip_files_without_front_matter(self) -> None:
+        (self.root / "index.md").write_text("---\nlayout: home\n---\n", encoding="utf-8")
+        (self.root / "about.md").write_text("---\npermalink: /about/\n---\n", encoding="utf-8")
+        (self.root / "notes.md").write_text("# Not rendered by Jekyll\n", encoding="utf-8")
+        (self.root / "blogs").mkdir()
+        (self.root / "blogs" / "index.md").write_text("---\ntitle: Blogs\n---\n", encoding="utf-8")
+        (self.root / "blogs" / "hidden.md").write_text("---\nsitemap: false\n---\n", encoding="utf-8")
+
+        self.assertEqual(collect_pages(self.root), ["/", "/about/", "/blogs/"])
+
+
+if __name__ == "__main__":
+    unittest.main()
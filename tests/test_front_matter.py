@@ -0,0 +1,78 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.front_matter import FrontMatterError, PostFile, parse_yaml, read_front_matter
+from scripts.generate_post import build_post
+from scripts.post_to_social import parse_front_matter
+
+
+def sample_post() -> str:
+    return build_post(
+        title="Real title",
+        excerpt='Excerpt with "quotes"',
+        category="News",
+        tags=["childhood cancer", "ghana"],
+        image_url="https://example.com/image.jpg",
+        image_alt="alt",
+        permalink_slug="real-title",
+        seo_title="SEO title",
+        seo_description="SEO description",
+        body="Body line one\n\n---\n\nBody after a rule",
+        publish_date="2026-02-16",
+    )
+
+
+class FrontMatterTests(unittest.TestCase):
+    def test_nested_seo_block_does_not_overwrite_title(self) -> None:
+        fm = parse_front_matter(sample_post())
+
+        self.assertEqual(fm["title"], "Real title")
+        self.assertEqual(fm["seo"], {"title": "SEO title", "description": "SEO description"})
+        self.assertEqual(fm["tags"], ["childhood cancer", "ghana"])
+        self.assertEqual(fm["_body"], "Body line one\n\n---\n\nBody after a rule")
+
+    def test_quoting_flow_lists_and_lists_of_maps(self) -> None:
+        data = parse_yaml(
+            [
+                "tags: [a, \"b, c\", 'it''s']\n",
+                'title: "Say \\"hi\\"" \n',
+                "plain: value # comment\n",
+                "videos:\n",
+                "- id: abc\n",
+                "  title: First\n",
+                "- id: def\n",
+                "after: done\n",
+                '"/a: b/": quoted key\n',
+            ]
+        )
+
+        self.assertEqual(data["tags"], ["a", "b, c", "it's"])
+        self.assertEqual(data["title"], 'Say "hi"')
+        self.assertEqual(data["plain"], "value")
+        self.assertEqual(data["videos"], [{"id": "abc", "title": "First"}, {"id": "def"}])
+        self.assertEqual(data["after"], "done")
+        self.assertEqual(data["/a: b/"], "quoted key")
+
+    def test_reader_stops_at_closing_fence(self) -> None:
+        handle = io.BytesIO(b"---\ntitle: A\n---\nbody: not front matter\n")
+
+        self.assertEqual(read_front_matter(handle), {"title": "A"})
+        self.assertEqual(handle.read(), b"body: not front matter\n")
+        with self.assertRaises(FrontMatterError):
+            read_front_matter(io.BytesIO(b"---\ntitle: A\n"))
+
+    def test_post_file_streams_body_lazily(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "post.md"
+            path.write_text(sample_post(), encoding="utf-8")
+
+            post = PostFile(path)
+            self.assertEqual(post.get("permalink"), "/real-title/")
+            self.assertEqual(next(post.iter_body()), "Body line one\n")
+            self.assertTrue(post.read_body().endswith("Body after a rule\n"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,13 @@
+import tempfile
 import unittest
+from datetime import date
+from pathlib import Path
+from unittest import mock
 
-from scripts.generate_post import build_post
+from scripts import generate_post
+from scripts.generate_post import build_post, get_topic_for_week, load_topic_catalog, plan_batch, resolve_batch_dates
+from scripts.near_duplicates import NearDuplicateIndex
+from scripts.post_index import PostIndex
 
 
 class BuildPostTests(unittest.TestCase):
@@ -45,5 +52,84 @@ class BuildPostTests(unittest.TestCase):
         self.assertTrue(md.endswith("Main body text\n"))
 
 
+class TopicCatalogTests(unittest.TestCase):
+    def test_every_catalog_topic_renders(self) -> None:
+        topics = load_topic_catalog()["topics"]
+        required = {"title", "excerpt", "category", "tags", "image", "image_alt", "seo_title", "seo_description", "permalink_slug"}
+
+        for week_index in range(1, len(topics) + 1):
+            topic = get_topic_for_week(week_index)
+            self.assertLessEqual(required, set(topic))
+            self.assertTrue(topic["body"].startswith("## "))
+
+    def test_topic_rotation_wraps_and_does_not_mutate_catalog(self) -> None:
+        count = len(load_topic_catalog()["topics"])
+
+        self.assertEqual(get_topic_for_week(1), get_topic_for_week(count + 1))
+        self.assertIsInstance(load_topic_catalog()["topics"][0]["body"], str)
+        self.assertNotIn("\n", load_topic_catalog()["topics"][0]["body"])
+
+
+class BatchPlanTests(unittest.TestCase):
+    def test_resolve_batch_dates_steps_weekly(self) -> None:
+        self.assertEqual(
+            resolve_batch_dates("2026-01-05", "2026-01-20", None, "2026-02-16"),
+            [date(2026, 1, 5), date(2026, 1, 12), date(2026, 1, 19)],
+        )
+        self.assertEqual(
+            resolve_batch_dates(None, None, 2, "2026-02-16"),
+            [date(2026, 2, 9), date(2026, 2, 16)],
+        )
+
+    def test_plan_batch_flags_repeated_topics_as_colliding(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            posts_dir = Path(tmp) / "_posts"
+            posts_dir.mkdir()
+            index = PostIndex(posts_dir, Path(tmp) / "index.json")
+            dates = resolve_batch_dates("2026-01-05", None, 11, "2026-01-05")
+
+            with mock.patch.object(generate_post, "POSTS_DIR", posts_dir):
+                plans = plan_batch(dates, index, force=False)
+
+        statuses = [plan["status"] for plan in plans]
+        self.assertEqual(statuses.count("create"), 10)
+        self.assertEqual(statuses[-1], "colliding")
+
+    def test_plan_batch_skips_bodies_that_repeat_earlier_posts(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            posts_dir = Path(tmp) / "_posts"
+            posts_dir.mkdir()
+            index = PostIndex(posts_dir, Path(tmp) / "index.json")
+            dates = resolve_batch_dates("2026-01-05", None, 10, "2026-01-05")
+
+            with mock.patch.object(generate_post, "POSTS_DIR", posts_dir):
+                plans = plan_batch(dates, index, False, NearDuplicateIndex(), skip_near_duplicates=True)
+
+        created = [plan for plan in plans if plan["status"] == "create"]
+        self.assertEqual(len({plan["topic"]["body"] for plan in created}), len(created))
+        skipped = [plan for plan in plans if plan["status"] == "near-duplicate"]
+        self.assertEqual(len(created) + len(skipped), 10)
+        original = next(plan for plan in created if plan["topic"]["body"] == skipped[0]["topic"]["body"])
+        self.assertIn(f"near-duplicate of {original['path'].as_posix()} (similarity 1.00)", skipped[0]["reason"])
+
+    def test_plan_batch_suffixes_slugs_used_by_other_posts(self) -> None:
+        topic = get_topic_for_week(2)
+        with tempfile.TemporaryDirectory() as tmp:
+            posts_dir = Path(tmp) / "_posts"
+            posts_dir.mkdir()
+            (posts_dir / f"2025-01-06-{generate_post.slugify(topic['title'])}.md").write_text(
+                f'---\ntitle: "Another post"\npermalink: /{topic["permalink_slug"]}/\n---\nBody\n',
+                encoding="utf-8",
+            )
+            index = PostIndex.load(posts_dir, Path(tmp) / "index.json")
+
+            with mock.patch.object(generate_post, "POSTS_DIR", posts_dir):
+                (plan,) = plan_batch([date(2026, 1, 5)], index, force=False)
+
+        self.assertEqual(plan["status"], "create")
+        self.assertEqual(plan["path"].name, f"2026-01-05-{generate_post.slugify(topic['title'])}-2.md")
+        self.assertEqual(plan["topic"]["permalink_slug"], f"{topic['permalink_slug']}-2")
+
+
 if __name__ == "__main__":
     unittest.main()
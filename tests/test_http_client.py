@@ -0,0 +1,62 @@
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from scripts.http_client import HttpClient, HttpError
+
+
+class EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+
+    def log_message(self, format, *args) -> None:  # noqa: A002 - keep test output quiet
+        pass
+
+    def do_POST(self) -> None:
+        EchoHandler.connections.add(self.client_address)
+        payload = self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"path": self.path, "received": json.loads(payload)}).encode("utf-8")
+        status = 400 if self.path == "/fail" else 200
+
+        self.send_response(status)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class HttpClientTests(unittest.TestCase):
+    def setUp(self) -> None:
+        EchoHandler.connections = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), EchoHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+        self.client = HttpClient(connect_timeout=2, read_timeout=2)
+
+    def tearDown(self) -> None:
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_to_same_host_reuse_one_connection(self) -> None:
+        for n in range(3):
+            status, text = self.client.request("POST", f"{self.base_url}/media?n={n}", json.dumps({"n": n}).encode())
+            self.assertEqual(status, 200)
+            self.assertEqual(json.loads(text), {"path": f"/media?n={n}", "received": {"n": n}})
+
+        self.assertEqual(len(EchoHandler.connections), 1)
+
+    def test_error_status_raises_http_error_with_decoded_body(self) -> None:
+        with self.assertRaises(HttpError) as ctx:
+            self.client.request("POST", f"{self.base_url}/fail", b"{}")
+
+        self.assertEqual(ctx.exception.status, 400)
+        self.assertIn('"path": "/fail"', ctx.exception.body)
+
+
+if __name__ == "__main__":
+    unittest.main()
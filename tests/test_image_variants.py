@@ -0,0 +1,85 @@
+import tempfile
+import unittest
+from contextlib import chdir
+from pathlib import Path
+
+from scripts import build_image_variants
+from scripts.build_image_variants import (
+    build_variants,
+    collect_references,
+    file_hash,
+    load_manifest,
+    render_manifest,
+    variant_paths,
+)
+from scripts.post_index import PostIndex
+
+RAW_URL = "https://raw.githubusercontent.com/learngermanghana/weso-blog/main/photos/Family%20Day.jpg"
+
+
+class ImageVariantTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "photos").mkdir()
+        (self.root / "photos" / "Family Day.jpg").write_bytes(b"not really a jpeg")
+        posts_dir = self.root / "_posts"
+        posts_dir.mkdir()
+        for slug, image in (("local", RAW_URL), ("remote", "https://images.pexels.com/photos/1.jpeg")):
+            (posts_dir / f"2026-01-05-{slug}.md").write_text(f"---\ntitle: {slug}\nimage: {image}\n---\nBody\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def references(self) -> dict[str, Path]:
+        return collect_references(PostIndex.load(Path("_posts"), Path("index.json")))
+
+    def test_local_images_are_keyed_by_every_reference(self) -> None:
+        with chdir(self.root):
+            references = self.references()
+
+        self.assertEqual(references, {"/photos/Family Day.jpg": Path("photos/Family Day.jpg"), RAW_URL: Path("photos/Family Day.jpg")})
+
+    def test_unchanged_sources_reuse_their_variants(self) -> None:
+        with chdir(self.root):
+            digest = file_hash(Path("photos/Family Day.jpg"))
+            name = f"family-day-{digest[:12]}-480"
+            entry = {
+                "hash": digest,
+                "width": 480,
+                "height": 320,
+                "src": f"/assets/img/responsive/{name}.jpg",
+                "srcset_webp": f"/assets/img/responsive/{name}.webp 480w",
+                "srcset_jpg": f"/assets/img/responsive/{name}.jpg 480w",
+            }
+            for path in variant_paths(entry):
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_bytes(b"variant")
+            Path("images.yml").write_text(render_manifest({RAW_URL: entry}), encoding="utf-8")
+
+            entries, processed = build_variants(self.references(), load_manifest(Path("images.yml")))
+
+        self.assertEqual(processed, 0)
+        self.assertEqual(entries["/photos/Family Day.jpg"], entry)
+
+    @unittest.skipIf(build_image_variants.Image is None, "Pillow is not installed")
+    def test_sources_are_resized_to_standard_widths(self) -> None:
+        image = build_image_variants.Image.new("RGB", (1000, 500), "orange")
+        with chdir(self.root):
+            image.save("photos/Family Day.jpg", "JPEG")
+            entries, processed = build_variants(self.references(), {}, workers=1)
+
+        entry = entries[RAW_URL]
+        self.assertEqual(processed, 1)
+        self.assertEqual((entry["width"], entry["height"]), (1000, 500))
+        self.assertEqual(entry["srcset_jpg"].count("w, "), 2)
+        self.assertTrue(all((self.root / path).is_file() for path in variant_paths(entry)))
+
+    @unittest.skipIf(build_image_variants.Image is not None, "Pillow is installed")
+    def test_missing_variants_need_pillow(self) -> None:
+        with chdir(self.root), self.assertRaises(RuntimeError):
+            build_variants(self.references(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import io
+import json
+import pstats
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+
+from scripts.metrics import METRICS, Metrics, run_instrumented
+
+
+class MetricsTests(unittest.TestCase):
+    def test_spans_aggregate_durations_and_numeric_attributes(self) -> None:
+        metrics = Metrics()
+        for size in (100, 250):
+            with metrics.span("http.api.example.com") as span:
+                span["request_bytes"] = size
+                span["status"] = "ok"
+        metrics.count("bytes_read", 10)
+        metrics.count("bytes_read", 5)
+
+        snapshot = metrics.snapshot()
+        http = snapshot["spans"]["http.api.example.com"]
+        self.assertEqual(http["count"], 2)
+        self.assertEqual(http["request_bytes"], 350)
+        self.assertNotIn("status", http)
+        self.assertGreaterEqual(http["total_s"], http["max_s"])
+        self.assertEqual(snapshot["counters"], {"bytes_read": 15})
+
+    def test_run_instrumented_writes_metrics_and_profile(self) -> None:
+        METRICS.reset()
+        with tempfile.TemporaryDirectory() as tmp:
+            metrics_path, profile_path = Path(tmp) / "metrics.json", Path(tmp) / "run.prof"
+
+            def run() -> int:
+                with METRICS.span("render"):
+                    sum(range(1000))
+                return 3
+
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(run_instrumented(run, metrics_path, profile_path), 3)
+
+            written = json.loads(metrics_path.read_text(encoding="utf-8"))
+            self.assertEqual(set(written["spans"]), {"render", "total"})
+            self.assertGreater(pstats.Stats(str(profile_path)).total_calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
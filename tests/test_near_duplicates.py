@@ -0,0 +1,59 @@
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.near_duplicates import NearDuplicateIndex, signature, similarity, update_signatures
+from scripts.post_index import PostIndex
+
+WORDS = "family hospital child cancer support volunteer donation awareness treatment care hope ghana".split()
+
+
+def essay(seed: int, words: int = 300) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) + str(rng.randrange(50)) for _ in range(words))
+
+
+class NearDuplicateTests(unittest.TestCase):
+    def test_signature_similarity_tracks_shared_text(self) -> None:
+        base = essay(1)
+        edited = base.replace(base.split()[10], "changed", 1)
+
+        self.assertEqual(similarity(signature(base), signature(base)), 1.0)
+        self.assertGreater(similarity(signature(base), signature(edited)), 0.8)
+        self.assertLess(similarity(signature(base), signature(essay(2))), 0.2)
+        self.assertEqual(signature("{% include x.html %}"), [])
+
+    def test_index_clusters_near_duplicates_only(self) -> None:
+        detector = NearDuplicateIndex()
+        base = essay(3)
+        detector.add("a.md", signature(base))
+        detector.add("b.md", signature(base + " one closing sentence"))
+        detector.add("c.md", signature(essay(4)))
+        detector.add("empty.md", [])
+
+        self.assertEqual(detector.clusters(), [["a.md", "b.md"]])
+        self.assertEqual([key for _, key in detector.query(signature(base), exclude="a.md")], ["b.md"])
+
+    def test_signatures_are_cached_per_body_hash(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            posts_dir = Path(tmp) / "_posts"
+            posts_dir.mkdir()
+            for name, body in (("2026-01-05-a.md", essay(5)), ("2026-01-12-b.md", essay(5)), ("2026-01-19-c.md", essay(6))):
+                (posts_dir / name).write_text(f"---\ntitle: {name}\n---\n{body}\n", encoding="utf-8")
+            index = PostIndex.load(posts_dir, Path(tmp) / "index.json")
+
+            cache, computed = update_signatures(index, {})
+            self.assertEqual((len(cache["files"]), computed), (3, 2))
+
+            (posts_dir / "2026-01-19-c.md").write_text(f"---\ntitle: renamed\n---\n{essay(5)}\n", encoding="utf-8")
+            index.refresh()
+            cache, computed = update_signatures(index, cache)
+
+        self.assertEqual(computed, 0)
+        self.assertEqual(len(cache["signatures"]), 1)
+        self.assertEqual(NearDuplicateIndex.from_cache(cache).clusters()[0], sorted(cache["files"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.generate_post import build_post
+from scripts.post_index import PostIndex
+
+
+def write_post(posts_dir: Path, name: str, title: str, permalink_slug: str) -> Path:
+    path = posts_dir / name
+    path.write_text(
+        build_post(
+            title=title,
+            excerpt="Excerpt",
+            category="News",
+            tags=["a", "b"],
+            image_url="https://example.com/image.jpg",
+            image_alt="alt",
+            permalink_slug=permalink_slug,
+            seo_title="SEO title",
+            seo_description="SEO description",
+            body="Body text",
+            publish_date="2026-02-16",
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+class PostIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.posts_dir = root / "_posts"
+        self.posts_dir.mkdir()
+        self.index_path = root / ".cache" / "post-index.json"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_lookups_use_top_level_front_matter(self) -> None:
+        write_post(self.posts_dir, "2026-02-16-first-post.md", "First post", "first")
+
+        index = PostIndex.load(self.posts_dir, self.index_path)
+
+        self.assertTrue(index.has_title("First post"))
+        self.assertFalse(index.has_title("SEO title"))
+        self.assertTrue(index.has_slug("first-post"))
+        self.assertTrue(index.has_permalink("first"))
+        entry = index.get(self.posts_dir / "2026-02-16-first-post.md")
+        self.assertEqual(entry["tags"], ["a", "b"])
+        self.assertEqual(entry["date"], "2026-02-16")
+
+    def test_saved_index_tracks_changed_and_removed_posts(self) -> None:
+        first = write_post(self.posts_dir, "2026-02-16-first-post.md", "First post", "first")
+        write_post(self.posts_dir, "2026-02-16-second-post.md", "Second post", "second")
+        PostIndex.load(self.posts_dir, self.index_path).save()
+        self.assertTrue(self.index_path.exists())
+
+        first.unlink()
+        write_post(self.posts_dir, "2026-02-16-second-post.md", "Renamed post", "second")
+        index = PostIndex.load(self.posts_dir, self.index_path)
+
+        self.assertFalse(index.has_title("First post"))
+        self.assertFalse(index.has_title("Second post"))
+        self.assertTrue(index.has_title("Renamed post"))
+
+
+if __name__ == "__main__":
+    unittest.main()
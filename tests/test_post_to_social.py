@@ -0,0 +1,294 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+from scripts import post_to_social
+from scripts.post_to_social import (
+    TokenBucket,
+    finish_job,
+    parse_rate,
+    publish_channels,
+    publish_instagram,
+    publish_linkedin,
+    publish_medium,
+    publish_pipeline,
+    resolve_post_paths,
+    saved_container,
+    start_post,
+)
+from scripts.http_client import HttpError
+from scripts.publish_ledger import PublishLedger
+from scripts.social_stand_in import start_stand_in
+
+
+class PublishChannelsTests(unittest.TestCase):
+    def test_failing_and_slow_channels_do_not_block_others(self) -> None:
+        release = threading.Event()
+
+        def fail(deadline: float) -> str:
+            raise RuntimeError("boom")
+
+        def hang(deadline: float) -> str:
+            release.wait(5)
+            return "published"
+
+        try:
+            results = publish_channels(
+                {"linkedin": lambda deadline: "published", "instagram": fail, "medium": hang},
+                timeout=0.2,
+            )
+        finally:
+            release.set()
+
+        by_channel = {r["channel"]: r for r in results}
+        self.assertEqual(by_channel["linkedin"]["status"], "published")
+        self.assertEqual(by_channel["instagram"]["status"], "failed")
+        self.assertEqual(by_channel["instagram"]["error"], "boom")
+        self.assertEqual(by_channel["medium"]["status"], "timeout")
+
+    def test_sequential_mode_reports_every_channel(self) -> None:
+        results = publish_channels({"linkedin": lambda deadline: "skipped", "medium": lambda deadline: "dry-run"}, concurrent=False)
+
+        self.assertEqual([r["status"] for r in results], ["skipped", "dry-run"])
+        self.assertTrue(all(r["error"] is None for r in results))
+
+
+class PublishPipelineTests(unittest.TestCase):
+    def test_token_bucket_spaces_out_acquires_after_burst(self) -> None:
+        bucket = TokenBucket(rate_per_second=20.0, capacity=2)
+
+        waits = [bucket.acquire() for _ in range(4)]
+
+        self.assertEqual(waits[:2], [0.0, 0.0])
+        self.assertGreater(sum(waits[2:]), 0.05)
+
+    def test_parse_rate_converts_units(self) -> None:
+        self.assertEqual(parse_rate("linkedin=30/min"), ("linkedin", 0.5))
+        self.assertEqual(parse_rate("medium=2"), ("medium", 2.0))
+        with self.assertRaises(ValueError):
+            parse_rate("myspace=1/min")
+
+    def test_resolve_post_paths_deduplicates_sources(self) -> None:
+        paths = list(resolve_post_paths(["_posts/a.md", "_posts/b.md", "_posts/a.md"], [], None))
+
+        self.assertEqual(paths, [Path("_posts/a.md"), Path("_posts/b.md")])
+
+    def test_pipeline_publishes_every_post_and_isolates_failures(self) -> None:
+        ledger = PublishLedger(Path(tempfile.mkdtemp()) / "ledger.jsonl")
+
+        def prepare(post_path: Path) -> dict:
+            if post_path.name == "bad.md":
+                raise FileNotFoundError("missing")
+
+            def fail(deadline: float) -> str:
+                raise RuntimeError("quota")
+
+            return {
+                "path": post_path.as_posix(),
+                "ledger": ledger.for_post(post_path.name, post_path.as_posix()),
+                "jobs": {"linkedin": lambda deadline: "published", "medium": fail},
+                "done": [],
+            }
+
+        posts = [Path(f"_posts/{n}.md") for n in range(5)] + [Path("bad.md")]
+        results = publish_pipeline(posts, prepare, {}, timeout=1, concurrency=2)
+
+        statuses = [(r["post"], r["channel"], r["status"]) for r in results]
+        self.assertEqual(len(results), 11)
+        self.assertIn(("bad.md", "-", "failed"), statuses)
+        self.assertEqual(sum(1 for _, c, st in statuses if c == "linkedin" and st == "published"), 5)
+        self.assertEqual(ledger.latest("3.md", "medium")["status"], "failed")
+
+    def test_start_post_and_finish_job_report_like_the_pipeline(self) -> None:
+        ledger = PublishLedger(Path(tempfile.mkdtemp()) / "ledger.jsonl")
+        post_ledger = ledger.for_post("a.md", "_posts/a.md")
+        post_ledger.record("medium", "published", "m-1")
+
+        def prepare(post_path: Path) -> dict:
+            if post_path.name == "bad.md":
+                raise FileNotFoundError("missing")
+            return {"path": post_path.as_posix(), "ledger": post_ledger, "jobs": {}, "done": ["medium"]}
+
+        self.assertEqual(start_post(Path("bad.md"), prepare)[0], None)
+        self.assertEqual(start_post(Path("bad.md"), prepare)[1][0]["status"], "failed")
+        post, rows = start_post(Path("_posts/a.md"), prepare)
+        self.assertEqual([(r["status"], r["remote_id"]) for r in rows], [("already-published", "m-1")])
+
+        timed_out = {"channel": "linkedin", "status": "timeout", "latency": 1.0, "error": "timed out after 1.0s"}
+        self.assertEqual(finish_job(post, timed_out, dry_run=False)["post"], "_posts/a.md")
+        self.assertEqual(post_ledger.latest("linkedin")["status"], "failed")
+
+
+class PublishLedgerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ledger_path = Path(self.tmp.name) / "ledger.jsonl"
+        env = {"INSTAGRAM_ACCESS_TOKEN": "token", "INSTAGRAM_ACCOUNT_ID": "42"}
+        self.env = mock.patch.dict(os.environ, env)
+        self.env.start()
+
+    def tearDown(self) -> None:
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_ledger_survives_reload_and_ignores_torn_lines(self) -> None:
+        ledger = PublishLedger.load(self.ledger_path).for_post("abc", "_posts/x.md")
+        ledger.record("medium", "published", "m-1")
+        with self.ledger_path.open("a", encoding="utf-8") as handle:
+            handle.write('{"hash": "abc", "chan')
+
+        reloaded = PublishLedger.load(self.ledger_path).for_post("abc", "_posts/x.md")
+
+        self.assertTrue(reloaded.is_published("medium"))
+        self.assertFalse(reloaded.is_published("linkedin"))
+        self.assertEqual(reloaded.latest("medium")["remote_id"], "m-1")
+
+    def test_instagram_resumes_from_saved_container(self) -> None:
+        ledger = PublishLedger.load(self.ledger_path).for_post("abc", "_posts/x.md")
+        calls = []
+
+        def interrupted(url, payload, headers, deadline=None):
+            calls.append(url)
+            if url.endswith("/media"):
+                return 200, '{"id": "container-7"}'
+            raise ConnectionResetError("interrupted")
+
+        with mock.patch.object(post_to_social, "post_json", interrupted):
+            with self.assertRaises(ConnectionResetError):
+                publish_instagram("caption", "https://example.com/p/", "https://example.com/i.jpg", False, ledger=ledger)
+
+        def succeed(url, payload, headers, deadline=None):
+            calls.append(url)
+            return 200, '{"id": "media-9"}'
+
+        calls.clear()
+        resumed = PublishLedger.load(self.ledger_path).for_post("abc", "_posts/x.md")
+        with mock.patch.object(post_to_social, "post_json", succeed):
+            status = publish_instagram("caption", "https://example.com/p/", "https://example.com/i.jpg", False, ledger=resumed)
+
+        self.assertEqual(status, "published")
+        self.assertEqual(calls, ["https://graph.facebook.com/v20.0/42/media_publish"])
+        self.assertEqual(resumed.latest("instagram")["remote_id"], "media-9")
+        self.assertEqual(resumed.latest("instagram")["creation_id"], "container-7")
+
+    def test_expired_or_rejected_saved_containers_are_replaced(self) -> None:
+        ledger = PublishLedger.load(self.ledger_path).for_post("abc", "_posts/x.md")
+        ledger.record("instagram", "container", "container-7")
+        now = datetime.now(timezone.utc)
+        self.assertEqual(saved_container(ledger, now), "container-7")
+        self.assertIsNone(saved_container(ledger, now + timedelta(hours=24)))
+
+        calls = []
+
+        def expired(url, payload, headers, deadline=None):
+            calls.append((url.rsplit("/", 1)[-1], payload.get("creation_id")))
+            if url.endswith("/media"):
+                return 200, '{"id": "container-8"}'
+            if payload["creation_id"] == "container-7":
+                raise HttpError(400, url, '{"error": {"message": "media expired"}}')
+            return 200, '{"id": "media-9"}'
+
+        with mock.patch.object(post_to_social, "post_json", expired):
+            status = publish_instagram("caption", "https://example.com/p/", "https://example.com/i.jpg", False, ledger=ledger)
+
+        self.assertEqual(status, "published")
+        self.assertEqual(calls, [("media_publish", "container-7"), ("media", None), ("media_publish", "container-8")])
+        self.assertEqual(ledger.latest("instagram")["creation_id"], "container-8")
+
+    def test_instagram_failure_in_pipeline_resumes_container_on_rerun(self) -> None:
+        ledger = PublishLedger.load(self.ledger_path)
+        calls = []
+        fail_publish = [True]
+
+        def fake_post_json(url, payload, headers, deadline=None):
+            calls.append(url.rsplit("/", 1)[-1])
+            if url.endswith("/media"):
+                return 200, '{"id": "container-7"}'
+            if fail_publish[0]:
+                raise RuntimeError("media_publish failed")
+            return 200, '{"id": "media-9"}'
+
+        def prepare(post_path: Path) -> dict:
+            post_ledger = ledger.for_post("abc", post_path.as_posix())
+            job = lambda deadline: publish_instagram("caption", "https://example.com/p/", "https://example.com/i.jpg", False, deadline, post_ledger)
+            return {"path": post_path.as_posix(), "ledger": post_ledger, "jobs": {"instagram": job}, "done": []}
+
+        with mock.patch.object(post_to_social, "post_json", fake_post_json):
+            first = publish_pipeline([Path("_posts/x.md")], prepare, {}, timeout=1, concurrency=1)
+            fail_publish[0] = False
+            second = publish_pipeline([Path("_posts/x.md")], prepare, {}, timeout=1, concurrency=1)
+
+        self.assertEqual([r["status"] for r in first + second], ["failed", "published"])
+        self.assertEqual(calls, ["media", "media_publish", "media_publish"])
+        self.assertEqual(ledger.latest("abc", "instagram", "published")["creation_id"], "container-7")
+
+
+class StandInTests(unittest.TestCase):
+    def start(self, **config) -> None:
+        server = start_stand_in({"retry_after": 0.01, **config})
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.addCleanup(post_to_social.HTTP_CLIENT.close)
+        env = {
+            "LINKEDIN_ACCESS_TOKEN": "token",
+            "LINKEDIN_PERSON_URN": "urn:li:person:1",
+            "MEDIUM_TOKEN": "token",
+            "MEDIUM_USER_ID": "7",
+            "INSTAGRAM_ACCESS_TOKEN": "token",
+            "INSTAGRAM_ACCOUNT_ID": "42",
+            **server.api_bases(),
+        }
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.server = server
+
+    def test_every_channel_publishes_through_the_stand_in(self) -> None:
+        self.start()
+        ledger = PublishLedger(Path(tempfile.mkdtemp()) / "ledger.jsonl").for_post("abc", "_posts/x.md")
+
+        self.assertEqual(publish_linkedin("text", "https://example.com/p/", False, ledger=ledger), "published")
+        self.assertEqual(publish_medium("Title", "Body", "https://example.com/p/", False, ledger=ledger), "published")
+        self.assertEqual(
+            publish_instagram("caption", "https://example.com/p/", "https://example.com/i.jpg", False, ledger=ledger),
+            "published",
+        )
+
+        self.assertTrue(ledger.latest("linkedin")["remote_id"].startswith("urn:li:share:"))
+        self.assertTrue(ledger.latest("instagram")["remote_id"].startswith("media-"))
+        self.assertEqual(self.server.snapshot()["instagram.publish 200"], 1)
+
+    def test_throttled_requests_are_retried_but_server_errors_are_not(self) -> None:
+        self.start(throttle_first=2)
+        self.assertEqual(publish_linkedin("text", "https://example.com/p/", False), "published")
+        self.assertEqual(self.server.snapshot()["linkedin 429"], 2)
+
+        self.server.config["error_rate"] = 1.0
+        with self.assertRaises(HttpError) as ctx:
+            publish_medium("Title", "Body", "https://example.com/p/", False)
+        self.assertEqual(ctx.exception.status, 500)
+        stats = self.server.snapshot()
+        self.assertEqual((stats["medium 429"], stats["medium 500"], stats["medium requests"]), (2, 1, 3))
+
+    def test_deadline_bounds_retries_and_sequential_jobs_report_timeout(self) -> None:
+        self.start(throttle_first=5, retry_after=0.5)
+        started = time.monotonic()
+        with self.assertRaises(HttpError):
+            publish_linkedin("text", "https://example.com/p/", False, started + 0.2)
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(self.server.snapshot()["linkedin requests"], 1)
+
+        with self.assertRaises(TimeoutError):
+            publish_linkedin("text", "https://example.com/p/", False, time.monotonic())
+        job = lambda deadline: publish_medium("Title", "Body", "https://example.com/p/", False, deadline - 1)
+        result = publish_channels({"medium": job}, timeout=0.5, concurrent=False)[0]
+        self.assertEqual(result["status"], "timeout")
+
+
+if __name__ == "__main__":
+    unittest.main()
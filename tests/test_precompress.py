@@ -0,0 +1,59 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts import precompress as precompress_module
+from scripts.precompress import precompress
+
+PAGE = "<html><body>" + "<p>Hope, dignity and support for children fighting cancer.</p>" * 50 + "</body></html>"
+
+
+class PrecompressTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.site, self.store = root / "_site", root / "store"
+        (self.site / "assets").mkdir(parents=True)
+        (self.site / "index.html").write_text(PAGE, encoding="utf-8")
+        (self.site / "about.html").write_text(PAGE, encoding="utf-8")
+        (self.site / "assets" / "main.css").write_text("body{color:#000}\n" * 40, encoding="utf-8")
+        (self.site / "tiny.js").write_text("x()", encoding="utf-8")
+        (self.site / "photo.jpg").write_bytes(b"\xff\xd8" * 500)
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_compresses_text_files_and_reuses_unchanged_content(self) -> None:
+        report = precompress(self.site, self.store, ("gz",), workers=1)
+
+        self.assertEqual((report["files"], report["compressed"], report["written"]), (3, 2, 3))
+        self.assertEqual(gzip.decompress((self.site / "index.html.gz").read_bytes()).decode("utf-8"), PAGE)
+        self.assertFalse((self.site / "tiny.js.gz").exists())
+        self.assertFalse((self.site / "photo.jpg.gz").exists())
+        self.assertLess(report["types"][".html"]["gz"], report["types"][".html"]["bytes"] / 10)
+
+        (self.site / "index.html.gz").unlink()  # jekyll build wipes the siblings
+        (self.site / "about.html").write_text(PAGE + "<!-- edited -->", encoding="utf-8")
+        report = precompress(self.site, self.store, ("gz",), workers=1)
+
+        self.assertEqual((report["compressed"], report["reused"], report["written"]), (1, 2, 3))
+        self.assertEqual(len(list(self.store.iterdir())), 3)
+
+    def test_removes_siblings_of_deleted_sources(self) -> None:
+        precompress(self.site, self.store, ("gz",), workers=1)
+        (self.site / "about.html").unlink()
+
+        report = precompress(self.site, self.store, ("gz",), workers=1)
+
+        self.assertEqual(report["removed"], 1)
+        self.assertFalse((self.site / "about.html.gz").exists())
+
+    @unittest.skipIf(precompress_module.zstd is None, "no zstd binding installed")
+    def test_writes_zstd_when_available(self) -> None:
+        precompress(self.site, self.store, ("gz", "zst"), workers=1)
+        self.assertTrue((self.site / "index.html.zst").is_file())
+
+
+if __name__ == "__main__":
+    unittest.main()
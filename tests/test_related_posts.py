@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.build_related_posts import render_yaml, update_related
+from scripts.post_index import PostIndex
+
+
+def write_post(posts_dir: Path, slug: str, tags: str, body: str) -> None:
+    (posts_dir / f"2026-01-05-{slug}.md").write_text(
+        f'---\ntitle: "{slug}"\ndate: 2026-01-05\ntags: [{tags}]\npermalink: /{slug}/\n---\n{body}\n',
+        encoding="utf-8",
+    )
+
+
+class RelatedPostsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.posts_dir = root / "_posts"
+        self.posts_dir.mkdir()
+        self.index_path = root / "index.json"
+        write_post(self.posts_dir, "fever", "symptoms", "Persistent fever and bruising are warning signs.")
+        write_post(self.posts_dir, "bruising", "symptoms", "Unexplained bruising and fever need a doctor.")
+        write_post(self.posts_dir, "donate", "giving", "Donations fund transport to hospital.")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def load(self) -> PostIndex:
+        return PostIndex.load(self.posts_dir, self.index_path)
+
+    def test_rows_rank_by_content_and_tag_similarity(self) -> None:
+        cache, recomputed = update_related(self.load(), {}, k=2)
+
+        self.assertEqual(recomputed, {"/fever/", "/bruising/", "/donate/"})
+        self.assertEqual(cache["rows"]["/fever/"][0][1], "/bruising/")
+        self.assertEqual(cache["rows"]["/donate/"], [])
+        self.assertIn('"/fever/":\n  - url: "/bruising/"\n    title: "bruising"', render_yaml(cache))
+
+    def test_only_affected_rows_are_recomputed(self) -> None:
+        cache, _ = update_related(self.load(), {}, k=2)
+        unchanged, recomputed = update_related(self.load(), cache, k=2)
+        self.assertEqual(recomputed, set())
+        self.assertEqual(unchanged["rows"], cache["rows"])
+
+        write_post(self.posts_dir, "hospital", "giving", "Hospital transport and donations for families.")
+        cache, recomputed = update_related(self.load(), cache, k=2)
+
+        self.assertEqual(recomputed, {"/hospital/"})
+        self.assertEqual(cache["rows"]["/donate/"][0][1], "/hospital/")
+        self.assertEqual(cache["rows"]["/fever/"][0][1], "/bruising/")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.front_matter import PostFile
+from scripts.generate_post import build_post
+from scripts.rerender_posts import migrate_posts
+
+BODY = "## Why it matters\n\nEarly detection saves lives.\n"
+
+
+class RerenderPostsTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.posts = Path(self.tmp.name)
+        self.current = self.posts / "2026-03-01-current.md"
+        self.current.write_text(
+            build_post("Current", "Excerpt", "Awareness", ["a", "b"], "https://x/img.jpg", "Alt", "current", "SEO", "Desc", BODY, "2026-03-01"),
+            encoding="utf-8",
+        )
+        self.old = self.posts / "2026-02-01-old.md"
+        self.old.write_text(
+            "---\ntitle: 'Old format'\nlayout: post\ncategories: Community\ndate: 2026-02-01 09:30:00 +0000\n"
+            "tags:\n  - hope\n  - ghana\npermalink: /old-format/\n---\n\n" + BODY + "\n\n",
+            encoding="utf-8",
+        )
+        self.custom = self.posts / "2026-01-01-custom.md"
+        self.custom.write_text("---\nlayout: post\ntitle: Custom\ndate: 2026-01-01\ncategories: [Media]\nsitemap: false\n---\nBody\n", encoding="utf-8")
+        self.moved = self.posts / "2026-01-02-moved.md"
+        self.moved.write_text("---\nlayout: post\ntitle: Moved\ndate: 2026-01-02\ncategories: [Media]\npermalink: /moved\n---\nBody\n", encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_check_reports_diffs_without_writing(self) -> None:
+        before = {path: path.read_bytes() for path in self.posts.iterdir()}
+
+        results = {Path(r["path"]).name: r for r in migrate_posts(self.posts, write=False, workers=1)}
+
+        self.assertEqual(results[self.current.name]["status"], "unchanged")
+        self.assertEqual(results[self.old.name]["status"], "changed")
+        self.assertIn("+categories: [Community]", results[self.old.name]["diff"])
+        self.assertEqual(results[self.custom.name]["status"], "skipped")
+        self.assertIn("sitemap", results[self.custom.name]["reason"])
+        self.assertIn("would change the URL", results[self.moved.name]["reason"])
+        self.assertEqual({path: path.read_bytes() for path in self.posts.iterdir()}, before)
+
+    def test_rewrites_only_changed_posts_and_preserves_values(self) -> None:
+        current_mtime = self.current.stat().st_mtime_ns
+
+        migrate_posts(self.posts, write=True, workers=1)
+
+        self.assertEqual(self.current.stat().st_mtime_ns, current_mtime)
+        post = PostFile(self.old)
+        self.assertEqual(post.read_body(), BODY)
+        self.assertEqual(post.get("date"), "2026-02-01 09:30:00 +0000")
+        self.assertEqual((post.get("title"), post.get("tags"), post.get("permalink")), ("Old format", ["hope", "ghana"], "/old-format/"))
+        self.assertTrue(self.old.read_text(encoding="utf-8").startswith('---\nlayout: post\ntitle: "Old format"\n'))
+        self.assertEqual([r["status"] for r in migrate_posts(self.posts, write=True, workers=1)].count("changed"), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
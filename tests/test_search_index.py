@@ -0,0 +1,84 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from scripts.build_search_index import build_index, load_manifest, stale_files, write_index
+from scripts.post_index import PostIndex
+from scripts.text_analysis import stem, terms
+
+
+class TextAnalysisTests(unittest.TestCase):
+    def test_terms_fold_accents_drop_stopwords_and_stem(self) -> None:
+        self.assertEqual(terms("The Families are Supporting a Café"), ["family", "support", "cafe"])
+        self.assertEqual(stem("signs"), "sign")
+        self.assertEqual(stem("is"), "is")
+
+
+class SearchIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.posts_dir = root / "_posts"
+        self.posts_dir.mkdir()
+        (self.posts_dir / "2026-01-05-early-signs.md").write_text(
+            '---\ntitle: "Early Signs"\ndate: 2026-01-05\ncategories: [Awareness]\n---\nWarning signs matter.\n',
+            encoding="utf-8",
+        )
+        (self.posts_dir / "2026-01-12-support.md").write_text(
+            '---\ntitle: "Support"\ndate: 2026-01-12\npermalink: /support/\n---\nTransport support for families.\n',
+            encoding="utf-8",
+        )
+        self.posts = PostIndex.load(self.posts_dir, root / "index.json").posts()
+        self.output_dir = root / "search"
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_postings_are_sharded_by_prefix_and_weight_titles(self) -> None:
+        manifest, shards = build_index(self.posts)
+
+        self.assertEqual(manifest["doc_count"], 2)
+        self.assertEqual(manifest["docs"][1], ["Support", "/support/", "2026-01-12"])
+        self.assertEqual(manifest["docs"][0][1], "/awareness/2026/01/05/early-signs.html")
+        self.assertEqual(shards["si"]["sign"], [0, 4])
+        self.assertEqual(shards["su"]["support"], [1, 4])
+        self.assertEqual(manifest["shards"], sorted(shards))
+
+    def test_write_index_only_touches_changed_shards(self) -> None:
+        manifest, shards = build_index(self.posts)
+        first = write_index(manifest, shards, self.output_dir)
+        second = write_index(manifest, shards, self.output_dir)
+
+        self.assertEqual(first["written"], len(shards))
+        self.assertEqual(second, {"written": 0, "unchanged": len(shards), "removed": 0})
+
+        self.assertEqual(stale_files(manifest, shards, self.output_dir), [])
+        del shards["tr"]
+        self.assertEqual(stale_files(manifest, shards, self.output_dir), [self.output_dir / "shards" / "tr.json"])
+        self.assertEqual(write_index(manifest, shards, self.output_dir)["removed"], 1)
+        loaded = json.loads((self.output_dir / "manifest.json").read_text(encoding="utf-8"))
+        self.assertEqual(loaded["doc_count"], 2)
+
+    def test_doc_ids_are_stable_so_a_new_post_only_touches_its_shards(self) -> None:
+        manifest, shards = build_index(self.posts)
+        write_index(manifest, shards, self.output_dir)
+        (self.posts_dir / "2026-01-19-zinc.md").write_text(
+            '---\ntitle: "Zinc"\ndate: 2026-01-19\n---\nZinc.\n', encoding="utf-8"
+        )
+        (self.posts_dir / "2026-01-05-early-signs.md").unlink()
+        posts = PostIndex.load(self.posts_dir, Path(self.tmp.name) / "index.json").posts()
+
+        manifest, shards = build_index(posts, previous=load_manifest(self.output_dir))
+        stats = write_index(manifest, shards, self.output_dir)
+
+        names = [Path(key).name if key else None for key in manifest["paths"]]
+        self.assertEqual(names, [None, "2026-01-12-support.md", "2026-01-19-zinc.md"])
+        self.assertEqual((manifest["docs"][0], manifest["doc_count"]), (None, 2))
+        self.assertEqual(shards["su"]["support"], [1, 4])
+        self.assertEqual(shards["zi"]["zinc"], [2, 4])
+        self.assertEqual((stats["written"], stats["removed"]), (1, 4))  # zi written; ea, ma, si, wa gone
+
+
+if __name__ == "__main__":
+    unittest.main()
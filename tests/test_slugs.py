@@ -0,0 +1,42 @@
+import unittest
+
+from scripts.slugs import MAX_LENGTH, SlugRegistry, slugify
+
+
+class SlugifyTests(unittest.TestCase):
+    def test_ascii_titles_keep_their_existing_slugs(self) -> None:
+        self.assertEqual(
+            slugify("Survivor Follow-Up: Life After Childhood Cancer Treatment"),
+            "survivor-follow-up-life-after-childhood-cancer-treatment",
+        )
+        self.assertEqual(slugify("  Hope -- & Care  "), "hope-care")
+        self.assertEqual(slugify("!!!"), "post")
+
+    def test_accented_and_west_african_letters_are_transliterated(self) -> None:
+        self.assertEqual(slugify("Café Crème"), "cafe-creme")
+        self.assertEqual(slugify("Akwaaba — Wo ho te sɛn?"), "akwaaba-wo-ho-te-sen")
+        self.assertEqual(slugify("Ɔdɔ ne Ŋkɔsoɔ"), "odo-ne-ngkosoo")
+
+
+class SlugRegistryTests(unittest.TestCase):
+    def test_collisions_get_deterministic_suffixes(self) -> None:
+        registry = SlugRegistry({"early-signs", "early-signs-2"})
+
+        self.assertEqual(
+            registry.allocate(["Early Signs", "Early signs!", "Transport"]),
+            ["early-signs-3", "early-signs-4", "transport"],
+        )
+        registry.release("transport")
+        self.assertEqual(registry.claim("transport"), "transport")
+
+    def test_suffixed_slugs_stay_within_the_length_limit(self) -> None:
+        long_slug = slugify("word " * 40)
+        registry = SlugRegistry({long_slug})
+
+        claimed = registry.claim(long_slug)
+        self.assertTrue(claimed.endswith("-2"))
+        self.assertLessEqual(len(claimed), MAX_LENGTH)
+
+
+if __name__ == "__main__":
+    unittest.main()
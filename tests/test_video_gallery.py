@@ -0,0 +1,48 @@
+import unittest
+
+from scripts.build_video_gallery import facade, paginate, render_gallery, validate_videos
+from scripts.front_matter import parse_yaml
+
+
+def video(video_id: str, title: str = "A video") -> dict:
+    return {"id": video_id, "title": title, "description": "About it"}
+
+
+class VideoGalleryTests(unittest.TestCase):
+    def test_validation_reports_bad_ids_duplicates_and_missing_titles(self) -> None:
+        errors = validate_videos(
+            [video("fF6YiDZBAz0"), video("fF6YiDZBAz0"), video("short"), {"id": "RN3w3uYlGWI", "title": " ", "url": "x"}]
+        )
+
+        self.assertEqual(
+            errors,
+            [
+                "video 2: id fF6YiDZBAz0 repeats video 1",
+                "video 3: id 'short' is not an 11-character YouTube video id",
+                "video 4: missing title",
+                "video 4: unknown fields url",
+            ],
+        )
+        self.assertEqual(validate_videos([video("X8QNizm_6eg")]), [])
+
+    def test_facade_derives_thumbnails_and_a_click_to_load_embed(self) -> None:
+        data = facade(video("X8QNizm_6eg"))
+
+        self.assertEqual(data["thumbnail"], "https://i.ytimg.com/vi/X8QNizm_6eg/hqdefault.jpg")
+        self.assertIn("mqdefault.jpg 320w", data["thumbnail_srcset"])
+        self.assertEqual(data["embed_url"], "https://www.youtube-nocookie.com/embed/X8QNizm_6eg?autoplay=1")
+
+    def test_gallery_is_split_into_fixed_size_pages(self) -> None:
+        videos = [video(f"video{n:06d}", f'Title "{n}"') for n in range(5)]
+        self.assertEqual([len(page) for page in paginate(videos, 2)], [2, 2, 1])
+
+        data = parse_yaml(render_gallery(videos, 2).splitlines())
+
+        self.assertEqual((data["total"], data["page_size"], data["page_count"]), ("5", "2", "3"))
+        self.assertEqual([page["number"] for page in data["pages"]], ["1", "2", "3"])
+        self.assertEqual(data["pages"][2]["videos"][0]["title"], 'Title "4"')
+        self.assertEqual(parse_yaml(render_gallery([]).splitlines())["pages"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
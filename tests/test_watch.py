@@ -0,0 +1,76 @@
+import json
+import sys
+import tempfile
+import time
+import unittest
+from contextlib import chdir
+from pathlib import Path
+
+from scripts.metrics import METRICS
+from scripts.watch import InotifyWatcher, PollingWatcher, WatchSession, collect
+
+POST = "---\ntitle: {title}\ndate: 2026-01-05\ntags: [hope]\n---\n{body}\n"
+
+
+class WatchSessionTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        (self.root / "_posts").mkdir()
+        (self.root / "_data").mkdir()
+        for slug, body in (("a", "family support hospital"), ("b", "family support volunteers"), ("c", "awareness walk")):
+            (self.root / "_posts" / f"2026-01-05-{slug}.md").write_text(POST.format(title=slug, body=body), encoding="utf-8")
+
+    def tearDown(self) -> None:
+        self.tmp.cleanup()
+
+    def test_edit_reparses_only_the_changed_post(self) -> None:
+        with chdir(self.root):
+            session = WatchSession()
+            session.rebuild_posts()
+            METRICS.reset()
+            post = Path("_posts/2026-01-05-c.md")
+            post.write_text(POST.format(title="c", body="family support ward visit"), encoding="utf-8")
+
+            messages = session.apply({post, Path("_data/related.yml")})
+
+            self.assertEqual(METRICS.snapshot()["counters"]["posts_parsed"], 1)
+            self.assertIn("1 post(s) changed: 2026-01-05-c.md", messages)
+            manifest = json.loads(Path("assets/search/manifest.json").read_text(encoding="utf-8"))
+            self.assertEqual(manifest["doc_count"], 3)
+            self.assertIn("ward", json.loads(Path("assets/search/shards/wa.json").read_text(encoding="utf-8")))
+            self.assertTrue(Path("_data/related.yml").is_file())
+
+            post.unlink()
+            session.apply({post})
+            manifest = json.loads(Path("assets/search/manifest.json").read_text(encoding="utf-8"))
+            self.assertEqual(manifest["doc_count"], 2)
+            self.assertEqual(session.apply({Path("_data/related.yml")}), [])
+
+
+class WatcherTests(unittest.TestCase):
+    def check_watcher(self, make_watcher) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            directory = Path(tmp)
+            watcher = make_watcher((directory,))
+            try:
+                for name in ("a.md", "b.md", ".a.md.swp", "c.md.tmp"):
+                    (directory / name).write_text("x", encoding="utf-8")
+                time.sleep(0.05)
+                (directory / "a.md").write_text("changed", encoding="utf-8")
+
+                self.assertEqual(collect(watcher, debounce=0.1, timeout=1.0), {directory / "a.md", directory / "b.md"})
+                self.assertEqual(collect(watcher, debounce=0.1, timeout=0.1), set())
+            finally:
+                watcher.close()
+
+    def test_polling_watcher_coalesces_changes(self) -> None:
+        self.check_watcher(lambda dirs: PollingWatcher(dirs, interval=0.02))
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "inotify is Linux-only")
+    def test_inotify_watcher_coalesces_changes(self) -> None:
+        self.check_watcher(InotifyWatcher)
+
+
+if __name__ == "__main__":
+    unittest.main()